@@ -0,0 +1,46 @@
+"""
+vector 중복 제거 엔진 보정
+
+합성 텍스트 쌍의 SequenceMatcher 유사도와 문자 n-gram 코사인 유사도를 비교해
+임계값별 코사인 하한(src.utils.vector_similarity.CALIBRATED_LOWER_BOUNDS)을 측정합니다.
+NGRAM이나 DIMENSIONS를 바꾸면 다시 실행해 표를 갱신하세요.
+
+사용 예:
+    python -m benchmarks.calibrate_similarity
+    python -m benchmarks.calibrate_similarity --pairs 20000 --thresholds 0.6,0.7
+"""
+import argparse
+import sys
+from difflib import SequenceMatcher
+from typing import List, Optional
+from src.utils.vector_similarity import calibrate_lower_bound
+from benchmarks.corpus import make_similarity_pairs
+
+DEFAULT_THRESHOLDS = (0.5, 0.6, 0.7, 0.8, 0.9)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """보정 진입점"""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.calibrate_similarity', description='vector 엔진 보정')
+    parser.add_argument('--pairs', type=int, default=10000, help='참조 텍스트 쌍 개수')
+    parser.add_argument('--thresholds', default=','.join(map(str, DEFAULT_THRESHOLDS)), help='SequenceMatcher 임계값 (쉼표로 구분)')
+    parser.add_argument('--margin', type=float, default=0.1, help='하한에 둘 여유 비율')
+    parser.add_argument('--seed', type=int, default=7, help='난수 시드')
+    args = parser.parse_args(argv)
+
+    # 중복 제거와 같은 비교용 문자열 (소문자)
+    pairs = [(a.lower(), b.lower()) for a, b in make_similarity_pairs(args.pairs, seed=args.seed)]
+    scores = [SequenceMatcher(None, a, b).ratio() for a, b in pairs]
+
+    print(f"{'임계값':>6} {'코사인 하한':>10} {'후보 비율':>9} {'단독 판단 최적값':>14} {'일치율':>7}")
+    for threshold in (float(t) for t in args.thresholds.split(',') if t.strip()):
+        result = calibrate_lower_bound(pairs, scores, threshold, args.margin)
+        print(
+            f"{threshold:>9.2f} {result['lower_bound']:>14.3f} {result['candidate_rate']:>12.3f}"
+            f" {result['best_threshold']:>21.3f} {result['best_agreement']:>10.3f}"
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""벤치마크용 합성 한국어 뉴스 데이터 및 HTML 픽스처"""
+import os
+import random
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+from src.utils.news_item import NewsItem
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+# 픽스처 파일 -> 추출 규칙 선택에 사용할 URL
+HTML_FIXTURES = {
+    'naver_article.html': 'https://n.news.naver.com/mnews/article/001/0014000001',
+    'generic_article.html': 'https://www.example-news.co.kr/article/1001',
+    'div_content.html': 'https://biz.example-daily.com/view/2002',
+    'table_layout.html': 'https://old.example-press.kr/news.php?id=3003',
+}
+
+_SUBJECTS = [
+    '정부', '한국은행', '금융위원회', '삼성전자', 'SK하이닉스', '현대차', '서울시', '국회',
+    '기획재정부', '코스피', '반도체 업계', '부동산 시장', '수출', '물가', '고용', '네이버', '카카오'
+]
+_TOPICS = [
+    '기준금리', '예산안', '실적', '수출 규제', '투자 계획', '신제품', '구조조정', '임금 협상',
+    '전세 대책', '인공지능 전략', '배터리 공급', '환율', '가계부채', '청년 일자리', '탄소 중립'
+]
+_PREDICATES = [
+    '동결 결정', '발표', '확정', '전격 합의', '대폭 확대', '하반기 추진', '사상 최대', '3개월 연속 증가',
+    '우려 확산', '재검토 착수', '전년 대비 감소', '공식 부인', '새 국면'
+]
+_CLAUSES = [
+    '관계자는 이날 기자회견에서 밝혔다', '시장에서는 예상보다 빠른 조치라는 평가가 나온다',
+    '전문가들은 하반기 경기 흐름을 주시해야 한다고 지적했다', '업계는 이번 결정의 영향을 분석하고 있다',
+    '세부 내용은 다음 달 발표될 예정이다', '야당은 즉각 반발하며 재검토를 요구했다',
+    '투자자들의 관심이 집중되고 있다', '당국은 추가 대책을 검토 중이라고 설명했다'
+]
+_PREFIXES = ['[속보]', '[단독]', '[종합]', '[2보]', '']
+_OUTLETS = [f'news{i}.co.kr' for i in range(40)]
+
+
+# 뉴스 기사에 자주 쓰이는 음절 (임의 단어 생성용)
+_SYLLABLES = (
+    '가각간갈감강개거건검게격결경계고공과관광교구국군권규그근글금기김나남내년노누는다단달담당대더도독동두드등라'
+    '락란람량러려력련령로록론료루류률리림마만말망매면명모목무문물미민바박반발방배백범법변별병보복본부북분불비사'
+    '산상새생서석선설성세소속손송수순술시식신실심아안알애야약양어언업여역연열영예오온완왕외요용우운원위유육윤은'
+    '음의이인일임입자작장재저적전절점정제조종주준중증지직진질차참창채책처천철청체초총최추축출충취치카타탁태택토통'
+    '투특파판패편평포표품프피하학한할함합항해행향허현협형호화확환활황회효후훈희'
+)
+
+
+def _make_name(rng: random.Random) -> str:
+    """임의의 한글 단어 (2~3음절)"""
+    return ''.join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 3)))
+
+
+def _make_story(rng: random.Random) -> Tuple[str, str]:
+    """
+    원본 기사 제목/설명 생성
+
+    서로 다른 기사끼리는 유사도가 임계값보다 충분히 낮도록 고유명사와 수치의 비중을 높게 둡니다.
+    """
+    names = [_make_name(rng) for _ in range(4)]
+    title = f"{names[0]} {_make_name(rng)} {rng.choice(_TOPICS)} {names[1]} {_make_name(rng)}"
+    description = ' '.join(
+        f"{rng.choice(names)} {_make_name(rng)} {_make_name(rng)} {rng.randint(1, 999)} "
+        f"{rng.choice(names)} {_make_name(rng)} {_make_name(rng)}."
+        for _ in range(4)
+    )
+    return title, description
+
+
+def _syndicate(rng: random.Random, title: str, description: str) -> Tuple[str, str]:
+    """같은 기사를 다른 언론사가 조금 바꿔 보도한 것처럼 변형"""
+    words = title.split()
+    if len(words) > 2 and rng.random() < 0.5:
+        words[rng.randrange(1, len(words))] = rng.choice(_PREDICATES).split()[0]
+    title = f"{rng.choice(_PREFIXES)} {' '.join(words)}".strip()
+
+    sentences = description.split('. ')
+    if rng.random() < 0.5:
+        sentences[-1] = rng.choice(_CLAUSES) + '.'
+    return title, '. '.join(sentences)
+
+
+def _mutate(rng: random.Random, text: str, edit_rate: float) -> str:
+    """단어 단위 삭제/교체/삽입과 어순 변경으로 문장 변형"""
+    words = []
+    for word in text.split():
+        r = rng.random()
+        if r < edit_rate / 3:
+            continue
+        if r < edit_rate * 2 / 3:
+            words.append(_make_name(rng))
+        elif r < edit_rate:
+            words.extend([word, _make_name(rng)])
+        else:
+            words.append(word)
+
+    # 일부는 앞뒤 구절 순서를 바꿈 (문자 n-gram은 거의 그대로지만 SequenceMatcher 점수는 크게 낮아짐)
+    if len(words) > 2 and rng.random() < 0.3:
+        cut = rng.randrange(1, len(words))
+        words = words[cut:] + words[:cut]
+    return ' '.join(words)
+
+
+def make_similarity_pairs(count: int, max_edit_rate: float = 0.8, seed: int = 7) -> List[Tuple[str, str]]:
+    """
+    유사도 엔진 보정용 텍스트 쌍 생성
+
+    원본 제목/설명과 이를 0 ~ max_edit_rate 비율로 변형한 텍스트의 쌍으로,
+    SequenceMatcher 유사도가 0.3 ~ 1.0 구간에 고르게 분포합니다.
+
+    Args:
+        count: 쌍 개수
+        max_edit_rate: 최대 단어 변형 비율
+        seed: 난수 시드
+
+    Returns:
+        (원본, 변형) 텍스트 튜플 리스트
+    """
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(count):
+        title, description = _make_story(rng)
+        text = title if rng.random() < 0.5 else description
+        pairs.append((text, _mutate(rng, text, rng.uniform(0, max_edit_rate))))
+    return pairs
+
+
+def make_news_corpus(size: int, duplicate_rate: float = 0.3, seed: int = 42) -> List[NewsItem]:
+    """
+    포맷팅이 끝난 형태의 합성 뉴스 리스트 생성
+
+    Args:
+        size: 뉴스 개수
+        duplicate_rate: 앞서 생성된 기사를 변형한 중복 보도의 비율 (0.0 ~ 1.0)
+        seed: 난수 시드 (같은 인자면 같은 결과)
+
+    Returns:
+        format_news_item 형식의 뉴스 리스트
+    """
+    rng = random.Random(seed)
+    base_time = datetime(2024, 5, 1, 9, 0, tzinfo=timezone(timedelta(hours=9)))
+    stories: List[Tuple[str, str]] = []
+    news_list = []
+
+    for i in range(size):
+        if stories and rng.random() < duplicate_rate:
+            title, description = _syndicate(rng, *rng.choice(stories))
+        else:
+            title, description = _make_story(rng)
+            stories.append((title, description))
+
+        outlet = rng.choice(_OUTLETS)
+        news_list.append(NewsItem(
+            title=title,
+            description=description,
+            link=f'https://n.news.naver.com/mnews/article/{i % 900:03d}/{i:010d}',
+            originallink=f'https://www.{outlet}/article/{i}?utm_source=naver',
+            pubDate=format_datetime(base_time - timedelta(minutes=rng.randrange(60 * 24 * 7)))
+        ))
+
+    return news_list
+
+
+def make_api_items(size: int, duplicate_rate: float = 0.3, seed: int = 42) -> List[Dict]:
+    """
+    네이버 검색 API 응답 형태(HTML 태그, 엔티티 포함)의 합성 뉴스 항목 생성
+
+    Args:
+        size: 항목 개수
+        duplicate_rate: 중복 보도 비율
+        seed: 난수 시드
+
+    Returns:
+        API 응답 items 형식의 리스트
+    """
+    items = []
+    for news in make_news_corpus(size, duplicate_rate, seed):
+        subject = news['title'].split()[0]
+        items.append(dict(
+            news,
+            title=news['title'].replace(subject, f'<b>{subject}</b>', 1).replace('"', '&quot;'),
+            description=news['description'].replace(subject, f'<b>{subject}</b>', 1)
+        ))
+    return items
+
+
+def load_html_fixtures() -> List[Tuple[str, str, str]]:
+    """
+    저장된 기사 HTML 픽스처 로드
+
+    Returns:
+        (픽스처 이름, URL, HTML) 튜플 리스트
+    """
+    fixtures = []
+    for name, url in HTML_FIXTURES.items():
+        with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as f:
+            fixtures.append((name, url, f.read()))
+    return fixtures
@@ -0,0 +1,292 @@
+"""
+핫 패스 마이크로 벤치마크
+
+중복 제거, 포맷팅, 키워드 추출, HTML 본문 추출의 초당 실행 횟수(ops/sec)와
+1회 실행 시 최대 메모리 사용량을 측정하고 저장된 기준값과 비교합니다.
+(기준값은 측정한 머신에 따라 달라지므로 같은 환경에서 만든 값과 비교하세요)
+
+사용 예:
+    python -m benchmarks.run                         # 측정 후 기준값과 비교
+    python -m benchmarks.run --filter dedup --sizes 100,1000
+    python -m benchmarks.run --save-baseline         # 현재 결과를 기준값으로 저장
+    python -m benchmarks.run --check                 # 기준값보다 느려지면 종료 코드 1
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+from src.utils.crawler import NewsCrawler
+from src.utils.deduplicator import NewsDeduplicator, IncrementalDeduplicator
+from src.utils.formatter import format_news_list
+from src.services.summary_service import SummaryService
+from benchmarks.corpus import make_news_corpus, make_api_items, load_html_fixtures
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+DEFAULT_SIZES = (100, 1000, 10000)
+DUPLICATE_RATE = 0.3
+
+
+class Benchmark:
+    """벤치마크 케이스 하나 (크기별 입력 준비 함수 + 측정 대상 함수)"""
+
+    def __init__(
+        self,
+        name: str,
+        setup: Callable[[int], tuple],
+        func: Callable,
+        max_size: Optional[int] = None,
+        sized: bool = True
+    ):
+        """
+        Args:
+            name: 케이스 이름
+            setup: 크기를 받아 func에 넘길 인자 튜플을 만드는 함수
+            func: 측정 대상 함수
+            max_size: 이 크기보다 큰 입력은 건너뜀 (너무 느린 케이스 제한)
+            sized: False면 크기와 무관한 케이스 (한 번만 측정)
+        """
+        self.name = name
+        self.setup = setup
+        self.func = func
+        self.max_size = max_size
+        self.sized = sized
+
+
+def _extract_all(fixtures: List[Tuple[str, str, str]]) -> None:
+    """모든 픽스처에서 본문 추출 (규칙/휴리스틱 실패 시 body 추출까지 포함)"""
+    for _, url, html in fixtures:
+        text, _ = NewsCrawler.extract_content(html, url)
+        if not text:
+            NewsCrawler.extract_body_text(html)
+
+
+def _incremental_dedup(news_list: List[Dict], page_size: int = 100, engine: str = 'exact') -> List[Dict]:
+    """페이지 단위로 나눠 증분 중복 제거"""
+    deduplicator = IncrementalDeduplicator(engine=engine)
+    for start in range(0, len(news_list), page_size):
+        deduplicator.add_batch(news_list[start:start + page_size])
+    return deduplicator.unique_news
+
+
+def _corpus(size: int) -> tuple:
+    return (make_news_corpus(size, DUPLICATE_RATE),)
+
+
+# 중복 제거는 1회 실행에 수십 초 이상 걸리는 크기를 기본 측정에서 제외 (--no-size-limit로 포함)
+# (exact 엔진은 모든 쌍을 비교하므로 1k에서 수 분이 걸림)
+DEDUP_MAX_SIZE = 1000
+DEDUP_EXACT_MAX_SIZE = 100
+
+BENCHMARKS = [
+    Benchmark(
+        'dedup.remove_duplicates[exact]',
+        _corpus,
+        NewsDeduplicator.remove_duplicates,
+        max_size=DEDUP_EXACT_MAX_SIZE
+    ),
+    Benchmark(
+        'dedup.remove_duplicates[minhash]',
+        _corpus,
+        lambda news_list: NewsDeduplicator.remove_duplicates(news_list, engine='minhash'),
+        max_size=DEDUP_MAX_SIZE
+    ),
+    Benchmark(
+        'dedup.remove_duplicates[vector]',
+        _corpus,
+        lambda news_list: NewsDeduplicator.remove_duplicates(news_list, engine='vector'),
+        max_size=DEDUP_MAX_SIZE
+    ),
+    Benchmark('dedup.incremental[exact]', _corpus, _incremental_dedup, max_size=DEDUP_MAX_SIZE),
+    Benchmark(
+        'dedup.incremental[vector]',
+        _corpus,
+        lambda news_list: _incremental_dedup(news_list, engine='vector'),
+        max_size=DEDUP_MAX_SIZE
+    ),
+    Benchmark('formatter.format_news_list', lambda size: (make_api_items(size, DUPLICATE_RATE),), format_news_list),
+    Benchmark('summary.get_keywords_from_titles', _corpus, SummaryService.get_keywords_from_titles),
+    Benchmark('summary.create_summary_list', _corpus, SummaryService.create_summary_list),
+    Benchmark('crawler.extract_content[fixtures]', lambda size: (load_html_fixtures(),), _extract_all, sized=False),
+]
+
+
+def measure(func: Callable, args: tuple, min_time: float, memory: bool = True) -> Dict:
+    """
+    함수 실행 속도와 최대 메모리 측정
+
+    min_time 초 이상 반복 실행해 초당 실행 횟수를 구하고,
+    tracemalloc은 실행 속도에 영향을 주므로 별도의 1회 실행으로 메모리를 측정합니다.
+
+    Args:
+        func: 측정 대상 함수
+        args: 함수 인자
+        min_time: 최소 측정 시간 (초)
+        memory: False면 메모리 측정 생략
+
+    Returns:
+        {'ops_per_sec', 'mean_ms', 'iterations', 'peak_kb'} 딕셔너리
+    """
+    # 워밍업 (지연 초기화, 캐시 등) - 1회에 min_time 이상 걸리면 이 실행을 측정값으로 사용
+    started = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - started
+    iterations = 1
+
+    if elapsed < min_time:
+        iterations = 0
+        started = time.perf_counter()
+        while True:
+            func(*args)
+            iterations += 1
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_time:
+                break
+
+    peak = 0
+    if memory:
+        tracemalloc.start()
+        try:
+            func(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        'ops_per_sec': round(iterations / elapsed, 3),
+        'mean_ms': round(elapsed / iterations * 1000, 3),
+        'iterations': iterations,
+        'peak_kb': round(peak / 1024, 1) if memory else None
+    }
+
+
+def run(
+    sizes: List[int],
+    name_filter: Optional[str],
+    min_time: float,
+    size_limit: bool = True,
+    memory: bool = True
+) -> Dict[str, Dict]:
+    """
+    벤치마크 실행
+
+    Args:
+        sizes: 입력 크기 리스트
+        name_filter: 이름에 이 문자열이 포함된 케이스만 실행
+        min_time: 케이스별 최소 측정 시간 (초)
+        size_limit: False면 케이스별 max_size 제한 무시
+        memory: False면 메모리 측정 생략
+
+    Returns:
+        {'케이스 이름@크기': 측정 결과} 딕셔너리
+    """
+    results = {}
+    for bench in BENCHMARKS:
+        if name_filter and name_filter not in bench.name:
+            continue
+
+        for size in (sizes if bench.sized else [None]):
+            if size_limit and size is not None and bench.max_size is not None and size > bench.max_size:
+                continue
+
+            key = f"{bench.name}@{size}" if size is not None else bench.name
+            result = measure(bench.func, bench.setup(size), min_time, memory)
+            results[key] = result
+            print(
+                f"{key:<48} {result['ops_per_sec']:>12,.2f} ops/s "
+                f"{result['mean_ms']:>12,.3f} ms {result['peak_kb'] or 0:>12,.1f} KB",
+                file=sys.stderr
+            )
+    return results
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> List[str]:
+    """
+    기준값과 비교한 결과 출력
+
+    Args:
+        results: 이번 측정 결과
+        baseline: 저장된 기준값
+        tolerance: 허용할 속도 저하 비율 (0.2면 20%)
+
+    Returns:
+        허용 범위를 넘어 느려진 케이스 이름 리스트
+    """
+    regressions = []
+    print(f"\n{'benchmark':<48} {'ops/s':>10} {'vs base':>9} {'peak KB':>10} {'vs base':>9}")
+    for key, result in results.items():
+        base = baseline.get(key)
+        if not base:
+            print(f"{key:<48} {result['ops_per_sec']:>10,.2f} {'(new)':>9} {result['peak_kb'] or 0:>10,.1f}")
+            continue
+
+        speed = result['ops_per_sec'] / base['ops_per_sec'] if base['ops_per_sec'] else 0.0
+        memory = result['peak_kb'] / base['peak_kb'] if result['peak_kb'] and base['peak_kb'] else 0.0
+        flag = ''
+        if speed < 1 - tolerance:
+            flag = '  << 느려짐'
+            regressions.append(key)
+        print(
+            f"{key:<48} {result['ops_per_sec']:>10,.2f} {speed:>8.2f}x "
+            f"{result['peak_kb'] or 0:>10,.1f} {memory:>8.2f}x{flag}"
+        )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    벤치마크 진입점
+
+    Returns:
+        종료 코드 (--check에서 느려진 케이스가 있으면 1)
+    """
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run', description='핫 패스 마이크로 벤치마크')
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)), help='입력 크기 (쉼표로 구분)')
+    parser.add_argument('--filter', help='이름에 이 문자열이 포함된 케이스만 실행')
+    parser.add_argument('--min-time', type=float, default=1.0, help='케이스별 최소 측정 시간 (초)')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='기준값 JSON 파일')
+    parser.add_argument('--save-baseline', action='store_true', help='측정 결과를 기준값으로 저장')
+    parser.add_argument('--check', action='store_true', help='기준값보다 느려진 케이스가 있으면 실패')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용할 속도 저하 비율 (기본값: 0.2)')
+    parser.add_argument('--no-size-limit', action='store_true', help='느린 케이스의 최대 크기 제한 해제')
+    parser.add_argument('--no-memory', action='store_true', help='메모리 측정 생략')
+    parser.add_argument('--json', action='store_true', help='측정 결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    results = run(sizes, args.filter, args.min_time, not args.no_size_limit, not args.no_memory)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding='utf-8') as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"기준값 저장: {args.baseline}", file=sys.stderr)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("저장된 기준값이 없습니다. --save-baseline으로 먼저 저장하세요.", file=sys.stderr)
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions and args.check:
+        print(f"\n느려진 케이스 {len(regressions)}개: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
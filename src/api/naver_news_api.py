@@ -1,7 +1,18 @@
 """네이버 뉴스 검색 API 연동 모듈"""
+import time
 import requests
 from typing import Dict, List, Optional
-from src.utils.config import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET
+from src.utils import config
+from src.utils.config import (
+    NAVER_CACHE_TTL_DATE, NAVER_CACHE_TTL_SIM, NAVER_CACHE_STALE_TTL, NAVER_CACHE_MAX_ENTRIES,
+    RATE_LIMIT_MAX_RETRIES
+)
+from src.utils.http_client import get_session
+from src.utils.metrics import METRICS, get_logger
+from src.utils.rate_limiter import RateLimiter, RateLimitExceeded, QuotaExceeded, parse_retry_after
+from src.utils.response_cache import ResponseCache
+
+logger = get_logger('naver')
 
 
 class NaverNewsAPI:
@@ -9,9 +20,29 @@ class NaverNewsAPI:
 
     BASE_URL = "https://openapi.naver.com/v1/search/news.json"
 
+    # 일일 호출 한도 초과 시 응답의 errorCode
+    QUOTA_ERROR_CODE = "010"
+
+    # 잠시 후 다시 요청하면 성공할 수 있는 서버 오류
+    RETRYABLE_STATUS = (500, 502, 503, 504)
+
+    # 모든 세션이 공유하는 검색 응답 캐시
+    response_cache = ResponseCache(
+        max_entries=NAVER_CACHE_MAX_ENTRIES,
+        stale_ttl=NAVER_CACHE_STALE_TTL,
+        name='naver'
+    )
+
+    # 정렬 방식별 캐시 TTL (날짜순은 새 기사가 자주 추가되므로 짧게)
+    CACHE_TTL = {
+        'date': NAVER_CACHE_TTL_DATE,
+        'sim': NAVER_CACHE_TTL_SIM
+    }
+
     def __init__(self):
-        self.client_id = NAVER_CLIENT_ID
-        self.client_secret = NAVER_CLIENT_SECRET
+        # 인증 정보는 생성 시점의 값 사용 (config.reload_credentials 후에는 새로 생성)
+        self.client_id = config.NAVER_CLIENT_ID
+        self.client_secret = config.NAVER_CLIENT_SECRET
         self.headers = {
             "X-Naver-Client-Id": self.client_id,
             "X-Naver-Client-Secret": self.client_secret
@@ -22,7 +53,8 @@ class NaverNewsAPI:
         query: str,
         display: int = 10,
         start: int = 1,
-        sort: str = "date"
+        sort: str = "date",
+        use_cache: bool = True
     ) -> Dict:
         """
         뉴스 검색
@@ -32,9 +64,10 @@ class NaverNewsAPI:
             display: 한 번에 표시할 검색 결과 개수 (10~100, 기본값: 10)
             start: 검색 시작 위치 (1~1000, 기본값: 1)
             sort: 정렬 방식 (date: 날짜순, sim: 정확도순, 기본값: date)
+            use_cache: 응답 캐시 사용 여부
 
         Returns:
-            검색 결과 딕셔너리
+            검색 결과 딕셔너리 (캐시된 경우 여러 호출자가 공유하므로 수정하지 말 것)
         """
         params = {
             "query": query,
@@ -43,18 +76,100 @@ class NaverNewsAPI:
             "sort": sort
         }
 
+        if not use_cache:
+            return self._request(params)
+
+        return self.response_cache.get_or_load(
+            (query, display, start, sort),
+            lambda: self._request(params),
+            self.CACHE_TTL.get(sort, NAVER_CACHE_TTL_DATE)
+        )
+
+    def _request(self, params: Dict) -> Dict:
+        """
+        검색 API 호출
+
+        공유 속도 제한기로 초당 호출 수와 일일 할당량을 지키고,
+        429 응답을 받으면 Retry-After(없으면 적응형 백오프)만큼 모든 세션의 호출을 멈춘 뒤 재시도합니다.
+        5xx 응답도 지수 백오프 후 재시도하며, 재시도할 때마다 속도 제한기에서 호출을 확보하므로
+        초당 호출 수와 일일 할당량에 함께 계산됩니다.
+
+        Args:
+            params: 요청 파라미터
+
+        Returns:
+            검색 결과 딕셔너리
+        """
+        limiter = RateLimiter.get_instance()
+
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            try:
+                if limiter:
+                    limiter.acquire('naver')
+
+                with METRICS.span('naver_fetch', sort=params.get('sort')) as span:
+                    response = get_session('naver').get(
+                        self.BASE_URL,
+                        headers=self.headers,
+                        params=params,
+                        timeout=10
+                    )
+                    span['status'] = response.status_code
+
+                if response.status_code == 429:
+                    if self._error_code(response) == self.QUOTA_ERROR_CODE:
+                        if limiter:
+                            limiter.exhaust_quota('naver')
+                        raise QuotaExceeded("일일 호출 한도 초과")
+
+                    if attempt < RATE_LIMIT_MAX_RETRIES:
+                        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                        if limiter:
+                            delay = limiter.penalize('naver', retry_after)
+                        else:
+                            delay = retry_after if retry_after is not None else 2 ** attempt
+                            time.sleep(delay)
+                        METRICS.incr('retries', stage='naver_fetch')
+                        logger.warning(f"네이버 API 호출 제한 (429), {delay:.1f}초 후 재시도 {attempt + 1}/{RATE_LIMIT_MAX_RETRIES}")
+                        continue
+
+                if response.status_code in self.RETRYABLE_STATUS and attempt < RATE_LIMIT_MAX_RETRIES:
+                    delay = 2 ** attempt * 0.5
+                    time.sleep(delay)
+                    METRICS.incr('retries', stage='naver_fetch')
+                    logger.warning(f"네이버 API 서버 오류 ({response.status_code}), {delay:.1f}초 후 재시도 {attempt + 1}/{RATE_LIMIT_MAX_RETRIES}")
+                    continue
+
+                response.raise_for_status()
+                if limiter:
+                    limiter.reward('naver')
+                return response.json()
+
+            except RateLimitExceeded as e:
+                METRICS.incr('failures', stage='naver_fetch', reason=type(e).__name__)
+                raise Exception(f"네이버 뉴스 API 요청 실패: {str(e)}")
+            except requests.exceptions.RequestException as e:
+                METRICS.incr('failures', stage='naver_fetch', reason=type(e).__name__)
+                raise Exception(f"네이버 뉴스 API 요청 실패: {str(e)}")
+
+    @staticmethod
+    def _error_code(response: requests.Response) -> Optional[str]:
+        """오류 응답 본문의 errorCode"""
         try:
-            response = requests.get(
-                self.BASE_URL,
-                headers=self.headers,
-                params=params,
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
-
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"네이버 뉴스 API 요청 실패: {str(e)}")
+            return response.json().get('errorCode')
+        except ValueError:
+            return None
+
+    @staticmethod
+    def remaining_quota() -> Optional[int]:
+        """
+        오늘 남은 검색 API 호출 수
+
+        Returns:
+            남은 호출 수 (속도 제한기를 사용하지 않거나 일일 한도가 없으면 None)
+        """
+        limiter = RateLimiter.get_instance()
+        return limiter.remaining_quota('naver') if limiter else None
 
     def get_news_items(self, query: str, count: int = 10) -> List[Dict]:
         """
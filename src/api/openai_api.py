@@ -1,14 +1,53 @@
 """OpenAI API 연동 모듈"""
+import json
+import time
+import openai
 from openai import OpenAI
-from typing import Optional
-from src.utils.config import OPENAI_API_KEY
+from typing import Iterator, List, Optional
+from src.utils import config
+from src.utils.config import RATE_LIMIT_MAX_RETRIES
+from src.utils.metrics import METRICS, get_logger
+from src.utils.rate_limiter import RateLimiter, parse_retry_after
+from src.utils.token_budget import estimate_tokens
+
+logger = get_logger('openai')
+
+
+KEY_POINTS_SYSTEM_PROMPT = """당신은 뉴스 기사를 분석하는 전문가입니다.
+다음 형식으로 응답해주세요:
+
+[요약]
+(3-5문장으로 핵심 내용 요약)
+
+[핵심 포인트]
+- (핵심 포인트 1)
+- (핵심 포인트 2)
+- (핵심 포인트 3)"""
 
 
 class OpenAIClient:
     """OpenAI API 클라이언트"""
 
+    # 프롬프트 템플릿 버전 (프롬프트를 바꾸면 올려서 요약 캐시를 무효화)
+    PROMPT_VERSION = "1"
+
+    # 요청 파라미터 (요약 캐시 키에도 포함됨)
+    TEXT_SUMMARY_PARAMS = {'temperature': 0.3, 'max_tokens': 500}
+    KEY_POINTS_PARAMS = {'temperature': 0.3, 'max_tokens': 800}
+    CHUNK_SUMMARY_PARAMS = {'temperature': 0.3, 'max_tokens': 400}
+    BATCH_SUMMARY_PARAMS = {'temperature': 0.3}
+    BATCH_MAX_TOKENS_PER_ARTICLE = 400
+
+    # 요청에 max_tokens가 없을 때 분당 토큰 한도에서 미리 확보할 응답 토큰 수
+    DEFAULT_COMPLETION_TOKENS = 500
+
+    # 재시도할 일시적 오류 (429는 공유 속도 제한기로 대기)
+    RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
     def __init__(self):
-        self.client = OpenAI(api_key=OPENAI_API_KEY)
+        # 재시도는 _create에서 공유 속도 제한기와 함께 처리 (SDK 자체 재시도와 중복되지 않도록 끔)
+        # API 키는 생성 시점의 값 사용 (config.reload_credentials 후에는 새로 생성)
+        self.client = OpenAI(api_key=config.OPENAI_API_KEY, max_retries=0)
         self.model = "gpt-4o-mini"  # 비용 효율적인 모델
 
     def summarize_text(
@@ -39,20 +78,20 @@ class OpenAIClient:
 
             user_prompt = f"다음 뉴스 기사를 요약해주세요:\n\n{text}"
 
-            response = self.client.chat.completions.create(
+            response = self._complete(
+                'text_summary',
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
-                temperature=0.3,
-                max_tokens=500
+                **self.TEXT_SUMMARY_PARAMS
             )
 
             return response.choices[0].message.content.strip()
 
         except Exception as e:
-            print(f"OpenAI API 오류: {str(e)}")
+            logger.error(f"OpenAI API 오류: {str(e)}")
             return None
 
     def summarize_with_key_points(self, text: str) -> Optional[dict]:
@@ -66,49 +105,336 @@ class OpenAIClient:
             요약과 핵심 포인트를 포함한 딕셔너리
         """
         try:
-            system_prompt = """당신은 뉴스 기사를 분석하는 전문가입니다.
-다음 형식으로 응답해주세요:
+            response = self._complete(
+                'key_points',
+                model=self.model,
+                messages=self._key_points_messages(text),
+                **self.KEY_POINTS_PARAMS
+            )
 
-[요약]
-(3-5문장으로 핵심 내용 요약)
+            content = response.choices[0].message.content.strip()
+            return self.parse_key_points(content)
 
-[핵심 포인트]
-- (핵심 포인트 1)
-- (핵심 포인트 2)
-- (핵심 포인트 3)"""
+        except Exception as e:
+            logger.error(f"OpenAI API 오류: {str(e)}")
+            return None
+
+    def stream_with_key_points(self, text: str) -> Iterator[str]:
+        """
+        요약 및 핵심 포인트를 스트리밍으로 생성
+
+        summarize_with_key_points와 같은 프롬프트를 사용하며, 생성되는 텍스트 조각을
+        도착하는 즉시 반환합니다. 전체 텍스트는 parse_key_points로 파싱할 수 있습니다.
+
+        Args:
+            text: 요약할 텍스트
+
+        Yields:
+            응답 텍스트 조각 (API 오류 시 예외 발생)
+        """
+        # 스트리밍 응답에는 보통 토큰 사용량이 포함되지 않으므로 소요 시간과 실패만 기록
+        messages = self._key_points_messages(text)
+        with METRICS.span('llm_call', op='key_points_stream') as span:
+            reserved = 0
+            parts: List[str] = []
+            usage = None
+            try:
+                stream, reserved = self._create(
+                    model=self.model,
+                    messages=messages,
+                    stream=True,
+                    **self.KEY_POINTS_PARAMS
+                )
+
+                for chunk in stream:
+                    usage = getattr(chunk, 'usage', None) or usage
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+                span['chunks'] = len(parts)
+            except Exception as e:
+                METRICS.incr('failures', stage='llm', reason=type(e).__name__)
+                raise
+            finally:
+                # 스트림이 끝나거나 중간에 닫히면 확보한 토큰을 실제 사용량으로 정산
+                # (사용량이 없으면 프롬프트 추정치 + 받은 응답의 추정치를 사용량으로 봄)
+                if reserved:
+                    if usage is not None:
+                        used = usage.total_tokens
+                    else:
+                        used = self._estimate_prompt_tokens(messages) + estimate_tokens(''.join(parts))
+                    self._settle_tokens(reserved, used)
+
+    def _complete(self, op: str, **kwargs):
+        """
+        Chat Completions 요청 (소요 시간, 토큰 사용량, 실패 계측 포함)
+
+        Args:
+            op: 계측에 사용할 요청 종류
+            **kwargs: chat.completions.create 인자
+
+        Returns:
+            API 응답 (오류 시 예외 발생)
+        """
+        with METRICS.span('llm_call', op=op) as span:
+            reserved = 0
+            used = None
+            try:
+                response, reserved = self._create(**kwargs)
+                usage = getattr(response, 'usage', None)
+                if usage is not None:
+                    used = usage.total_tokens
+                    span['prompt_tokens'] = usage.prompt_tokens
+                    span['completion_tokens'] = usage.completion_tokens
+                    METRICS.incr('llm_tokens', usage.prompt_tokens, op=op, kind='prompt')
+                    METRICS.incr('llm_tokens', usage.completion_tokens, op=op, kind='completion')
+                return response
+            except Exception as e:
+                METRICS.incr('failures', stage='llm', reason=type(e).__name__)
+                raise
+            finally:
+                # 확보한 토큰을 모두 반환하고 실제 사용량을 알면 그만큼 다시 차감
+                if reserved:
+                    self._settle_tokens(reserved, used)
+
+    @staticmethod
+    def _estimate_prompt_tokens(messages: List[dict]) -> int:
+        """요청 메시지의 추정 토큰 수"""
+        return sum(estimate_tokens(message['content']) for message in messages)
+
+    @staticmethod
+    def _release_tokens(amount: float) -> None:
+        """분당 토큰 한도에서 미리 확보했다가 쓰지 않은 토큰 반환"""
+        limiter = RateLimiter.get_instance()
+        if limiter:
+            limiter.release('openai_tokens', amount)
+
+    @staticmethod
+    def _settle_tokens(reserved: float, used: Optional[float]) -> None:
+        """미리 확보한 토큰을 반환하고 실제 사용량(알 수 없으면 None)만큼 분당 토큰 한도에서 차감"""
+        limiter = RateLimiter.get_instance()
+        if limiter:
+            limiter.release('openai_tokens', reserved)
+            if used:
+                limiter.charge('openai_tokens', used)
+
+    def _create(self, **kwargs):
+        """
+        분당 요청 수(RPM)/토큰 수(TPM) 한도를 지키며 Chat Completions 요청
+
+        요청 전에 공유 속도 제한기에서 요청 1건과 예상 토큰(프롬프트 추정치 + max_tokens)을 확보하고,
+        429 응답은 Retry-After(없으면 적응형 백오프)만큼 모든 세션의 요청을 멈춘 뒤 재시도합니다.
+
+        Args:
+            **kwargs: chat.completions.create 인자
+
+        Returns:
+            (API 응답, 확보한 토큰 수) 튜플 (오류 시 확보한 토큰을 모두 반환하고 예외 발생,
+            성공 시 쓰지 않은 토큰은 호출 측이 실제 사용량을 확인한 뒤 반환)
+        """
+        limiter = RateLimiter.get_instance()
+        reserved = 0
+        if limiter:
+            reserved = self._estimate_prompt_tokens(kwargs['messages'])
+            reserved += kwargs.get('max_tokens') or self.DEFAULT_COMPLETION_TOKENS
+            limiter.acquire('openai_tokens', reserved)
+
+        try:
+            return self._create_with_retry(limiter, **kwargs), reserved
+        except BaseException:
+            # 실패한 요청은 토큰을 쓰지 않은 것으로 보고 모두 반환
+            if reserved:
+                self._release_tokens(reserved)
+            raise
 
-            user_prompt = f"다음 뉴스 기사를 분석해주세요:\n\n{text}"
+    def _create_with_retry(self, limiter: Optional[RateLimiter], **kwargs):
+        """_create의 재시도 루프 (요청 슬롯 확보, 429/일시적 오류 재시도)"""
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            if limiter:
+                limiter.acquire('openai_requests')
+            try:
+                response = self.client.chat.completions.create(**kwargs)
+            except self.RETRYABLE_ERRORS as e:
+                # 결제 한도 초과(insufficient_quota)는 기다려도 풀리지 않음
+                if attempt >= RATE_LIMIT_MAX_RETRIES or getattr(e, 'code', None) == 'insufficient_quota':
+                    raise
 
-            response = self.client.chat.completions.create(
+                if isinstance(e, openai.RateLimitError):
+                    retry_after = parse_retry_after(e.response.headers.get('retry-after'))
+                    if limiter:
+                        delay = limiter.penalize('openai_requests', retry_after)
+                    else:
+                        delay = retry_after if retry_after is not None else 2 ** attempt
+                        time.sleep(delay)
+                else:
+                    delay = 2 ** attempt * 0.5
+                    time.sleep(delay)
+                METRICS.incr('retries', stage='llm')
+                logger.warning(f"OpenAI API 일시적 오류 ({type(e).__name__}), {delay:.1f}초 후 재시도 {attempt + 1}/{RATE_LIMIT_MAX_RETRIES}")
+                continue
+
+            if limiter:
+                limiter.reward('openai_requests')
+            return response
+
+    @staticmethod
+    def _key_points_messages(text: str) -> List[dict]:
+        """요약 및 핵심 포인트 요청 메시지"""
+        return [
+            {"role": "system", "content": KEY_POINTS_SYSTEM_PROMPT},
+            {"role": "user", "content": f"다음 뉴스 기사를 분석해주세요:\n\n{text}"}
+        ]
+
+    @staticmethod
+    def parse_key_points(content: str) -> dict:
+        """
+        [요약]/[핵심 포인트] 형식의 응답 파싱
+
+        Args:
+            content: 모델 응답 텍스트
+
+        Returns:
+            요약과 핵심 포인트를 포함한 딕셔너리
+        """
+        parts = content.split('[핵심 포인트]')
+        summary = parts[0].replace('[요약]', '').strip()
+        key_points = []
+
+        if len(parts) > 1:
+            points_text = parts[1].strip()
+            key_points = [
+                line.strip('- ').strip()
+                for line in points_text.split('\n')
+                if line.strip().startswith('-')
+            ]
+
+        return {
+            'summary': summary,
+            'key_points': key_points
+        }
+
+    def summarize_chunk(self, text: str, index: int, total: int) -> Optional[str]:
+        """
+        긴 기사의 일부 조각 요약 (map 단계)
+
+        Args:
+            text: 기사 조각
+            index: 조각 번호 (1부터 시작)
+            total: 전체 조각 수
+
+        Returns:
+            조각 요약 텍스트 (실패 시 None)
+        """
+        try:
+            system_prompt = """당신은 뉴스 기사를 분석하는 전문가입니다.
+긴 기사의 일부를 받게 됩니다. 이 부분에 담긴 사실, 수치, 인물, 주장만
+빠짐없이 간결한 문장으로 정리해주세요. 다른 부분의 내용을 추측하지 마세요."""
+
+            user_prompt = f"다음은 뉴스 기사의 {index}/{total} 부분입니다:\n\n{text}"
+
+            response = self._complete(
+                'chunk_summary',
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
-                temperature=0.3,
-                max_tokens=800
+                **self.CHUNK_SUMMARY_PARAMS
             )
 
-            content = response.choices[0].message.content.strip()
+            return response.choices[0].message.content.strip()
+
+        except Exception as e:
+            logger.error(f"OpenAI API 오류: {str(e)}")
+            return None
+
+    @staticmethod
+    def build_reduce_input(partial_summaries: List[str]) -> str:
+        """
+        조각별 요약을 최종 요약 요청 본문으로 합침
+
+        Args:
+            partial_summaries: 순서대로 정렬된 조각 요약 리스트
+
+        Returns:
+            summarize_with_key_points / stream_with_key_points에 넣을 텍스트
+        """
+        sections = '\n\n'.join(
+            f"({idx}/{len(partial_summaries)})\n{summary}"
+            for idx, summary in enumerate(partial_summaries, 1)
+        )
+        return f"아래는 하나의 긴 기사를 부분별로 정리한 내용입니다.\n\n{sections}"
 
-            # 응답 파싱
-            parts = content.split('[핵심 포인트]')
-            summary = parts[0].replace('[요약]', '').strip()
-            key_points = []
+    def summarize_batch(self, texts: List[str]) -> List[Optional[dict]]:
+        """
+        짧은 기사 여러 개를 한 번의 요청으로 요약 및 핵심 포인트 추출
 
-            if len(parts) > 1:
-                points_text = parts[1].strip()
-                key_points = [
-                    line.strip('- ').strip()
-                    for line in points_text.split('\n')
-                    if line.strip().startswith('-')
-                ]
+        응답은 기사별 JSON으로 받아 summarize_with_key_points와 같은 형식으로 나누고,
+        파싱에 실패한 기사는 개별 요청으로 다시 요약합니다.
 
-            return {
-                'summary': summary,
-                'key_points': key_points
-            }
+        Args:
+            texts: 요약할 기사 본문 리스트
+
+        Returns:
+            입력 순서와 같은 순서의 요약 딕셔너리 리스트 (실패한 항목은 None)
+        """
+        if not texts:
+            return []
+        if len(texts) == 1:
+            return [self.summarize_with_key_points(texts[0])]
+
+        results: List[Optional[dict]] = [None] * len(texts)
+
+        try:
+            system_prompt = """당신은 뉴스 기사를 분석하는 전문가입니다.
+여러 개의 기사를 받게 됩니다. 각 기사를 서로 섞지 말고 독립적으로 분석하여
+다음 JSON 형식으로만 응답해주세요:
+
+{"articles": [{"id": 기사 번호, "summary": "3-5문장으로 핵심 내용 요약", "key_points": ["핵심 포인트 1", "핵심 포인트 2", "핵심 포인트 3"]}]}"""
+
+            user_prompt = "다음 뉴스 기사들을 분석해주세요:\n\n" + "\n\n".join(
+                f'<article id="{idx}">\n{text}\n</article>'
+                for idx, text in enumerate(texts, 1)
+            )
+
+            response = self._complete(
+                'batch_summary',
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                response_format={"type": "json_object"},
+                max_tokens=self.BATCH_MAX_TOKENS_PER_ARTICLE * len(texts),
+                **self.BATCH_SUMMARY_PARAMS
+            )
+
+            articles = json.loads(response.choices[0].message.content).get('articles', [])
+            for article in articles:
+                if not isinstance(article, dict):
+                    continue
+                idx = article.get('id')
+                summary = article.get('summary')
+                key_points = article.get('key_points')
+                if (isinstance(idx, int) and 1 <= idx <= len(texts)
+                        and isinstance(summary, str) and summary.strip()
+                        and isinstance(key_points, list)):
+                    results[idx - 1] = {
+                        'summary': summary.strip(),
+                        'key_points': [str(point).strip() for point in key_points if str(point).strip()]
+                    }
 
         except Exception as e:
-            print(f"OpenAI API 오류: {str(e)}")
-            return None
+            logger.error(f"OpenAI API 오류 (배치 요약): {str(e)}")
+
+        # 파싱에 실패했거나 누락된 기사는 개별 요청으로 재시도
+        missing = [idx for idx, result in enumerate(results) if result is None]
+        if missing:
+            logger.warning(f"배치 요약 누락 {len(missing)}/{len(texts)}건 개별 재시도")
+        for idx in missing:
+            results[idx] = self.summarize_with_key_points(texts[idx])
+
+        return results
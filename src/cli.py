@@ -0,0 +1,272 @@
+"""
+뉴스 검색/요약 일괄 처리 CLI
+
+검색어 파일을 읽어 뉴스 검색(중복 제거 포함), 선택적으로 본문 크롤링과 AI 요약을 수행하고
+결과를 JSONL로 출력합니다. cron에서 캐시를 미리 채우거나 요약 모음을 만들 때,
+또는 브라우저 없이 서비스 계층의 처리량을 측정할 때 사용합니다.
+
+사용 예:
+    python -m src.cli queries.txt --count 20 --summarize -o digest.jsonl
+    cat queries.txt | python -m src.cli - --crawl --workers 10
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, TextIO
+from src.utils.config import (
+    validate_config, validate_openai_config, NAVER_PREFETCH_PAGES, SUMMARY_BATCH_TOKENS
+)
+from src.utils.crawler import NewsCrawler
+from src.utils.deduplicator import NewsDeduplicator, IncrementalDeduplicator
+from src.utils.metrics import METRICS
+from src.api.naver_news_api import NaverNewsAPI
+from src.services.news_service import NewsService
+from src.services.ai_summary_service import AISummaryService
+
+
+class BatchStats:
+    """일괄 처리 통계 (여러 스레드에서 갱신)"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.counters = dict.fromkeys(
+            ('queries', 'query_errors', 'items', 'crawled', 'crawl_failed', 'summarized', 'summary_failed'), 0
+        )
+        self._lock = threading.Lock()
+
+    def add(self, **counts: int) -> None:
+        """카운터 증가"""
+        with self._lock:
+            for name, value in counts.items():
+                self.counters[name] += value
+
+    def report(self) -> Dict:
+        """
+        처리량 통계
+
+        Returns:
+            카운터와 경과 시간(elapsed_sec), 초당 처리량(*_per_sec) 딕셔너리
+        """
+        elapsed = time.perf_counter() - self.started_at
+        with self._lock:
+            report = dict(self.counters)
+        report['elapsed_sec'] = round(elapsed, 3)
+        for name in ('queries', 'items', 'crawled', 'summarized'):
+            report[f'{name}_per_sec'] = round(report[name] / elapsed, 2) if elapsed > 0 else 0.0
+        return report
+
+
+def read_queries(source: TextIO) -> List[str]:
+    """
+    검색어 파일 읽기 (한 줄에 하나, 빈 줄과 #으로 시작하는 줄은 무시)
+
+    Args:
+        source: 검색어 파일 객체
+
+    Returns:
+        중복 없는 검색어 리스트 (입력 순서 유지)
+    """
+    queries = []
+    for line in source:
+        query = line.strip()
+        if query and not query.startswith('#') and query not in queries:
+            queries.append(query)
+    return queries
+
+
+def crawl_contents(urls: List[str], max_concurrency: int) -> Dict[str, Dict]:
+    """
+    기사 본문을 비동기로 크롤링
+
+    Args:
+        urls: 기사 URL 리스트
+        max_concurrency: 전체 동시 요청 수
+
+    Returns:
+        {URL: get_article_summary_info 형식의 결과} 딕셔너리
+    """
+    async def collect() -> Dict[str, Dict]:
+        return {
+            info['url']: info
+            async for info in NewsCrawler.afetch_many(urls, max_concurrency=max_concurrency)
+        }
+
+    return asyncio.run(collect())
+
+
+def process_query(
+    query: str,
+    args: argparse.Namespace,
+    stats: BatchStats,
+    ai_service=None
+) -> List[Dict]:
+    """
+    검색어 하나를 처리해 뉴스별 결과 레코드 생성
+
+    Args:
+        query: 검색 키워드
+        args: 명령행 인자
+        stats: 통계
+        ai_service: AI 요약 서비스 (--summarize가 아니면 None)
+
+    Returns:
+        JSONL로 출력할 레코드 리스트 (검색 순위 순)
+    """
+    deduplicator = IncrementalDeduplicator(args.threshold, args.engine)
+    news_list = NewsService().search_and_format(
+        query,
+        args.count,
+        args.sort,
+        remove_duplicates=not args.no_dedup,
+        similarity_threshold=args.threshold,
+        dedup_engine=args.engine,
+        deduplicator=deduplicator,
+        prefetch_pages=args.prefetch_pages
+    )
+
+    if args.no_dedup:
+        clusters = [NewsDeduplicator.make_cluster(news, []) for news in news_list]
+    else:
+        deduplicator.truncate(len(news_list))
+        clusters = deduplicator.clusters
+
+    records = [
+        {
+            'query': query,
+            'rank': rank,
+            **cluster['representative'],
+            'outlets': cluster['outlets']
+        }
+        for rank, cluster in enumerate(clusters, 1)
+    ]
+
+    if ai_service:
+        # 같은 기사를 보도한 묶음마다 한 번씩 크롤링 및 요약
+        for record, result in zip(records, ai_service.summarize_clusters(clusters, max_workers=args.workers)):
+            if not args.include_content:
+                result.pop('original_content', None)
+                result.pop('content', None)
+            record['ai_summary'] = result
+            stats.add(**{'summarized' if result.get('success') else 'summary_failed': 1})
+    elif args.crawl:
+        urls = [record['originallink'] or record['link'] for record in records]
+        contents = crawl_contents([url for url in urls if url], args.workers)
+        for record, url in zip(records, urls):
+            info = contents.get(url)
+            record['crawl_success'] = bool(info and info['success'])
+            record['word_count'] = info['word_count'] if info else 0
+            if args.include_content:
+                record['content'] = info['content'] if info else None
+            stats.add(**{'crawled' if record['crawl_success'] else 'crawl_failed': 1})
+
+    stats.add(queries=1, items=len(records))
+    return records
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령행 인자 파서 생성"""
+    parser = argparse.ArgumentParser(
+        prog='python -m src.cli',
+        description='검색어 파일의 뉴스를 검색/크롤링/AI 요약해 JSONL로 출력합니다.'
+    )
+    parser.add_argument('queries', help="검색어 파일 (한 줄에 하나, '-'이면 표준 입력)")
+    parser.add_argument('-o', '--output', help='결과 JSONL 파일 (기본값: 표준 출력)')
+    parser.add_argument('--count', type=int, default=10, help='검색어당 뉴스 개수 (기본값: 10)')
+    parser.add_argument('--sort', choices=('date', 'sim'), default='date', help='정렬 방식 (기본값: date)')
+    parser.add_argument('--no-dedup', action='store_true', help='중복 제거 사용 안 함')
+    parser.add_argument('--threshold', type=float, default=0.7, help='중복 판단 유사도 임계값 (기본값: 0.7)')
+    parser.add_argument('--engine', choices=NewsDeduplicator.ENGINES, default='exact', help='중복 제거 엔진')
+    parser.add_argument(
+        '--prefetch-pages', type=int, default=NAVER_PREFETCH_PAGES,
+        help=f'검색 API 동시 요청 페이지 수 (기본값: {NAVER_PREFETCH_PAGES})'
+    )
+    parser.add_argument('--crawl', action='store_true', help='기사 본문 크롤링')
+    parser.add_argument('--summarize', action='store_true', help='기사 묶음별 AI 요약 (크롤링 포함)')
+    parser.add_argument(
+        '--batch-tokens', type=int, default=SUMMARY_BATCH_TOKENS,
+        help=f'짧은 기사를 묶어 요약할 요청당 토큰 예산, 0이면 개별 요청 (기본값: {SUMMARY_BATCH_TOKENS})'
+    )
+    parser.add_argument('--include-content', action='store_true', help='크롤링한 본문을 결과에 포함')
+    parser.add_argument('--query-workers', type=int, default=4, help='동시에 처리할 검색어 수 (기본값: 4)')
+    parser.add_argument('--workers', type=int, default=5, help='검색어당 크롤링/요약 동시 처리 수 (기본값: 5)')
+    parser.add_argument('--metrics', help='단계별 계측값을 저장할 파일 (.prom이면 Prometheus 형식, 그 외는 JSON)')
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    CLI 진입점
+
+    Args:
+        argv: 명령행 인자 (기본값: sys.argv[1:])
+
+    Returns:
+        종료 코드 (검색어 처리 중 오류가 있으면 1)
+    """
+    args = build_parser().parse_args(argv)
+
+    try:
+        validate_config()
+        if args.summarize:
+            validate_openai_config()
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+
+    if args.queries == '-':
+        queries = read_queries(sys.stdin)
+    else:
+        with open(args.queries, encoding='utf-8') as f:
+            queries = read_queries(f)
+
+    # 묶음 요약은 summarize_clusters를 거치므로 짧은 기사는 batch_tokens 예산까지 한 요청으로 요약
+    ai_service = AISummaryService(batch_tokens=args.batch_tokens) if args.summarize else None
+
+    stats = BatchStats()
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+
+    try:
+        # 표준 출력에는 결과 레코드만 쓰고, 처리 중 다른 코드가 print한 내용은 표준 에러로 보냄
+        with contextlib.redirect_stdout(sys.stderr), \
+                ThreadPoolExecutor(max_workers=max(1, args.query_workers)) as executor:
+            futures = {
+                executor.submit(process_query, query, args, stats, ai_service): query
+                for query in queries
+            }
+
+            # 끝난 검색어부터 바로 출력
+            for future in as_completed(futures):
+                query = futures[future]
+                try:
+                    records = future.result()
+                except Exception as e:
+                    print(f"검색어 처리 실패 - {query}: {str(e)}", file=sys.stderr)
+                    stats.add(query_errors=1)
+                    continue
+
+                for record in records:
+                    output.write(json.dumps(record, ensure_ascii=False) + '\n')
+                output.flush()
+    finally:
+        if args.output:
+            output.close()
+
+    report = stats.report()
+    report['naver_cache'] = NaverNewsAPI.response_cache.stats()
+    if ai_service and ai_service.summary_cache:
+        report['summary_cache'] = ai_service.summary_cache.stats()
+    print(json.dumps(report, ensure_ascii=False), file=sys.stderr)
+
+    if args.metrics:
+        METRICS.write(args.metrics)
+
+    return 1 if report['query_errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
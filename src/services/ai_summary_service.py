@@ -1,83 +1,624 @@
 """AI 기반 뉴스 요약 서비스"""
-from typing import Optional, Dict
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from typing import Optional, Dict, List, Callable, Tuple
 from src.utils.crawler import NewsCrawler
+from src.utils.extraction_rules import EXTRACTION_RULES
+from src.utils.formatter import canonicalize_url
+from src.utils.summary_cache import SummaryCache
+from src.utils.metrics import get_logger
+from src.utils.token_budget import estimate_tokens, trim_to_budget, split_into_chunks
+from src.utils.config import (
+    SUMMARY_CACHE_ENABLED, SUMMARY_CACHE_PATH, SUMMARY_CACHE_MAX_ENTRIES, SUMMARY_CACHE_TTL
+)
 from src.api.openai_api import OpenAIClient
 
+logger = get_logger('ai_summary')
+
 
 class AISummaryService:
     """AI 기반 뉴스 요약 서비스"""
 
-    def __init__(self):
+    # 프로세스 전체에서 공유하는 요약 캐시 (get_summary_cache()로 지연 생성)
+    _summary_cache: Optional[SummaryCache] = None
+    _summary_cache_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_input_tokens: int = 3000,
+        map_reduce_tokens: int = 8000,
+        chunk_tokens: int = 2500,
+        max_chunks: int = 6,
+        chunk_workers: int = 4,
+        batch_tokens: int = 0,
+        batch_item_tokens: int = 1500,
+        max_batch_size: int = 8,
+        batch_wait: float = 1.0,
+        max_cluster_sources: int = 3
+    ):
+        """
+        Args:
+            max_input_tokens: 한 번의 요약 요청에 넣을 최대 본문 토큰 수
+            map_reduce_tokens: 이 토큰 수를 넘는 기사는 조각별 요약 후 합침 (이하이면 축약)
+            chunk_tokens: map-reduce 조각당 최대 토큰 수
+            max_chunks: 요약할 최대 조각 수 (초과분은 버림)
+            chunk_workers: 조각 요약 동시 요청 수
+            batch_tokens: summarize_many에서 짧은 기사를 묶어 한 번에 요약할 요청당 토큰 예산
+                          (0이면 배치 요약 사용 안 함)
+            batch_item_tokens: 배치에 넣을 수 있는 기사 1건의 최대 토큰 수
+            max_batch_size: 배치 하나에 넣을 최대 기사 수
+            batch_wait: 배치에 첫 기사가 들어온 뒤 다른 기사를 더 기다릴 최대 시간 (초)
+            max_cluster_sources: summarize_clusters에서 묶음당 시도할 최대 후보 URL 수
+        """
         self.crawler = NewsCrawler()
         self.ai_client = OpenAIClient()
+        self.summary_cache = AISummaryService.get_summary_cache()
+
+        self.max_input_tokens = max_input_tokens
+        self.map_reduce_tokens = map_reduce_tokens
+        self.chunk_tokens = chunk_tokens
+        self.max_chunks = max_chunks
+        self.chunk_workers = chunk_workers
+        self.batch_tokens = batch_tokens
+        self.batch_item_tokens = batch_item_tokens
+        self.max_batch_size = max_batch_size
+        self.batch_wait = batch_wait
+        self.max_cluster_sources = max_cluster_sources
+
+    @staticmethod
+    def get_summary_cache() -> Optional[SummaryCache]:
+        """
+        AI 요약 캐시 반환
+
+        Returns:
+            SummaryCache 인스턴스 (SUMMARY_CACHE_ENABLED가 false면 None)
+        """
+        if not SUMMARY_CACHE_ENABLED:
+            return None
+
+        with AISummaryService._summary_cache_lock:
+            if AISummaryService._summary_cache is None:
+                AISummaryService._summary_cache = SummaryCache(
+                    SUMMARY_CACHE_PATH,
+                    max_entries=SUMMARY_CACHE_MAX_ENTRIES,
+                    ttl=SUMMARY_CACHE_TTL
+                )
+            return AISummaryService._summary_cache
+
+    def _key_points_cache_key(self, content: str, batch: bool = False) -> Optional[str]:
+        """
+        요약 및 핵심 포인트 결과의 캐시 키 (캐시 비활성화 시 None)
+
+        배치 요약은 프롬프트와 생성 설정이 개별 요약과 다르므로 별도의 키를 사용합니다.
+        """
+        if not self.summary_cache:
+            return None
+
+        if batch:
+            return SummaryCache.make_key(
+                content,
+                self.ai_client.model,
+                f"key_points_batch:{OpenAIClient.PROMPT_VERSION}",
+                dict(
+                    OpenAIClient.BATCH_SUMMARY_PARAMS,
+                    max_tokens_per_article=OpenAIClient.BATCH_MAX_TOKENS_PER_ARTICLE
+                )
+            )
+
+        return SummaryCache.make_key(
+            content,
+            self.ai_client.model,
+            f"key_points:{OpenAIClient.PROMPT_VERSION}",
+            dict(
+                OpenAIClient.KEY_POINTS_PARAMS,
+                max_input_tokens=self.max_input_tokens,
+                map_reduce_tokens=self.map_reduce_tokens,
+                chunk_tokens=self.chunk_tokens,
+                max_chunks=self.max_chunks
+            )
+        )
+
+    def _summarize_with_key_points(
+        self,
+        content: str,
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> Optional[Dict]:
+        """
+        요약 캐시를 먼저 확인한 뒤 AI 요약 및 핵심 포인트 생성
+
+        Args:
+            content: 기사 본문
+            on_delta: 지정하면 응답을 스트리밍으로 받아 텍스트 조각마다 호출
+                      (캐시 적중 시에는 호출되지 않음)
+
+        Returns:
+            {'summary', 'key_points'} 딕셔너리 (실패 시 None)
+        """
+        key = self._key_points_cache_key(content)
+        if key:
+            cached = self.summary_cache.get(key)
+            if cached:
+                return cached
+
+        tokens = estimate_tokens(content)
+        if tokens <= self.max_input_tokens:
+            result = self._key_points(content, on_delta)
+        elif tokens <= self.map_reduce_tokens:
+            result = self._key_points(trim_to_budget(content, self.max_input_tokens), on_delta)
+        else:
+            result = self._map_reduce_summarize(content, on_delta)
+
+        # 실패 결과는 캐시하지 않음
+        if result and key:
+            self.summary_cache.put(key, result)
+
+        return result
+
+    def _key_points(self, text: str, on_delta: Optional[Callable[[str], None]] = None) -> Optional[Dict]:
+        """
+        요약 및 핵심 포인트 생성 (on_delta가 있으면 스트리밍)
+
+        Args:
+            text: 모델에 넣을 텍스트
+            on_delta: 응답 텍스트 조각마다 호출되는 콜백
+
+        Returns:
+            {'summary', 'key_points'} 딕셔너리 (실패 시 None)
+        """
+        if not on_delta:
+            return self.ai_client.summarize_with_key_points(text)
+
+        parts = []
+        try:
+            for delta in self.ai_client.stream_with_key_points(text):
+                parts.append(delta)
+                on_delta(delta)
+        except Exception as e:
+            logger.error(f"OpenAI API 오류 (스트리밍): {str(e)}")
+            return None
+
+        content = ''.join(parts).strip()
+        return OpenAIClient.parse_key_points(content) if content else None
+
+    def _map_reduce_summarize(
+        self,
+        content: str,
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> Optional[Dict]:
+        """
+        긴 기사를 조각으로 나눠 병렬 요약한 뒤 최종 요약으로 합침
 
-    def summarize_news_from_url(self, url: str) -> Dict:
+        Args:
+            content: 기사 본문
+            on_delta: 최종 요약을 스트리밍으로 받을 때 텍스트 조각마다 호출되는 콜백
+
+        Returns:
+            {'summary', 'key_points'} 딕셔너리 (실패 시 None)
+        """
+        chunks = split_into_chunks(content, self.chunk_tokens)[:self.max_chunks]
+        logger.info(f"긴 기사 분할 요약: 약 {estimate_tokens(content):,}토큰 → {len(chunks)}개 조각")
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.chunk_workers, len(chunks)))) as executor:
+            partial_summaries = list(executor.map(
+                lambda args: self.ai_client.summarize_chunk(args[1], args[0], len(chunks)),
+                enumerate(chunks, 1)
+            ))
+
+        # 일부 조각이 실패해도 남은 조각으로 요약
+        partial_summaries = [summary for summary in partial_summaries if summary]
+        if not partial_summaries:
+            return None
+
+        return self._key_points(OpenAIClient.build_reduce_input(partial_summaries), on_delta)
+
+    def _crawl_for_summary(self, url: str) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """
+        요약할 기사 본문 크롤링
+
+        Args:
+            url: 뉴스 기사 URL
+
+        Returns:
+            (크롤링 정보, 실패 결과) 튜플 - 둘 중 하나만 값이 있음
+        """
+        article_info = self.crawler.get_article_summary_info(url)
+
+        if not article_info['success']:
+            error_msg = f"크롤링 실패 - URL: {url[:50]}..."
+            logger.warning(error_msg)
+            return None, {
+                'success': False,
+                'error': '뉴스 본문을 가져올 수 없습니다. (크롤링 실패)',
+                'url': url
+            }
+
+        content = article_info['content']
+
+        # 본문이 너무 짧은 경우
+        if len(content) < 100:
+            error_msg = f"본문 길이 부족: {len(content)}자 - URL: {url[:50]}..."
+            logger.warning(error_msg)
+            return None, {
+                'success': False,
+                'error': f'뉴스 본문이 너무 짧습니다. (추출된 텍스트: {len(content)}자)',
+                'url': url,
+                'content': content
+            }
+
+        return article_info, None
+
+    def _crawl_sources(self, urls: List[str]) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """
+        후보 URL을 순서대로 크롤링해 처음으로 성공한 기사 본문 반환
+
+        Args:
+            urls: 같은 기사를 가리키는 후보 URL 리스트 (선호 순서)
+
+        Returns:
+            (크롤링 정보, 실패 결과) 튜플 - 모두 실패하면 마지막 실패 결과
+        """
+        error_result = None
+        for url in urls:
+            article_info, error_result = self._crawl_for_summary(url)
+            if article_info:
+                return article_info, None
+        return None, error_result
+
+    def cluster_sources(self, cluster: Dict) -> List[str]:
+        """
+        기사 묶음에서 요약에 사용할 후보 URL 목록 (선호 순서, 최대 max_cluster_sources개)
+
+        사이트별 추출 규칙이 있는 URL(네이버 뉴스 등)이 가장 깔끔하게 추출되므로 먼저 시도하고,
+        나머지는 대표 뉴스, 유사도가 높은 멤버 순으로 시도합니다.
+
+        Args:
+            cluster: NewsDeduplicator.cluster_news 형식의 묶음
+
+        Returns:
+            중복 없는 후보 URL 리스트
+        """
+        news_items = [cluster['representative']] + [member['news'] for member in cluster['members']]
+
+        urls = []
+        seen = set()
+        for news in news_items:
+            for url in (news.get('originallink'), news.get('link')):
+                if url and canonicalize_url(url) not in seen:
+                    seen.add(canonicalize_url(url))
+                    urls.append(url)
+
+        # 안정 정렬이므로 같은 그룹 안에서는 원래 순서 유지
+        urls.sort(key=lambda url: EXTRACTION_RULES.rule_for(url) is None)
+        return urls[:self.max_cluster_sources]
+
+    @staticmethod
+    def _build_summary_result(url: str, article_info: Dict, summary_result: Optional[Dict]) -> Dict:
+        """
+        크롤링 정보와 AI 요약을 합쳐 최종 결과 생성
+
+        Args:
+            url: 뉴스 기사 URL
+            article_info: 크롤링 정보
+            summary_result: AI 요약 결과 (실패 시 None)
+
+        Returns:
+            요약 정보 딕셔너리
+        """
+        content = article_info['content']
+
+        if not summary_result:
+            error_msg = f"AI 요약 실패 - URL: {url[:50]}..."
+            logger.warning(error_msg)
+            return {
+                'success': False,
+                'error': 'AI 요약 생성에 실패했습니다.',
+                'url': url,
+                'content': content
+            }
+
+        return {
+            'success': True,
+            'url': url,
+            'original_content': content,
+            'word_count': article_info['word_count'],
+            'summary': summary_result['summary'],
+            'key_points': summary_result['key_points']
+        }
+
+    def summarize_news_from_url(
+        self,
+        url: str,
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> Dict:
         """
         URL에서 뉴스를 가져와 AI로 요약
 
         Args:
             url: 뉴스 기사 URL
+            on_delta: 지정하면 AI 응답을 스트리밍으로 받아 텍스트 조각마다 호출
 
         Returns:
             요약 정보 딕셔너리
         """
+        return self._summarize_sources([url], on_delta)
+
+    def _summarize_sources(
+        self,
+        urls: List[str],
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> Dict:
+        """
+        후보 URL 중 처음으로 크롤링에 성공한 기사를 AI로 요약
+
+        Args:
+            urls: 같은 기사를 가리키는 후보 URL 리스트 (선호 순서)
+            on_delta: 지정하면 AI 응답을 스트리밍으로 받아 텍스트 조각마다 호출
+
+        Returns:
+            요약 정보 딕셔너리 (url은 실제로 요약한 기사 URL)
+        """
         try:
             # 1. 뉴스 전문 크롤링
-            article_info = self.crawler.get_article_summary_info(url)
-
-            if not article_info['success']:
-                error_msg = f"크롤링 실패 - URL: {url[:50]}..."
-                print(error_msg)
-                return {
-                    'success': False,
-                    'error': '뉴스 본문을 가져올 수 없습니다. (크롤링 실패)',
-                    'url': url
-                }
-
-            content = article_info['content']
-
-            # 본문이 너무 짧은 경우
-            if len(content) < 100:
-                error_msg = f"본문 길이 부족: {len(content)}자 - URL: {url[:50]}..."
-                print(error_msg)
-                return {
-                    'success': False,
-                    'error': f'뉴스 본문이 너무 짧습니다. (추출된 텍스트: {len(content)}자)',
-                    'url': url,
-                    'content': content
-                }
+            article_info, error_result = self._crawl_sources(urls)
+            if error_result:
+                return error_result
 
             # 2. AI 요약 생성
-            summary_result = self.ai_client.summarize_with_key_points(content)
-
-            if not summary_result:
-                error_msg = f"AI 요약 실패 - URL: {url[:50]}..."
-                print(error_msg)
-                return {
-                    'success': False,
-                    'error': 'AI 요약 생성에 실패했습니다.',
-                    'url': url,
-                    'content': content
-                }
+            summary_result = self._summarize_with_key_points(article_info['content'], on_delta)
 
             # 3. 결과 반환
+            return self._build_summary_result(article_info['url'], article_info, summary_result)
+
+        except Exception as e:
+            error_msg = f"예외 발생 - {str(e)} - URL: {urls[0][:50]}..."
+            logger.warning(error_msg)
             return {
-                'success': True,
-                'url': url,
-                'original_content': content,
-                'word_count': article_info['word_count'],
-                'summary': summary_result['summary'],
-                'key_points': summary_result['key_points']
+                'success': False,
+                'error': f'처리 중 오류 발생: {str(e)}',
+                'url': urls[0]
             }
 
-        except Exception as e:
-            error_msg = f"예외 발생 - {str(e)} - URL: {url[:50]}..."
-            print(error_msg)
+    def summarize_many(
+        self,
+        urls: List[str],
+        max_workers: int = 5,
+        on_complete: Optional[Callable[[int, Dict], None]] = None,
+        on_delta: Optional[Callable[[int, str], None]] = None
+    ) -> List[Dict]:
+        """
+        여러 URL을 병렬로 크롤링 및 AI 요약
+
+        크롤링(네트워크 I/O)과 OpenAI 호출 대기가 스레드 풀에서 겹쳐 실행되므로
+        전체 소요 시간이 기사 수에 비례해 늘어나지 않습니다.
+
+        Args:
+            urls: 뉴스 기사 URL 리스트
+            max_workers: 동시에 처리할 최대 기사 수
+            on_complete: 기사 하나가 끝날 때마다 호출되는 콜백 (index, result)
+                         - 완료 순서대로 호출되며, 호출한 스레드에서 실행됨
+            on_delta: AI 응답을 스트리밍으로 받아 텍스트 조각마다 호출되는 콜백 (index, text)
+                      - 작업 스레드에서 호출되며, 배치 모드(batch_tokens > 0)에서는 사용되지 않음
+
+        Returns:
+            입력 URL 순서와 동일한 순서의 요약 정보 딕셔너리 리스트
+        """
+        return self._summarize_parallel([[url] for url in urls], max_workers, on_complete, on_delta)
+
+    def summarize_clusters(
+        self,
+        clusters: List[Dict],
+        max_workers: int = 5,
+        on_complete: Optional[Callable[[int, Dict], None]] = None,
+        on_delta: Optional[Callable[[int, str], None]] = None
+    ) -> List[Dict]:
+        """
+        기사 묶음(스토리)마다 한 번씩 크롤링 및 AI 요약
+
+        같은 기사를 여러 언론사가 보도한 경우 묶음당 한 건만 크롤링/요약하므로
+        중복 보도가 많은 뉴스에서 크롤링과 OpenAI 호출이 줄어듭니다.
+        후보 URL은 cluster_sources() 순서대로 시도하며, 처음 성공한 기사로 요약합니다.
+
+        Args:
+            clusters: NewsDeduplicator.cluster_news 형식의 묶음 리스트
+            max_workers: 동시에 처리할 최대 묶음 수
+            on_complete: 묶음 하나가 끝날 때마다 호출되는 콜백 (index, result)
+            on_delta: AI 응답 텍스트 조각마다 호출되는 콜백 (index, text) - summarize_many와 동일
+
+        Returns:
+            입력 묶음 순서와 동일한 순서의 요약 정보 딕셔너리 리스트
+            (summarize_many 결과에 outlet_count 추가)
+        """
+        def with_outlets(idx: int, result: Dict) -> Dict:
+            result['outlet_count'] = len(clusters[idx]['outlets'])
+            return result
+
+        results = self._summarize_parallel(
+            [self.cluster_sources(cluster) or [''] for cluster in clusters],
+            max_workers,
+            (lambda idx, result: on_complete(idx, with_outlets(idx, result))) if on_complete else None,
+            on_delta
+        )
+        return [with_outlets(idx, result) for idx, result in enumerate(results)]
+
+    def summarize_cluster(
+        self,
+        cluster: Dict,
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> Dict:
+        """
+        기사 묶음 하나를 크롤링 및 AI 요약 (호출한 스레드에서 실행)
+
+        Args:
+            cluster: NewsDeduplicator.cluster_news 형식의 묶음
+            on_delta: 지정하면 AI 응답을 스트리밍으로 받아 텍스트 조각마다 호출
+
+        Returns:
+            요약 정보 딕셔너리 (outlet_count 포함)
+        """
+        result = self._summarize_sources(self.cluster_sources(cluster) or [''], on_delta)
+        result['outlet_count'] = len(cluster['outlets'])
+        return result
+
+    def _summarize_parallel(
+        self,
+        sources: List[List[str]],
+        max_workers: int,
+        on_complete: Optional[Callable[[int, Dict], None]],
+        on_delta: Optional[Callable[[int, str], None]]
+    ) -> List[Dict]:
+        """
+        summarize_many/summarize_clusters 공통 처리 (항목마다 후보 URL 리스트)
+        """
+        results: List[Optional[Dict]] = [None] * len(sources)
+
+        if not sources:
+            return []
+
+        if self.batch_tokens > 0:
+            return self._summarize_many_batched(sources, max_workers, on_complete)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(sources)))) as executor:
+            futures = {
+                executor.submit(
+                    self._summarize_sources,
+                    urls,
+                    (lambda delta, idx=idx: on_delta(idx, delta)) if on_delta else None
+                ): idx
+                for idx, urls in enumerate(sources)
+            }
+
+            for future in as_completed(futures):
+                idx = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {
+                        'success': False,
+                        'error': f'처리 중 오류 발생: {str(e)}',
+                        'url': sources[idx][0]
+                    }
+
+                results[idx] = result
+
+                if on_complete:
+                    on_complete(idx, result)
+
+        return results
+
+    def _summarize_many_batched(
+        self,
+        sources: List[List[str]],
+        max_workers: int,
+        on_complete: Optional[Callable[[int, Dict], None]]
+    ) -> List[Dict]:
+        """
+        summarize_many의 배치 모드
+
+        크롤링이 끝난 짧은 기사는 batch_tokens 예산까지 모아 한 번의 요청으로 요약하고,
+        긴 기사는 기존처럼 개별 요청(축약/map-reduce 포함)으로 요약합니다.
+        배치는 예산이나 최대 기사 수가 차거나, 첫 기사가 들어온 뒤 batch_wait초가 지나면
+        바로 요청하므로 남은 크롤링을 기다리지 않고 요약이 시작됩니다.
+        """
+        results: List[Optional[Dict]] = [None] * len(sources)
+
+        def finish(idx: int, result: Dict) -> None:
+            results[idx] = result
+            if on_complete:
+                on_complete(idx, result)
+
+        def error_result(idx: int, e: Exception) -> Dict:
             return {
                 'success': False,
                 'error': f'처리 중 오류 발생: {str(e)}',
-                'url': url
+                'url': sources[idx][0]
+            }
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(sources)))) as executor:
+            # future -> (작업 종류, 작업 정보)
+            pending = {
+                executor.submit(self._crawl_sources, urls): ('crawl', idx)
+                for idx, urls in enumerate(sources)
             }
+            batch: List[Tuple[int, Dict, Optional[str]]] = []
+            batch_used = 0
+            batch_deadline = 0.0
+
+            def flush_batch() -> None:
+                nonlocal batch, batch_used
+                texts = [info['content'] for _, info, _ in batch]
+                pending[executor.submit(self.ai_client.summarize_batch, texts)] = ('batch', batch)
+                batch = []
+                batch_used = 0
+
+            while pending:
+                timeout = max(0.0, batch_deadline - time.monotonic()) if batch else None
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    kind, payload = pending.pop(future)
+
+                    if kind == 'crawl':
+                        idx = payload
+                        try:
+                            article_info, failed = future.result()
+                        except Exception as e:
+                            finish(idx, error_result(idx, e))
+                            continue
+                        if failed:
+                            finish(idx, failed)
+                            continue
+
+                        content = article_info['content']
+                        tokens = estimate_tokens(content)
+                        if tokens > self.batch_item_tokens:
+                            # 긴 기사는 개별 요약 (개별 요약 캐시 사용)
+                            future = executor.submit(self._summarize_with_key_points, content)
+                            pending[future] = ('single', (idx, article_info))
+                            continue
+
+                        key = self._key_points_cache_key(content, batch=True)
+                        cached = self.summary_cache.get(key) if key else None
+                        if cached:
+                            finish(idx, self._build_summary_result(article_info['url'], article_info, cached))
+                            continue
+
+                        if batch and batch_used + tokens > self.batch_tokens:
+                            flush_batch()
+                        if not batch:
+                            batch_deadline = time.monotonic() + self.batch_wait
+                        batch.append((idx, article_info, key))
+                        batch_used += tokens
+
+                    elif kind == 'single':
+                        idx, article_info = payload
+                        try:
+                            summary_result = future.result()
+                        except Exception as e:
+                            finish(idx, error_result(idx, e))
+                            continue
+                        finish(idx, self._build_summary_result(article_info['url'], article_info, summary_result))
+
+                    else:
+                        try:
+                            summary_results = future.result()
+                        except Exception as e:
+                            summary_results = [None] * len(payload)
+                            logger.error(f"배치 요약 실패: {str(e)}")
+
+                        for (idx, article_info, key), summary_result in zip(payload, summary_results):
+                            if summary_result and key:
+                                self.summary_cache.put(key, summary_result)
+                            finish(idx, self._build_summary_result(article_info['url'], article_info, summary_result))
+
+                # 배치가 찼거나, 대기 시간이 지났거나, 더 채울 크롤링이 없으면 요청
+                if batch and (batch_used >= self.batch_tokens
+                              or len(batch) >= self.max_batch_size
+                              or time.monotonic() >= batch_deadline
+                              or not any(kind == 'crawl' for kind, _ in pending.values())):
+                    flush_batch()
+
+        return results
 
     def get_simple_summary(self, url: str, max_length: int = 300) -> Optional[str]:
         """
@@ -95,7 +636,30 @@ class AISummaryService:
         if not article_info['success']:
             return None
 
-        return self.ai_client.summarize_text(
-            article_info['content'],
+        content = article_info['content']
+
+        key = None
+        if self.summary_cache:
+            key = SummaryCache.make_key(
+                content,
+                self.ai_client.model,
+                f"text:{OpenAIClient.PROMPT_VERSION}",
+                dict(
+                    OpenAIClient.TEXT_SUMMARY_PARAMS,
+                    max_length=max_length,
+                    max_input_tokens=self.max_input_tokens
+                )
+            )
+            cached = self.summary_cache.get(key)
+            if cached:
+                return cached
+
+        summary = self.ai_client.summarize_text(
+            trim_to_budget(content, self.max_input_tokens),
             max_length=max_length
         )
+
+        if summary and key:
+            self.summary_cache.put(key, summary)
+
+        return summary
@@ -1,13 +1,19 @@
 """뉴스 검색 비즈니스 로직"""
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Iterator, Optional
 from src.api.naver_news_api import NaverNewsAPI
+from src.utils.config import NAVER_QUOTA_LOW_WATERMARK
 from src.utils.formatter import format_news_list
-from src.utils.deduplicator import NewsDeduplicator
+from src.utils.deduplicator import NewsDeduplicator, IncrementalDeduplicator
+from src.utils.metrics import METRICS
 
 
 class NewsService:
     """뉴스 검색 및 처리 서비스"""
 
+    # 네이버 검색 API의 start 파라미터 최댓값
+    MAX_START = 1000
+
     def __init__(self):
         self.api = NaverNewsAPI()
         self.deduplicator = NewsDeduplicator()
@@ -18,7 +24,11 @@ class NewsService:
         count: int = 10,
         sort: str = "date",
         remove_duplicates: bool = True,
-        similarity_threshold: float = 0.7
+        similarity_threshold: float = 0.7,
+        dedup_engine: str = "exact",
+        deduplicator: Optional[IncrementalDeduplicator] = None,
+        prefetch_pages: int = 1,
+        max_pages: Optional[int] = None
     ) -> List[Dict]:
         """
         뉴스 검색 및 포맷팅 (중복 제거 포함)
@@ -29,6 +39,11 @@ class NewsService:
             sort: 정렬 방식 (date: 날짜순, sim: 정확도순)
             remove_duplicates: 중복 제거 여부
             similarity_threshold: 유사도 임계값 (0.0 ~ 1.0)
+            dedup_engine: 중복 제거 엔진 (exact: 전체 비교, minhash: MinHash/LSH 후보 비교, vector: 벡터 후보 비교)
+            deduplicator: 이어서 사용할 증분 중복 제거기 (없으면 새로 생성)
+            prefetch_pages: 동시에 요청할 페이지 수 (1이면 순차 요청)
+            max_pages: API 호출 예산 (최대 요청 페이지 수, 기본값: 목표 개수의 3배 분량,
+                일일 호출 한도가 NAVER_QUOTA_LOW_WATERMARK보다 적게 남으면 1페이지로 제한)
 
         Returns:
             포맷팅된 뉴스 리스트
@@ -37,55 +52,148 @@ class NewsService:
             # 중복 제거 없이 바로 반환
             result = self.api.search_news(query, display=count, sort=sort)
             items = result.get('items', [])
-            return format_news_list(items)
+            with METRICS.span('format'):
+                return format_news_list(items)
 
         # 중복 제거를 위해 더 많은 뉴스를 가져옴
-        all_news = []
-        start = 1
+        if deduplicator is None:
+            deduplicator = IncrementalDeduplicator(similarity_threshold, dedup_engine)
+
         max_fetch = count * 3  # 최대 목표 개수의 3배까지 수집
         batch_size = min(100, count * 2)  # 한 번에 가져올 개수
 
-        while len(all_news) < max_fetch:
-            # API 호출
+        if max_pages is None:
+            max_pages = -(-max_fetch // batch_size)
+
+        # 일일 호출 한도가 얼마 남지 않았으면 한 번의 요청으로 최대한 많이 가져옴
+        remaining = self.api.remaining_quota()
+        if remaining is not None and remaining < NAVER_QUOTA_LOW_WATERMARK:
+            batch_size = min(100, max_fetch)
+            max_pages = min(max_pages, 1)
+            prefetch_pages = 1
+
+        starts = list(range(1, self.MAX_START + 1, batch_size))[:max_pages]
+        pages = self._fetch_pages(query, starts, batch_size, sort, prefetch_pages)
+
+        try:
+            # API가 반환한 페이지 순서대로 병합
+            for items in pages:
+                if not items:
+                    break
+
+                # 포맷팅 후 새 항목만 기존 결과와 비교
+                with METRICS.span('format'):
+                    formatted = format_news_list(items)
+                with METRICS.span('dedup', engine=deduplicator.engine):
+                    deduplicator.add_batch(formatted)
+
+                # 목표 개수 달성 시 종료
+                if len(deduplicator) >= count:
+                    break
+
+                # 더 이상 가져올 뉴스가 없으면 종료
+                if len(items) < batch_size:
+                    break
+        finally:
+            # 아직 끝나지 않은 페이지 요청 취소
+            pages.close()
+
+        return deduplicator.unique_news[:count]
+
+    def _fetch_pages(
+        self,
+        query: str,
+        starts: List[int],
+        display: int,
+        sort: str,
+        concurrency: int = 1
+    ) -> Iterator[List[Dict]]:
+        """
+        여러 검색 페이지를 최대 concurrency개씩 미리 요청하고 start 순서대로 반환
+
+        제너레이터를 닫으면 아직 시작하지 않은 요청은 취소됩니다.
+        (이미 전송된 요청은 취소할 수 없으므로 최대 concurrency - 1개의 페이지가 추가로 소비될 수 있음)
+
+        Args:
+            query: 검색 키워드
+            starts: 요청할 검색 시작 위치 리스트
+            display: 페이지당 뉴스 개수
+            sort: 정렬 방식
+            concurrency: 동시에 진행할 최대 요청 수
+
+        Yields:
+            페이지별 원본 뉴스 항목 리스트
+        """
+        def fetch(start: int) -> List[Dict]:
             result = self.api.search_news(
                 query,
-                display=batch_size,
+                display=display,
                 start=start,
                 sort=sort
             )
-            items = result.get('items', [])
-
-            if not items:
-                break
-
-            # 포맷팅 후 추가
-            formatted_items = format_news_list(items)
-            all_news.extend(formatted_items)
-
-            # 중복 제거 후 개수 확인
-            unique_news = self.deduplicator.remove_duplicates(
-                all_news,
-                similarity_threshold
-            )
-
-            # 목표 개수 달성 시 종료
-            if len(unique_news) >= count:
-                return unique_news[:count]
-
-            # 다음 페이지
-            start += batch_size
+            return result.get('items', [])
+
+        if concurrency <= 1:
+            for start in starts:
+                yield fetch(start)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        pending = []
+        try:
+            remaining = iter(starts)
+            for start in remaining:
+                pending.append(executor.submit(fetch, start))
+                if len(pending) >= concurrency:
+                    break
+
+            while pending:
+                yield pending.pop(0).result()
+                # 호출 측이 다음 페이지를 요청할 때마다 한 페이지씩 더 미리 요청
+                for start in remaining:
+                    pending.append(executor.submit(fetch, start))
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def search_more(
+        self,
+        query: str,
+        deduplicator: IncrementalDeduplicator,
+        start: int,
+        display: int = 20,
+        sort: str = "date"
+    ) -> Optional[List[Dict]]:
+        """
+        다음 페이지 뉴스 검색 (이미 가져온 뉴스와 중복 제거)
 
-            # 더 이상 가져올 뉴스가 없으면 종료
-            if len(items) < batch_size:
-                break
+        Args:
+            query: 검색 키워드
+            deduplicator: 지금까지의 결과를 보관 중인 증분 중복 제거기
+            start: 검색 시작 위치
+            display: 가져올 뉴스 개수
+            sort: 정렬 방식 (date: 날짜순, sim: 정확도순)
 
-        # 중복 제거 후 반환
-        unique_news = self.deduplicator.remove_duplicates(
-            all_news,
-            similarity_threshold
+        Returns:
+            새로 추가된 뉴스 리스트 (검색 결과 자체가 없으면 None)
+        """
+        result = self.api.search_news(
+            query,
+            display=display,
+            start=start,
+            sort=sort
         )
+        items = result.get('items', [])
+
+        if not items:
+            return None
 
-        return unique_news[:count]
+        with METRICS.span('format'):
+            formatted = format_news_list(items)
+        with METRICS.span('dedup', engine=deduplicator.engine):
+            return deduplicator.add_batch(formatted)
 
     def get_news_summary(self, query: str, count: int = 5) -> Dict:
         """
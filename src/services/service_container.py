@@ -0,0 +1,156 @@
+"""프로세스 공용 서비스 컨테이너"""
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from src.utils import config
+from src.utils.config import SUMMARY_BATCH_TOKENS
+from src.utils.crawler import NewsCrawler
+from src.api.naver_news_api import NaverNewsAPI
+from src.services.news_service import NewsService
+from src.services.summary_service import SummaryService
+from src.services.ai_summary_service import AISummaryService
+from src.services.summary_job_service import SummaryJobService
+from src.utils.metrics import get_logger
+
+logger = get_logger('services')
+
+
+class ServiceContainer:
+    """
+    프로세스 전체에서 공유하는 서비스 컨테이너
+
+    검색/요약 서비스와 그 안의 API 클라이언트(OpenAI 클라이언트 포함)를 처음 요청될 때 한 번만 만들어
+    모든 Streamlit 세션이 함께 사용하므로, 스크립트가 다시 실행될 때마다 클라이언트와 연결 풀이
+    새로 만들어지지 않습니다. 서비스 객체는 요청별 상태를 보관하지 않으므로 여러 세션 스레드에서
+    동시에 사용해도 됩니다. (요청별 상태는 IncrementalDeduplicator처럼 호출 측이 보관)
+
+    refresh()는 .env 파일이 바뀌었으면 인증 정보를 다시 읽고, 바뀐 키를 사용하는 서비스만 다시 만듭니다.
+    """
+
+    # 서비스별로 사용하는 인증 정보 (키가 바뀌면 해당 서비스를 다시 생성)
+    SERVICE_CREDENTIALS = {
+        'news': ('NAVER_CLIENT_ID', 'NAVER_CLIENT_SECRET'),
+        'summary': (),
+        'ai_summary': ('OPENAI_API_KEY',),
+    }
+
+    def __init__(self):
+        self._services: Dict[str, object] = {}
+        # 서비스 생성 중 다른 서비스를 요청할 수 있으므로 재진입 가능한 잠금 사용
+        self._lock = threading.RLock()
+        self._dotenv_mtime = self._read_dotenv_mtime()
+        self.created_at = time.time()
+        self.reloaded_at: Optional[float] = None
+
+    @staticmethod
+    def _read_dotenv_mtime() -> Optional[float]:
+        """.env 파일 수정 시각 (파일이 없으면 None)"""
+        path = config.dotenv_path()
+        try:
+            return os.path.getmtime(path) if path else None
+        except OSError:
+            return None
+
+    def _get(self, name: str, factory: Callable[[], object]) -> object:
+        """서비스 반환 (없으면 생성, 생성에 실패하면 예외를 그대로 전달하고 다음 요청 때 다시 시도)"""
+        with self._lock:
+            service = self._services.get(name)
+            if service is None:
+                service = self._services[name] = factory()
+            return service
+
+    def news_service(self) -> NewsService:
+        """뉴스 검색 서비스"""
+        return self._get('news', NewsService)
+
+    def summary_service(self) -> SummaryService:
+        """간단 요약 서비스"""
+        return self._get('summary', SummaryService)
+
+    def ai_summary_service(self) -> AISummaryService:
+        """
+        AI 요약 서비스
+
+        Raises:
+            openai.OpenAIError: OpenAI API 키가 설정되지 않은 경우
+        """
+        return self._get('ai_summary', lambda: AISummaryService(batch_tokens=SUMMARY_BATCH_TOKENS))
+
+    def job_service(self) -> SummaryJobService:
+        """
+        백그라운드 AI 요약 작업 큐 (현재 AI 요약 서비스를 사용하도록 연결)
+
+        Raises:
+            openai.OpenAIError: OpenAI API 키가 설정되지 않은 경우
+        """
+        with self._lock:
+            return SummaryJobService.get_instance(self.ai_summary_service())
+
+    def refresh(self, force: bool = False) -> List[str]:
+        """
+        .env 파일이 바뀌었으면 인증 정보를 다시 읽고, 바뀐 키를 사용하는 서비스 폐기
+
+        폐기된 서비스는 다음 요청 때 새 인증 정보로 생성됩니다.
+        이미 진행 중인 요청은 기존 클라이언트로 끝까지 처리됩니다.
+
+        Args:
+            force: .env 수정 시각과 관계없이 다시 읽을지 여부
+
+        Returns:
+            값이 바뀐 인증 정보 키 리스트
+        """
+        mtime = self._read_dotenv_mtime()
+        if not force and mtime == self._dotenv_mtime:
+            return []
+
+        with self._lock:
+            if not force and mtime == self._dotenv_mtime:
+                # 다른 세션이 먼저 다시 읽음
+                return []
+            self._dotenv_mtime = mtime
+
+            changed = config.reload_credentials()
+            if changed:
+                for name, keys in self.SERVICE_CREDENTIALS.items():
+                    if set(keys) & set(changed):
+                        self._services.pop(name, None)
+                self.reloaded_at = time.time()
+                logger.info(f"✓ 인증 정보 다시 읽음: {', '.join(changed)}")
+            return changed
+
+    def status(self) -> Dict:
+        """
+        컨테이너와 서비스 상태 (외부 API 호출 없이 확인)
+
+        Returns:
+            상태 딕셔너리
+            - healthy: 뉴스 검색이 가능한 상태인지 (네이버 인증 정보가 있고 일일 한도가 남음)
+            - uptime_sec: 컨테이너 생성 후 경과 시간 (초)
+            - reloaded_at: 마지막으로 인증 정보가 바뀐 시각 (Unix timestamp, 없으면 None)
+            - credentials: {'naver', 'openai'} 인증 정보 설정 여부
+            - services: 생성된 서비스 이름 리스트
+            - naver_quota_remaining: 오늘 남은 네이버 검색 API 호출 수 (제한이 없으면 None)
+            - summary_jobs: 상태별 요약 작업 수 (작업 큐가 없으면 None)
+            - extract_workers: 실행 중인 본문 추출 프로세스 풀의 프로세스 수 (풀이 없으면 0)
+        """
+        with self._lock:
+            services = sorted(self._services)
+            job_service = SummaryJobService._instance if 'ai_summary' in self._services else None
+
+        credentials = {
+            'naver': bool(config.NAVER_CLIENT_ID and config.NAVER_CLIENT_SECRET),
+            'openai': bool(config.OPENAI_API_KEY)
+        }
+        quota = NaverNewsAPI.remaining_quota()
+
+        return {
+            'healthy': credentials['naver'] and quota != 0,
+            'uptime_sec': round(time.time() - self.created_at, 1),
+            'reloaded_at': self.reloaded_at,
+            'credentials': credentials,
+            'services': services,
+            'naver_quota_remaining': quota,
+            'summary_jobs': job_service.stats() if job_service else None,
+            'extract_workers': NewsCrawler.extract_pool_size()
+        }
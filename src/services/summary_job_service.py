@@ -0,0 +1,230 @@
+"""백그라운드 AI 요약 작업 서비스"""
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from src.services.ai_summary_service import AISummaryService
+from src.utils.config import SUMMARY_JOB_WORKERS, SUMMARY_JOB_TTL
+from src.utils.formatter import canonicalize_url
+from src.utils.metrics import get_logger
+
+logger = get_logger('summary_jobs')
+
+
+class SummaryJob:
+    """AI 요약 작업 하나의 상태"""
+
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    __slots__ = ('id', 'status', 'result', 'parts', 'created_at', 'finished_at')
+
+    def __init__(self, job_id: str):
+        self.id = job_id
+        self.status = SummaryJob.PENDING
+        self.result: Optional[Dict] = None
+        # 스트리밍으로 받은 AI 응답 조각 (진행 중 화면 표시용)
+        self.parts: List[str] = []
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        """완료 여부 (성공/실패 모두 포함)"""
+        return self.status in (SummaryJob.DONE, SummaryJob.FAILED)
+
+    def snapshot(self) -> Dict:
+        """
+        작업 상태 조회용 딕셔너리
+
+        Returns:
+            {'id', 'status', 'partial', 'result'} 딕셔너리
+        """
+        return {
+            'id': self.id,
+            'status': self.status,
+            'partial': ''.join(self.parts),
+            'result': self.result
+        }
+
+
+class SummaryJobService:
+    """
+    프로세스 전체에서 공유하는 AI 요약 작업 큐
+
+    Streamlit 스크립트 실행과 별개인 스레드 풀에서 요약을 처리하므로, 화면은
+    작업 ID로 상태를 조회해 완료된 요약부터 표시하면 됩니다. 스크립트가 다시 실행되거나
+    사용자가 다른 버튼을 눌러도 진행 중인 작업은 유지됩니다.
+    같은 기사에 대한 작업은 세션이 달라도 하나로 합쳐지며, 완료된 작업은
+    job_ttl 동안 보관 후 삭제합니다. (실패한 작업은 다시 요청하면 새로 실행)
+    """
+
+    _instance: Optional['SummaryJobService'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_workers: int = SUMMARY_JOB_WORKERS,
+        job_ttl: float = SUMMARY_JOB_TTL,
+        ai_service: Optional[AISummaryService] = None
+    ):
+        """
+        Args:
+            max_workers: 동시에 처리할 최대 작업 수
+            job_ttl: 완료된 작업을 보관할 시간 (초)
+            ai_service: 요약에 사용할 AI 요약 서비스 (기본값: 새로 생성)
+        """
+        self.ai_service = ai_service or AISummaryService()
+        self.job_ttl = job_ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='summary-job')
+        self._jobs: Dict[str, SummaryJob] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_instance(ai_service: Optional[AISummaryService] = None) -> 'SummaryJobService':
+        """
+        프로세스 공용 인스턴스 반환 (처음 호출 시 생성)
+
+        Args:
+            ai_service: 이후 등록되는 작업에 사용할 AI 요약 서비스
+                        (인증 정보가 바뀌어 새로 만든 서비스로 교체할 때 사용, 진행 중인 작업은 기존 서비스로 완료)
+
+        Returns:
+            SummaryJobService 인스턴스
+
+        Raises:
+            openai.OpenAIError: OpenAI API 키가 설정되지 않은 경우
+        """
+        with SummaryJobService._instance_lock:
+            if SummaryJobService._instance is None:
+                SummaryJobService._instance = SummaryJobService(ai_service=ai_service)
+            elif ai_service is not None:
+                SummaryJobService._instance.ai_service = ai_service
+            return SummaryJobService._instance
+
+    @staticmethod
+    def make_job_id(url: str) -> str:
+        """
+        기사 URL로 작업 ID 생성 (정규화된 URL이 같으면 같은 ID)
+
+        Args:
+            url: 기사 URL
+
+        Returns:
+            16진수 작업 ID
+        """
+        return hashlib.sha256(canonicalize_url(url).encode('utf-8')).hexdigest()[:16]
+
+    def submit_cluster(self, cluster: Dict) -> str:
+        """
+        기사 묶음 요약 작업 등록
+
+        대표 뉴스 URL이 같은 작업이 진행 중이거나 성공한 채 보관 중이면 그 작업을 재사용합니다.
+
+        Args:
+            cluster: NewsDeduplicator.cluster_news 형식의 묶음
+
+        Returns:
+            작업 ID
+        """
+        representative = cluster['representative']
+        url = representative.get('originallink') or representative.get('link', '')
+        return self._submit(self.make_job_id(url), self.ai_service.summarize_cluster, cluster)
+
+    def submit_url(self, url: str) -> str:
+        """
+        기사 URL 하나의 요약 작업 등록 (중복 처리는 submit_cluster와 동일)
+
+        Args:
+            url: 뉴스 기사 URL
+
+        Returns:
+            작업 ID
+        """
+        return self._submit(self.make_job_id(url), self.ai_service.summarize_news_from_url, url)
+
+    def _submit(self, job_id: str, func, arg) -> str:
+        """작업 등록 (같은 ID의 작업이 유효하면 재사용)"""
+        with self._lock:
+            self._expire()
+
+            job = self._jobs.get(job_id)
+            if job is not None and job.status != SummaryJob.FAILED:
+                return job_id
+
+            job = SummaryJob(job_id)
+            self._jobs[job_id] = job
+
+        self._executor.submit(self._run, job, func, arg)
+        return job_id
+
+    def _run(self, job: SummaryJob, func, arg) -> None:
+        """작업 스레드에서 요약 실행"""
+        job.status = SummaryJob.RUNNING
+        try:
+            result = func(arg, job.parts.append)
+        except Exception as e:
+            logger.error(f"요약 작업 실패: {str(e)}")
+            result = {
+                'success': False,
+                'error': f'처리 중 오류 발생: {str(e)}'
+            }
+
+        with self._lock:
+            job.result = result
+            job.finished_at = time.time()
+            job.status = SummaryJob.DONE if result.get('success') else SummaryJob.FAILED
+
+    def _expire(self) -> None:
+        """보관 시간이 지난 완료 작업 삭제 (잠금 보유 상태에서 호출)"""
+        now = time.time()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished and now - job.finished_at >= self.job_ttl
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """
+        작업 상태 조회
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            {'id', 'status', 'partial', 'result'} 딕셔너리 (없거나 만료되면 None)
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.snapshot() if job else None
+
+    def poll(self, job_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        여러 작업 상태를 한 번에 조회
+
+        Args:
+            job_ids: 작업 ID 리스트
+
+        Returns:
+            {작업 ID: 상태 딕셔너리 또는 None} 딕셔너리
+        """
+        return {job_id: self.get(job_id) for job_id in job_ids}
+
+    def stats(self) -> Dict[str, int]:
+        """
+        상태별 작업 수
+
+        Returns:
+            {'pending', 'running', 'done', 'failed'} 카운터
+        """
+        counts = dict.fromkeys(
+            (SummaryJob.PENDING, SummaryJob.RUNNING, SummaryJob.DONE, SummaryJob.FAILED), 0
+        )
+        with self._lock:
+            for job in self._jobs.values():
+                counts[job.status] += 1
+        return counts
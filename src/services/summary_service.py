@@ -1,5 +1,6 @@
 """뉴스 요약 처리 서비스"""
 from typing import Dict, List
+from src.utils.formatter import get_features
 
 
 class SummaryService:
@@ -25,18 +26,18 @@ class SummaryService:
         """
         뉴스 리스트의 요약 생성
 
+        항목을 복사하지 않고 각 항목의 summary 필드에 바로 기록합니다.
+        (세션에 누적된 뉴스와 중복 제거기가 같은 항목 객체를 공유)
+
         Args:
             news_items: 뉴스 항목 리스트
 
         Returns:
-            요약이 포함된 뉴스 항목 리스트
+            요약이 포함된 뉴스 항목 리스트 (입력과 같은 항목 객체)
         """
-        result = []
         for item in news_items:
-            summary_item = item.copy()
-            summary_item['summary'] = SummaryService.create_simple_summary(item)
-            result.append(summary_item)
-        return result
+            item['summary'] = SummaryService.create_simple_summary(item)
+        return list(news_items)
 
     @staticmethod
     def get_keywords_from_titles(news_items: List[Dict]) -> List[str]:
@@ -49,12 +50,10 @@ class SummaryService:
         Returns:
             키워드 리스트
         """
-        # 제목들을 합쳐서 단어로 분리
+        # 제목들을 합쳐서 단어로 분리 (수집 시 분리해 둔 제목 단어 사용)
         all_words = []
         for item in news_items:
-            title = item.get('title', '')
-            words = title.split()
-            all_words.extend(words)
+            all_words.extend(get_features(item).title_tokens)
 
         # 단어 빈도 계산 (간단한 구현)
         word_count = {}
@@ -0,0 +1,153 @@
+"""크롤링한 기사 본문 디스크 캐시 모듈"""
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from src.utils.formatter import canonicalize_url
+from src.utils.metrics import METRICS
+
+
+class ArticleCache:
+    """
+    SQLite 기반 기사 본문 캐시
+
+    정규화된 URL을 키로 추출된 본문과 ETag/Last-Modified를 저장합니다.
+    TTL이 지난 항목은 조건부 GET으로 재검증하는 데 사용하고,
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다.
+    """
+
+    def __init__(self, path: str, ttl: int = 21600, max_bytes: int = 200 * 1024 * 1024):
+        """
+        Args:
+            path: SQLite 파일 경로
+            ttl: 재검증 없이 사용할 수 있는 시간 (초)
+            max_bytes: 저장할 본문의 최대 총 크기 (바이트)
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        with self._lock, self._conn:
+            # 여러 프로세스(Streamlit 워커 등)가 같은 파일을 읽고 쓸 수 있도록 WAL 사용
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS articles (
+                    url TEXT PRIMARY KEY,
+                    content TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )"""
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_articles_accessed ON articles (accessed_at)"
+            )
+
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        캐시 항목 조회
+
+        Args:
+            url: 기사 URL
+
+        Returns:
+            {'content', 'etag', 'last_modified', 'fresh'} 딕셔너리 (없으면 None)
+            - fresh: TTL 이내 여부 (False면 조건부 GET으로 재검증 필요)
+        """
+        key = canonicalize_url(url)
+        now = time.time()
+
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT content, etag, last_modified, fetched_at FROM articles WHERE url = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None:
+                METRICS.incr('cache_lookups', cache='article', result='miss')
+                return None
+
+            self._conn.execute(
+                "UPDATE articles SET accessed_at = ? WHERE url = ?",
+                (now, key)
+            )
+
+        content, etag, last_modified, fetched_at = row
+        fresh = now - fetched_at < self.ttl
+        METRICS.incr('cache_lookups', cache='article', result='hit' if fresh else 'stale')
+        return {
+            'content': content,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fresh': fresh
+        }
+
+    def put(
+        self,
+        url: str,
+        content: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """
+        캐시 항목 저장 (크기 초과 시 LRU 삭제)
+
+        Args:
+            url: 기사 URL
+            content: 추출된 본문
+            etag: 응답의 ETag 헤더
+            last_modified: 응답의 Last-Modified 헤더
+        """
+        key = canonicalize_url(url)
+        now = time.time()
+        size = len(content.encode('utf-8'))
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO articles
+                   (url, content, etag, last_modified, fetched_at, accessed_at, size)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (key, content, etag, last_modified, now, now, size)
+            )
+            self._evict()
+
+    def touch(self, url: str) -> None:
+        """
+        재검증 성공(304) 시 TTL 갱신
+
+        Args:
+            url: 기사 URL
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE articles SET fetched_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, canonicalize_url(url))
+            )
+
+    def _evict(self) -> None:
+        """총 크기가 max_bytes 이하가 될 때까지 오래 사용되지 않은 항목 삭제 (잠금 보유 상태에서 호출)"""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM articles").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT url, size FROM articles ORDER BY accessed_at ASC"
+        ).fetchall()
+        expired = []
+        for url, size in rows:
+            if total <= self.max_bytes:
+                break
+            expired.append((url,))
+            total -= size
+
+        self._conn.executemany("DELETE FROM articles WHERE url = ?", expired)
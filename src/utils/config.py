@@ -1,6 +1,13 @@
 """환경 설정 관리 모듈"""
 import os
-from dotenv import load_dotenv
+from typing import List
+from dotenv import load_dotenv, dotenv_values, find_dotenv
+
+# 재시작 없이 다시 읽을 수 있는 인증 정보 (reload_credentials 참고)
+CREDENTIAL_KEYS = ('NAVER_CLIENT_ID', 'NAVER_CLIENT_SECRET', 'OPENAI_API_KEY')
+
+# .env 로드 전에 프로세스 환경 변수로 지정된 인증 정보 (.env보다 우선)
+_PROCESS_CREDENTIALS = {key: os.environ[key] for key in CREDENTIAL_KEYS if key in os.environ}
 
 # .env 파일 로드
 load_dotenv()
@@ -12,6 +19,61 @@ NAVER_CLIENT_SECRET = os.getenv('NAVER_CLIENT_SECRET')
 # OpenAI API 인증 정보
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 
+# HTTP 연결 풀 설정
+HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', '50'))  # 보관할 호스트별 풀 개수
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', '10'))  # 호스트당 최대 연결 수
+
+# 네이버 검색 응답 캐시 설정
+NAVER_CACHE_TTL_DATE = int(os.getenv('NAVER_CACHE_TTL_DATE', '60'))  # 날짜순 검색 TTL (초)
+NAVER_CACHE_TTL_SIM = int(os.getenv('NAVER_CACHE_TTL_SIM', '600'))  # 정확도순 검색 TTL (초)
+NAVER_CACHE_STALE_TTL = int(os.getenv('NAVER_CACHE_STALE_TTL', '300'))  # 백그라운드 갱신 중 오래된 응답 허용 시간 (초)
+NAVER_CACHE_MAX_ENTRIES = int(os.getenv('NAVER_CACHE_MAX_ENTRIES', '1000'))
+
+# 네이버 검색 페이지 동시 요청 수 (중복 제거로 여러 페이지가 필요할 때 미리 요청, 1이면 순차 요청)
+NAVER_PREFETCH_PAGES = int(os.getenv('NAVER_PREFETCH_PAGES', '3'))
+
+# 크롤러 다운로드 설정
+CRAWLER_MAX_DOWNLOAD_BYTES = int(os.getenv('CRAWLER_MAX_DOWNLOAD_BYTES', str(2 * 1024 * 1024)))  # 기사당 최대 다운로드 크기
+CRAWLER_CHARSET_DETECT_BYTES = int(os.getenv('CRAWLER_CHARSET_DETECT_BYTES', str(64 * 1024)))  # 인코딩 감지에 사용할 앞부분 크기
+CRAWLER_EXTRACT_WORKERS = int(os.getenv('CRAWLER_EXTRACT_WORKERS', str(os.cpu_count() or 1)))  # 본문 추출 프로세스 수 (0이면 다운로드 스레드에서 추출)
+CRAWLER_EXTRACT_MAX_BYTES = int(os.getenv('CRAWLER_EXTRACT_MAX_BYTES', str(2 * 1024 * 1024)))  # 추출 프로세스로 보낼 최대 HTML 크기 (초과 시 다운로드 스레드에서 추출)
+
+# 기사 본문 캐시 설정
+ARTICLE_CACHE_ENABLED = os.getenv('ARTICLE_CACHE_ENABLED', 'true').lower() == 'true'
+ARTICLE_CACHE_PATH = os.getenv('ARTICLE_CACHE_PATH', '.cache/articles.sqlite3')
+ARTICLE_CACHE_TTL = int(os.getenv('ARTICLE_CACHE_TTL', '21600'))  # 재검증 주기 (초)
+ARTICLE_CACHE_MAX_MB = int(os.getenv('ARTICLE_CACHE_MAX_MB', '200'))  # 최대 저장 크기 (MB)
+
+# AI 요약 캐시 설정
+SUMMARY_CACHE_ENABLED = os.getenv('SUMMARY_CACHE_ENABLED', 'true').lower() == 'true'
+SUMMARY_CACHE_PATH = os.getenv('SUMMARY_CACHE_PATH', '.cache/summaries.sqlite3')
+SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv('SUMMARY_CACHE_MAX_ENTRIES', '5000'))
+SUMMARY_CACHE_TTL = int(os.getenv('SUMMARY_CACHE_TTL', '604800'))  # 유효 시간 (초)
+
+# AI 배치 요약 설정 (여러 기사를 한 번에 요약할 때 짧은 기사를 묶어 요청)
+SUMMARY_BATCH_TOKENS = int(os.getenv('SUMMARY_BATCH_TOKENS', '6000'))  # 배치 요청당 본문 토큰 예산 (0이면 기사마다 개별 요청)
+
+# 백그라운드 AI 요약 작업 설정
+SUMMARY_JOB_WORKERS = int(os.getenv('SUMMARY_JOB_WORKERS', '5'))  # 프로세스 전체 동시 작업 수
+SUMMARY_JOB_TTL = int(os.getenv('SUMMARY_JOB_TTL', '600'))  # 완료된 작업 보관 시간 (초)
+
+# API 호출 속도 제한 설정 (같은 파일을 쓰는 모든 세션/프로세스가 공유)
+RATE_LIMIT_ENABLED = os.getenv('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+RATE_LIMIT_PATH = os.getenv('RATE_LIMIT_PATH', '.cache/rate_limits.sqlite3')
+RATE_LIMIT_MAX_WAIT = float(os.getenv('RATE_LIMIT_MAX_WAIT', '30'))  # 호출 슬롯을 기다릴 최대 시간 (초)
+RATE_LIMIT_MAX_RETRIES = int(os.getenv('RATE_LIMIT_MAX_RETRIES', '3'))  # 429 응답 시 재시도 횟수
+NAVER_RATE_PER_SEC = float(os.getenv('NAVER_RATE_PER_SEC', '10'))  # 네이버 검색 API 초당 호출 수
+NAVER_DAILY_QUOTA = int(os.getenv('NAVER_DAILY_QUOTA', '25000'))  # 네이버 검색 API 일일 호출 한도 (0이면 제한 없음)
+NAVER_QUOTA_LOW_WATERMARK = int(os.getenv('NAVER_QUOTA_LOW_WATERMARK', '500'))  # 이보다 적게 남으면 페이지 요청 축소
+OPENAI_RPM = int(os.getenv('OPENAI_RPM', '500'))  # OpenAI 분당 요청 수 한도
+OPENAI_TPM = int(os.getenv('OPENAI_TPM', '200000'))  # OpenAI 분당 토큰 수 한도
+
+# 계측(단계별 소요 시간, 카운터) 설정
+METRICS_LOG_ENABLED = os.getenv('METRICS_LOG_ENABLED', 'false').lower() == 'true'  # JSON 구조화 로그 출력
+METRICS_EXPORT_PATH = os.getenv('METRICS_EXPORT_PATH', '')  # 주기적으로 내보낼 파일 (.prom이면 Prometheus 형식)
+METRICS_EXPORT_INTERVAL = int(os.getenv('METRICS_EXPORT_INTERVAL', '15'))  # 내보내기 주기 (초)
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()  # 진행 상황/오류 진단 로그 수준 (표준 에러로 출력)
+
 def validate_config():
     """필수 환경 변수 검증"""
     if not NAVER_CLIENT_ID or not NAVER_CLIENT_SECRET:
@@ -29,3 +91,33 @@ def validate_openai_config():
             ".env 파일에 OPENAI_API_KEY를 설정하세요."
         )
     return True
+
+def dotenv_path() -> str:
+    """사용 중인 .env 파일 경로 (없으면 빈 문자열)"""
+    return find_dotenv()
+
+def reload_credentials() -> List[str]:
+    """
+    .env 파일의 API 인증 정보를 다시 읽어 모듈 변수 갱신 (재시작 없이 키 교체)
+
+    시작할 때(load_dotenv)와 같이 프로세스 환경 변수가 우선하고, 없는 키만 .env 값을 사용합니다.
+    os.environ은 바꾸지 않습니다. 인증 정보를 사용하는 클라이언트는 생성 시점의 값을 보관하므로 다시 만들어야 반영됩니다.
+    (ServiceContainer.refresh 참고)
+
+    Returns:
+        값이 바뀐 키 리스트
+    """
+    file_values = dotenv_values(dotenv_path())
+    changed = []
+    for key in CREDENTIAL_KEYS:
+        if key in _PROCESS_CREDENTIALS:
+            value = _PROCESS_CREDENTIALS[key]
+        else:
+            value = file_values.get(key)
+
+        if globals()[key] != value:
+            # 빈 값과 미설정은 같은 것으로 보고 변경 여부 판단
+            if (globals()[key] or None) != (value or None):
+                changed.append(key)
+            globals()[key] = value
+    return changed
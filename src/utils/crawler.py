@@ -1,8 +1,33 @@
 """뉴스 웹페이지 크롤링 모듈"""
+import asyncio
+import multiprocessing
+import random
+import re
 import requests
+from requests.compat import chardet
 from bs4 import BeautifulSoup
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+import threading
 import time
+from src.utils.article_cache import ArticleCache
+from src.utils.config import (
+    ARTICLE_CACHE_ENABLED, ARTICLE_CACHE_PATH, ARTICLE_CACHE_TTL, ARTICLE_CACHE_MAX_MB,
+    CRAWLER_MAX_DOWNLOAD_BYTES, CRAWLER_CHARSET_DETECT_BYTES,
+    CRAWLER_EXTRACT_WORKERS, CRAWLER_EXTRACT_MAX_BYTES
+)
+from src.utils.extraction_rules import EXTRACTION_RULES, parse_html, clean_element, element_text
+from src.utils.http_client import get_session
+from src.utils.metrics import METRICS, get_logger
+
+logger = get_logger('crawler')
+
+
+# charset 선언 패턴 (HTTP 헤더, HTML meta 태그)
+CHARSET_HEADER_PATTERN = re.compile(r'charset=([^;\s]+)', re.IGNORECASE)
+CHARSET_META_PATTERN = re.compile(rb'<meta[^>]+charset=["\']?([a-zA-Z0-9_\-]+)', re.IGNORECASE)
 
 
 class NewsCrawler:
@@ -16,6 +41,406 @@ class NewsCrawler:
         'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15',
     ]
 
+    # 기사 1건당 다운로드 최대 크기 및 인코딩 감지에 사용할 앞부분 크기 (바이트)
+    MAX_DOWNLOAD_BYTES = CRAWLER_MAX_DOWNLOAD_BYTES
+    CHARSET_DETECT_BYTES = CRAWLER_CHARSET_DETECT_BYTES
+
+    # 본문 추출 프로세스 수와 프로세스로 보낼 최대 HTML 크기 (바이트)
+    EXTRACT_WORKERS = CRAWLER_EXTRACT_WORKERS
+    EXTRACT_MAX_BYTES = CRAWLER_EXTRACT_MAX_BYTES
+
+    # 본문으로 인정할 최소 길이 (자)
+    MIN_CONTENT_LENGTH = 100
+
+    # 프로세스 전체에서 공유하는 기사 본문 캐시 (get_cache()로 지연 생성)
+    _cache: Optional[ArticleCache] = None
+    _cache_lock = threading.Lock()
+
+    # 프로세스 전체에서 공유하는 본문 추출 프로세스 풀 (get_extract_pool()로 지연 생성)
+    _extract_pool: Optional[ProcessPoolExecutor] = None
+    _extract_pool_lock = threading.Lock()
+
+    @staticmethod
+    def get_cache() -> Optional[ArticleCache]:
+        """
+        기사 본문 캐시 반환
+
+        Returns:
+            ArticleCache 인스턴스 (ARTICLE_CACHE_ENABLED가 false면 None)
+        """
+        if not ARTICLE_CACHE_ENABLED:
+            return None
+
+        with NewsCrawler._cache_lock:
+            if NewsCrawler._cache is None:
+                NewsCrawler._cache = ArticleCache(
+                    ARTICLE_CACHE_PATH,
+                    ttl=ARTICLE_CACHE_TTL,
+                    max_bytes=ARTICLE_CACHE_MAX_MB * 1024 * 1024
+                )
+            return NewsCrawler._cache
+
+    @staticmethod
+    def get_extract_pool() -> Optional[ProcessPoolExecutor]:
+        """
+        본문 추출 프로세스 풀 반환
+
+        BeautifulSoup/lxml 파싱과 텍스트 정제는 GIL을 잡는 CPU 작업이므로 다운로드 스레드가 아닌
+        별도 프로세스에서 실행합니다. 스트림릿/다운로드 스레드가 있는 상태에서 fork하지 않도록
+        spawn 방식으로 작업 프로세스를 시작합니다.
+
+        Returns:
+            ProcessPoolExecutor 인스턴스 (EXTRACT_WORKERS가 0 이하면 None)
+        """
+        if NewsCrawler.EXTRACT_WORKERS <= 0:
+            return None
+
+        with NewsCrawler._extract_pool_lock:
+            if NewsCrawler._extract_pool is None:
+                NewsCrawler._extract_pool = ProcessPoolExecutor(
+                    max_workers=NewsCrawler.EXTRACT_WORKERS,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return NewsCrawler._extract_pool
+
+    @staticmethod
+    def extract_pool_size() -> int:
+        """
+        실행 중인 본문 추출 프로세스 풀의 프로세스 수 (상태 표시용)
+
+        Returns:
+            프로세스 수 (풀이 아직 없거나 사용하지 않으면 0)
+        """
+        with NewsCrawler._extract_pool_lock:
+            return NewsCrawler.EXTRACT_WORKERS if NewsCrawler._extract_pool else 0
+
+    @staticmethod
+    def _discard_extract_pool(pool: ProcessPoolExecutor) -> None:
+        """손상된 프로세스 풀 폐기 (다음 요청 때 새로 생성)"""
+        with NewsCrawler._extract_pool_lock:
+            if NewsCrawler._extract_pool is pool:
+                NewsCrawler._extract_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _store(cache: Optional[ArticleCache], url: str, text: str, response) -> str:
+        """추출한 본문을 응답의 검증자(ETag, Last-Modified)와 함께 캐시에 저장"""
+        if cache:
+            cache.put(
+                url,
+                text,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified')
+            )
+        return text
+
+    @staticmethod
+    def _read_content(response, url: str) -> bytes:
+        """
+        응답 본문을 최대 MAX_DOWNLOAD_BYTES까지만 스트리밍으로 읽기
+
+        Args:
+            response: stream=True로 요청한 응답
+            url: 기사 URL (로그용)
+
+        Returns:
+            HTML 원본 바이트
+        """
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= NewsCrawler.MAX_DOWNLOAD_BYTES:
+                logger.warning(f"⚠ 다운로드 크기 제한 도달: {size:,}바이트에서 중단 - {url[:50]}...")
+                break
+        return b''.join(chunks)[:NewsCrawler.MAX_DOWNLOAD_BYTES]
+
+    @staticmethod
+    def decode_html(content: bytes, content_type: str = '') -> str:
+        """
+        HTML 원본 바이트 디코딩
+
+        인코딩은 HTTP 헤더 → <meta charset> 순서로 확인하고,
+        둘 다 없을 때만 앞부분 CHARSET_DETECT_BYTES 바이트로 통계적 감지를 수행합니다.
+
+        Args:
+            content: HTML 원본 바이트
+            content_type: 응답의 Content-Type 헤더
+
+        Returns:
+            디코딩된 HTML 문자열
+        """
+        encoding = (
+            NewsCrawler._charset_from_header(content_type) or
+            NewsCrawler._charset_from_meta(content[:4096])
+        )
+        if not encoding:
+            detected = chardet.detect(content[:NewsCrawler.CHARSET_DETECT_BYTES])
+            encoding = detected.get('encoding') or 'utf-8'
+
+        # EUC-KR로 선언한 국내 사이트도 확장 완성형(CP949) 문자를 쓰는 경우가 많음
+        if encoding.lower().replace('_', '-') in ('euc-kr', 'ks-c-5601-1987', 'ksc5601'):
+            encoding = 'cp949'
+
+        try:
+            return content.decode(encoding, errors='replace')
+        except LookupError:
+            # 알 수 없는 인코딩 이름
+            return content.decode('utf-8', errors='replace')
+
+    @staticmethod
+    def _charset_from_header(content_type: str) -> Optional[str]:
+        """Content-Type 헤더의 charset 값 (없으면 None)"""
+        match = CHARSET_HEADER_PATTERN.search(content_type)
+        return match.group(1).strip('"\'') if match else None
+
+    @staticmethod
+    def _charset_from_meta(head: bytes) -> Optional[str]:
+        """HTML 앞부분의 <meta charset> 또는 http-equiv 선언 (없으면 None)"""
+        match = CHARSET_META_PATTERN.search(head)
+        return match.group(1).decode('ascii', errors='ignore') if match else None
+
+    @staticmethod
+    def _extract_heuristic(html: str) -> Optional[str]:
+        """
+        등록된 추출 규칙이 없는 사이트의 본문 추출 (class/id 키워드 휴리스틱)
+
+        Args:
+            html: HTML 문자열
+
+        Returns:
+            정제된 본문 텍스트 (본문 요소를 찾지 못하면 None)
+        """
+        soup = BeautifulSoup(html, 'lxml')
+
+        article = (
+            soup.find('article', {'class': lambda x: x and 'article' in x.lower()}) or
+            soup.find('div', {'class': lambda x: x and any(kw in x.lower() for kw in ['article', 'content', 'body', 'post'])}) or
+            soup.find('article') or
+            soup.find('div', {'id': lambda x: x and any(kw in x.lower() for kw in ['article', 'content', 'main'])})
+        )
+
+        if not article:
+            return None
+
+        # 불필요한 태그 제거
+        for tag in article.find_all(['script', 'style', 'aside', 'nav', 'footer', 'iframe', 'form', 'button']):
+            tag.decompose()
+
+        # 광고, 관련기사 등 제거
+        for tag in article.find_all(['div', 'section'], {'class': lambda x: x and any(kw in str(x).lower() for kw in ['ad', 'banner', 'related', 'recommend'])}):
+            tag.decompose()
+
+        # 텍스트 추출 및 정제
+        text = article.get_text(separator='\n', strip=True)
+        # 빈 줄과 짧은 줄 제거
+        lines = [line.strip() for line in text.split('\n') if line.strip() and len(line.strip()) > 10]
+        return '\n'.join(lines)
+
+    @staticmethod
+    def extract_content(html: str, url: str) -> Tuple[Optional[str], str]:
+        """
+        HTML에서 기사 본문 추출 (등록된 사이트는 XPath 규칙, 나머지는 휴리스틱)
+
+        Args:
+            html: HTML 문자열
+            url: 기사 URL (추출 규칙 선택용)
+
+        Returns:
+            (본문 텍스트, 매칭 이름) 튜플 - 본문 요소를 찾지 못하면 본문은 None
+        """
+        rule = EXTRACTION_RULES.rule_for(url)
+
+        if rule:
+            # 등록된 사이트: 미리 컴파일된 XPath로 본문 요소 탐색
+            article, xpath = rule.find(parse_html(html))
+            if article is None:
+                return None, f"{rule.name}:none"
+            clean_element(article)
+            return element_text(article), f"{rule.name}:{xpath}"
+
+        # 등록되지 않은 사이트: 일반 휴리스틱
+        full_text = NewsCrawler._extract_heuristic(html)
+        return full_text, 'heuristic' if full_text is not None else 'heuristic:none'
+
+    @staticmethod
+    def extract_payload(
+        content: bytes,
+        content_type: str,
+        url: str,
+        body_fallback: bool = False
+    ) -> Tuple[Optional[str], str, Optional[str]]:
+        """
+        다운로드한 HTML 원본에서 본문 추출 (추출 프로세스에서 실행)
+
+        Args:
+            content: HTML 원본 바이트
+            content_type: 응답의 Content-Type 헤더 (인코딩 판단용)
+            url: 기사 URL (추출 규칙 선택용)
+            body_fallback: 본문이 없거나 짧으면 body 전체 텍스트도 추출할지 여부
+
+        Returns:
+            (본문 텍스트, 매칭 이름, body 텍스트) 튜플
+        """
+        html = NewsCrawler.decode_html(content, content_type)
+        full_text, match_name = NewsCrawler.extract_content(html, url)
+
+        body_text = None
+        if body_fallback and (full_text is None or len(full_text) < NewsCrawler.MIN_CONTENT_LENGTH):
+            body_text = NewsCrawler.extract_body_text(html)
+        return full_text, match_name, body_text
+
+    @staticmethod
+    def _extract(
+        content: bytes,
+        content_type: str,
+        url: str,
+        body_fallback: bool
+    ) -> Tuple[Optional[str], str, Optional[str], bool]:
+        """
+        추출 프로세스 풀에서 본문 추출 (풀이 없거나 HTML이 EXTRACT_MAX_BYTES보다 크면 현재 스레드에서 추출)
+
+        다운로드 스레드는 결과를 기다리는 동안 GIL을 놓으므로 다른 기사의 다운로드가 계속 진행됩니다.
+
+        Returns:
+            (본문 텍스트, 매칭 이름, body 텍스트, 프로세스 풀 사용 여부) 튜플
+        """
+        args = (content, content_type, url, body_fallback)
+        pool = NewsCrawler.get_extract_pool()
+
+        if pool is not None and len(content) <= NewsCrawler.EXTRACT_MAX_BYTES:
+            try:
+                return pool.submit(NewsCrawler.extract_payload, *args).result() + (True,)
+            except BrokenProcessPool:
+                # 작업 프로세스가 비정상 종료된 경우 (메모리 부족 등)
+                logger.warning(f"⚠ 본문 추출 프로세스 오류: 현재 스레드에서 추출 - {url[:50]}...")
+                NewsCrawler._discard_extract_pool(pool)
+
+        return NewsCrawler.extract_payload(*args) + (False,)
+
+    @staticmethod
+    def extract_body_text(html: str) -> Optional[str]:
+        """
+        본문 요소를 찾지 못했을 때 사용할 body 전체 텍스트 추출
+
+        Args:
+            html: HTML 문자열
+
+        Returns:
+            body 텍스트 (짧은 줄 제외, body가 없으면 None)
+        """
+        body = parse_html(html).find('body')
+        return element_text(body, min_line_length=20) if body is not None else None
+
+    @staticmethod
+    def _fetch_attempt(
+        url: str,
+        attempt: int,
+        retry_count: int,
+        cache: Optional[ArticleCache],
+        cached: Optional[Dict]
+    ) -> Tuple[Optional[str], Optional[float]]:
+        """
+        본문 다운로드 및 추출 1회 시도
+
+        Args:
+            url: 뉴스 기사 URL
+            attempt: 현재 시도 번호 (0부터 시작)
+            retry_count: 재시도 횟수
+            cache: 기사 본문 캐시
+            cached: 캐시에 있던 (오래된) 항목
+
+        Returns:
+            (본문, 재시도 전 대기 시간) 튜플
+            - 본문이 None이 아니면 성공
+            - 대기 시간이 None이면 더 이상 재시도하지 않음
+        """
+        if attempt > 0:
+            METRICS.incr('retries', stage='crawl')
+
+        try:
+            # User-Agent 로테이션
+            headers = {
+                'User-Agent': NewsCrawler.USER_AGENTS[attempt % len(NewsCrawler.USER_AGENTS)],
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1',
+            }
+            if cached:
+                if cached['etag']:
+                    headers['If-None-Match'] = cached['etag']
+                if cached['last_modified']:
+                    headers['If-Modified-Since'] = cached['last_modified']
+
+            with METRICS.span('crawl_download') as span:
+                response = get_session('crawler').get(
+                    url, headers=headers, timeout=15, allow_redirects=True, stream=True
+                )
+                span['status'] = response.status_code
+
+                try:
+                    # 변경되지 않은 기사는 캐시된 본문 재사용
+                    if cached and response.status_code == 304:
+                        cache.touch(url)
+                        METRICS.incr('cache_lookups', cache='article', result='revalidated')
+                        logger.info(f"✓ 캐시 재검증: {len(cached['content'])}자 - {url[:50]}...")
+                        return cached['content'], None
+
+                    response.raise_for_status()
+                    content = NewsCrawler._read_content(response, url)
+                finally:
+                    # 스트리밍 응답은 다 읽지 않았을 수 있으므로 연결을 명시적으로 반환
+                    response.close()
+                span['bytes'] = len(content)
+
+            # 디코딩과 본문 추출은 프로세스 풀에서 실행 (마지막 시도면 body 전체 텍스트까지 한 번에 추출)
+            with METRICS.span('crawl_parse') as span:
+                full_text, match_name, body_text, in_process_pool = NewsCrawler._extract(
+                    content, response.headers.get('Content-Type', ''), url, attempt >= retry_count
+                )
+                span['rule'] = match_name
+                span['pool'] = in_process_pool
+
+            if full_text is not None:
+                # 최소 길이 체크
+                if len(full_text) >= NewsCrawler.MIN_CONTENT_LENGTH:
+                    EXTRACTION_RULES.record(match_name)
+                    logger.info(f"✓ 크롤링 성공: {len(full_text)}자 추출 ({match_name}) - {url[:50]}...")
+                    return NewsCrawler._store(cache, url, full_text, response), None
+                else:
+                    logger.info(f"본문 길이 부족: {len(full_text)}자 (재시도 {attempt + 1}/{retry_count + 1}) - {url[:50]}...")
+
+            # 본문을 찾지 못한 경우
+            if attempt < retry_count:
+                logger.info(f"본문 요소를 찾을 수 없음 (재시도 {attempt + 1}/{retry_count + 1}) - {url[:50]}...")
+                return None, 1.0
+
+            logger.warning(f"✗ 크롤링 최종 실패: 본문 요소를 찾을 수 없음 - {url[:50]}...")
+            # 마지막 시도로 전체 body 텍스트 사용
+            if body_text and len(body_text) >= NewsCrawler.MIN_CONTENT_LENGTH:
+                EXTRACTION_RULES.record('body')
+                logger.warning(f"⚠ body 전체에서 추출: {len(body_text)}자 - {url[:50]}...")
+                return NewsCrawler._store(cache, url, body_text, response), None
+            EXTRACTION_RULES.record(match_name)
+            METRICS.incr('failures', stage='crawl', reason='no_content')
+            return None, None
+
+        except requests.exceptions.Timeout:
+            METRICS.incr('failures', stage='crawl', reason='timeout')
+            logger.warning(f"타임아웃 (재시도 {attempt + 1}/{retry_count + 1}) - {url[:50]}...")
+            return None, 2.0
+        except requests.exceptions.RequestException as e:
+            METRICS.incr('failures', stage='crawl', reason='network')
+            logger.warning(f"네트워크 오류 (재시도 {attempt + 1}/{retry_count + 1}): {str(e)} - {url[:50]}...")
+            return None, 2.0
+        except Exception as e:
+            METRICS.incr('failures', stage='crawl', reason='error')
+            logger.warning(f"크롤링 오류 (재시도 {attempt + 1}/{retry_count + 1}): {str(e)} - {url[:50]}...")
+            return None, 1.0
+
     @staticmethod
     def fetch_article_content(url: str, retry_count: int = 2) -> Optional[str]:
         """
@@ -28,106 +453,98 @@ class NewsCrawler:
         Returns:
             뉴스 본문 텍스트 (실패 시 None)
         """
+        # 캐시 확인 (TTL 이내면 바로 반환, 지났으면 조건부 GET으로 재검증)
+        cache = NewsCrawler.get_cache()
+        cached = cache.get(url) if cache else None
+        if cached and cached['fresh']:
+            logger.info(f"✓ 캐시 사용: {len(cached['content'])}자 - {url[:50]}...")
+            return cached['content']
+
         for attempt in range(retry_count + 1):
-            try:
-                # User-Agent 로테이션
-                headers = {
-                    'User-Agent': NewsCrawler.USER_AGENTS[attempt % len(NewsCrawler.USER_AGENTS)],
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                }
-
-                response = requests.get(url, headers=headers, timeout=15, allow_redirects=True)
-                response.raise_for_status()
-                response.encoding = response.apparent_encoding
-
-                soup = BeautifulSoup(response.text, 'html.parser')
-
-                article = None
-
-                # 네이버 뉴스 본문 추출 (여러 가지 선택자 시도)
-                if 'news.naver.com' in url:
-                    # 최신 네이버 뉴스
-                    article = soup.find('article', {'id': 'dic_area'})
-                    if not article:
-                        article = soup.find('div', {'id': 'articleBodyContents'})
-                    if not article:
-                        article = soup.find('div', {'class': 'article_body'})
-                    if not article:
-                        article = soup.find('div', {'class': 'article_viewer'})
-                    if not article:
-                        # 엔터 뉴스
-                        article = soup.find('div', {'id': 'articeBody'})
-                else:
-                    # 일반 뉴스 사이트
-                    article = (
-                        soup.find('article', {'class': lambda x: x and 'article' in x.lower()}) or
-                        soup.find('div', {'class': lambda x: x and any(kw in x.lower() for kw in ['article', 'content', 'body', 'post'])}) or
-                        soup.find('article') or
-                        soup.find('div', {'id': lambda x: x and any(kw in x.lower() for kw in ['article', 'content', 'main'])})
-                    )
-
-                if article:
-                    # 불필요한 태그 제거
-                    for tag in article.find_all(['script', 'style', 'aside', 'nav', 'footer', 'iframe', 'form', 'button']):
-                        tag.decompose()
-
-                    # 광고, 관련기사 등 제거
-                    for tag in article.find_all(['div', 'section'], {'class': lambda x: x and any(kw in str(x).lower() for kw in ['ad', 'banner', 'related', 'recommend'])}):
-                        tag.decompose()
-
-                    # 텍스트 추출 및 정제
-                    text = article.get_text(separator='\n', strip=True)
-                    # 빈 줄과 짧은 줄 제거
-                    lines = [line.strip() for line in text.split('\n') if line.strip() and len(line.strip()) > 10]
-                    full_text = '\n'.join(lines)
-
-                    # 최소 길이 체크
-                    if len(full_text) >= 100:
-                        print(f"✓ 크롤링 성공: {len(full_text)}자 추출 - {url[:50]}...")
-                        return full_text
-                    else:
-                        print(f"본문 길이 부족: {len(full_text)}자 (재시도 {attempt + 1}/{retry_count + 1}) - {url[:50]}...")
-
-                # 본문을 찾지 못한 경우
-                if attempt < retry_count:
-                    print(f"본문 요소를 찾을 수 없음 (재시도 {attempt + 1}/{retry_count + 1}) - {url[:50]}...")
-                    time.sleep(1)  # 재시도 전 대기
-                    continue
-                else:
-                    print(f"✗ 크롤링 최종 실패: 본문 요소를 찾을 수 없음 - {url[:50]}...")
-                    # 마지막 시도로 전체 body 텍스트 추출
-                    body = soup.find('body')
-                    if body:
-                        text = body.get_text(separator='\n', strip=True)
-                        lines = [line.strip() for line in text.split('\n') if line.strip() and len(line.strip()) > 20]
-                        full_text = '\n'.join(lines)
-                        if len(full_text) >= 100:
-                            print(f"⚠ body 전체에서 추출: {len(full_text)}자 - {url[:50]}...")
-                            return full_text
-                    return None
-
-            except requests.exceptions.Timeout:
-                print(f"타임아웃 (재시도 {attempt + 1}/{retry_count + 1}) - {url[:50]}...")
-                if attempt < retry_count:
-                    time.sleep(2)
-                    continue
-            except requests.exceptions.RequestException as e:
-                print(f"네트워크 오류 (재시도 {attempt + 1}/{retry_count + 1}): {str(e)} - {url[:50]}...")
-                if attempt < retry_count:
-                    time.sleep(2)
-                    continue
-            except Exception as e:
-                print(f"크롤링 오류 (재시도 {attempt + 1}/{retry_count + 1}): {str(e)} - {url[:50]}...")
-                if attempt < retry_count:
-                    time.sleep(1)
-                    continue
-
-        print(f"✗ 최종 실패: 모든 재시도 소진 - {url[:50]}...")
-        return None
+            content, retry_delay = NewsCrawler._fetch_attempt(url, attempt, retry_count, cache, cached)
+            if content is not None:
+                return content
+            if retry_delay is None:
+                break
+            if attempt < retry_count:
+                time.sleep(retry_delay)  # 재시도 전 대기
+        else:
+            logger.warning(f"✗ 최종 실패: 모든 재시도 소진 - {url[:50]}...")
+
+        # 재검증에 실패하면 오래된 캐시라도 반환
+        return cached['content'] if cached else None
+
+    @staticmethod
+    async def afetch_many(
+        urls: List[str],
+        max_concurrency: int = 20,
+        per_domain_limit: int = 4,
+        retry_count: int = 2
+    ) -> AsyncIterator[Dict]:
+        """
+        여러 기사를 비동기로 동시에 크롤링하고 끝나는 순서대로 결과 반환
+
+        도메인별 동시 요청 수를 제한하고, 재시도 대기는 지터를 넣은 asyncio.sleep으로
+        처리하므로 대기 중에도 다른 기사의 크롤링이 계속 진행됩니다.
+        (다운로드는 연결 풀을 공유하는 작업 스레드, 본문 추출은 추출 프로세스 풀에서 실행)
+
+        Args:
+            urls: 뉴스 기사 URL 리스트
+            max_concurrency: 전체 동시 요청 수
+            per_domain_limit: 도메인별 동시 요청 수
+            retry_count: 재시도 횟수
+
+        Yields:
+            get_article_summary_info와 같은 형식의 결과 딕셔너리
+        """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=max(1, max_concurrency))
+        global_limit = asyncio.Semaphore(max_concurrency)
+        domain_limits: Dict[str, asyncio.Semaphore] = {}
+        cache = NewsCrawler.get_cache()
+
+        async def fetch_one(url: str) -> Dict:
+            cached = await loop.run_in_executor(executor, cache.get, url) if cache else None
+            content = None
+
+            if cached and cached['fresh']:
+                content = cached['content']
+            else:
+                domain = urlsplit(url).netloc.lower()
+                domain_limit = domain_limits.setdefault(domain, asyncio.Semaphore(per_domain_limit))
+
+                for attempt in range(retry_count + 1):
+                    # 대기(backoff) 중에는 슬롯을 점유하지 않도록 시도 단위로 획득
+                    async with domain_limit, global_limit:
+                        content, retry_delay = await loop.run_in_executor(
+                            executor,
+                            NewsCrawler._fetch_attempt,
+                            url, attempt, retry_count, cache, cached
+                        )
+                    if content is not None or retry_delay is None:
+                        break
+                    if attempt < retry_count:
+                        await asyncio.sleep(retry_delay * (attempt + 1) * random.uniform(0.5, 1.5))
+
+                if content is None and cached:
+                    content = cached['content']
+
+            return {
+                'url': url,
+                'content': content,
+                'success': content is not None,
+                'word_count': len(content) if content else 0
+            }
+
+        tasks = [loop.create_task(fetch_one(url)) for url in urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 호출 측이 중간에 멈추면 남은 작업 취소
+            for task in tasks:
+                task.cancel()
+            executor.shutdown(wait=False)
 
     @staticmethod
     def get_article_summary_info(url: str) -> dict:
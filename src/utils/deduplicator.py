@@ -1,11 +1,22 @@
 """뉴스 중복 제거 유틸리티"""
-from typing import List, Dict
+from bisect import bisect_right
+from typing import List, Dict, Tuple
 from difflib import SequenceMatcher
+import numpy as np
+from src.utils.minhash_lsh import MinHashLSH
+from src.utils.vector_similarity import NgramVectorizer, lower_bound, similarity_blocks
+from src.utils.formatter import get_news_outlet, get_features, parse_pub_date
 
 
 class NewsDeduplicator:
     """뉴스 중복 제거 클래스"""
 
+    # 지원하는 중복 제거 엔진
+    # - exact: 모든 쌍을 SequenceMatcher로 비교 (O(n²))
+    # - minhash: MinHash/LSH로 후보 쌍만 골라 SequenceMatcher로 비교
+    # - vector: 문자 n-gram 벡터의 코사인 유사도 행렬로 후보 쌍을 한 번에 걸러 SequenceMatcher로 비교
+    ENGINES = ("exact", "minhash", "vector")
+
     @staticmethod
     def calculate_similarity(text1: str, text2: str) -> float:
         """
@@ -21,32 +32,44 @@ class NewsDeduplicator:
         return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
 
     @staticmethod
-    def are_similar_news(news1: Dict, news2: Dict, threshold: float = 0.7) -> bool:
+    def similarity_score(news1: Dict, news2: Dict) -> float:
         """
-        두 뉴스가 유사한지 판단
+        두 뉴스의 유사도 (제목 유사도와 설명 유사도 중 큰 값)
 
         Args:
             news1: 첫 번째 뉴스
             news2: 두 번째 뉴스
-            threshold: 유사도 임계값 (기본값: 0.7)
 
         Returns:
-            유사 여부
+            유사도 (0.0 ~ 1.0)
         """
+        # 수집 시 만들어 둔 소문자 비교 문자열 사용
+        features1 = get_features(news1)
+        features2 = get_features(news2)
+
         # 제목 유사도 체크
-        title_similarity = NewsDeduplicator.calculate_similarity(
-            news1.get('title', ''),
-            news2.get('title', '')
-        )
+        title_similarity = SequenceMatcher(None, features1.norm_title, features2.norm_title).ratio()
 
         # 설명 유사도 체크
-        desc_similarity = NewsDeduplicator.calculate_similarity(
-            news1.get('description', ''),
-            news2.get('description', '')
-        )
+        desc_similarity = SequenceMatcher(None, features1.norm_description, features2.norm_description).ratio()
+
+        return max(title_similarity, desc_similarity)
+
+    @staticmethod
+    def are_similar_news(news1: Dict, news2: Dict, threshold: float = 0.7) -> bool:
+        """
+        두 뉴스가 유사한지 판단
+
+        Args:
+            news1: 첫 번째 뉴스
+            news2: 두 번째 뉴스
+            threshold: 유사도 임계값 (기본값: 0.7)
 
+        Returns:
+            유사 여부
+        """
         # 제목이나 설명 중 하나라도 임계값 이상이면 유사한 뉴스로 판단
-        return title_similarity >= threshold or desc_similarity >= threshold
+        return NewsDeduplicator.similarity_score(news1, news2) >= threshold
 
     @staticmethod
     def parse_pub_date(pub_date_str: str) -> int:
@@ -57,66 +80,460 @@ class NewsDeduplicator:
             pub_date_str: 발행일 문자열 (예: "Mon, 16 Oct 2023 10:30:00 +0900")
 
         Returns:
-            Unix timestamp (초)
+            Unix timestamp (초, 파싱 실패 시 현재 시각)
         """
-        from datetime import datetime
-        import email.utils
-
-        try:
-            # RFC 2822 형식 파싱
-            time_tuple = email.utils.parsedate_to_datetime(pub_date_str)
-            return int(time_tuple.timestamp())
-        except Exception:
-            # 파싱 실패 시 현재 시간 반환
-            return int(datetime.now().timestamp())
+        return parse_pub_date(pub_date_str)
 
     @staticmethod
-    def remove_duplicates(news_list: List[Dict], similarity_threshold: float = 0.7) -> List[Dict]:
+    def remove_duplicates(
+        news_list: List[Dict],
+        similarity_threshold: float = 0.7,
+        engine: str = "exact"
+    ) -> List[Dict]:
         """
         중복 뉴스 제거 (최신 뉴스 우선)
 
         Args:
             news_list: 뉴스 리스트
             similarity_threshold: 유사도 임계값
+            engine: 중복 제거 엔진 (exact: 전체 비교, minhash: LSH 후보 비교, vector: 벡터 후보 비교)
 
         Returns:
             중복 제거된 뉴스 리스트
         """
+        clusters = NewsDeduplicator.cluster_news(news_list, similarity_threshold, engine)
+        return [cluster['representative'] for cluster in clusters]
+
+    @staticmethod
+    def cluster_news(
+        news_list: List[Dict],
+        similarity_threshold: float = 0.7,
+        engine: str = "exact"
+    ) -> List[Dict]:
+        """
+        유사 뉴스를 같은 기사(스토리) 묶음으로 분류 (최신 뉴스가 대표)
+
+        remove_duplicates와 같은 기준으로 비교하되, 중복 뉴스를 버리지 않고
+        처음으로 유사하다고 판단된 대표 뉴스의 멤버로 기록합니다.
+
+        Args:
+            news_list: 뉴스 리스트
+            similarity_threshold: 유사도 임계값
+            engine: 중복 제거 엔진 (exact: 전체 비교, minhash: LSH 후보 비교, vector: 벡터 후보 비교)
+
+        Returns:
+            묶음 딕셔너리 리스트 (대표 뉴스 최신순)
+            - representative: 대표 뉴스
+            - members: [{'news', 'similarity'}] 대표와 유사한 뉴스 (유사도 내림차순)
+            - outlets: 묶음에 포함된 언론사 도메인 리스트
+        """
+        if engine not in NewsDeduplicator.ENGINES:
+            raise ValueError(f"지원하지 않는 중복 제거 엔진입니다: {engine}")
+
         if not news_list:
             return []
 
         # 발행일 기준으로 정렬 (최신순)
-        sorted_news = sorted(
-            news_list,
-            key=lambda x: NewsDeduplicator.parse_pub_date(x.get('pubDate', '')),
-            reverse=True
-        )
+        sorted_news = sorted(news_list, key=lambda x: get_features(x).timestamp, reverse=True)
+
+        if engine == "minhash":
+            groups = NewsDeduplicator._cluster_news_minhash(sorted_news, similarity_threshold)
+        elif engine == "vector":
+            groups = NewsDeduplicator._cluster_news_vector(sorted_news, similarity_threshold)
+        else:
+            groups = []
+            for news in sorted_news:
+                # 기존 대표 뉴스 중 처음으로 유사한 뉴스의 멤버로 추가
+                for representative, members in groups:
+                    score = NewsDeduplicator.similarity_score(news, representative)
+                    if score >= similarity_threshold:
+                        members.append({'news': news, 'similarity': score})
+                        break
+                else:
+                    groups.append((news, []))
+
+        return [
+            NewsDeduplicator.make_cluster(representative, members)
+            for representative, members in groups
+        ]
+
+    @staticmethod
+    def _cluster_news_minhash(sorted_news: List[Dict], similarity_threshold: float) -> List[tuple]:
+        """
+        MinHash/LSH 후보 탐색 기반 묶음 분류
+
+        제목과 설명 각각의 LSH 인덱스에서 후보를 찾고, 후보에 대해서만
+        정확한 유사도를 계산하므로 임계값 의미는 exact 엔진과 같습니다.
+        (LSH 특성상 유사도가 임계값에 가까운 쌍은 드물게 후보에서 누락될 수 있음)
 
-        unique_news = []
+        Args:
+            sorted_news: 발행일 기준으로 정렬된 뉴스 리스트
+            similarity_threshold: 유사도 임계값
+
+        Returns:
+            (대표 뉴스, 멤버 리스트) 튜플 리스트
+        """
+        title_index = MinHashLSH()
+        desc_index = MinHashLSH()
+
+        groups = []
         for news in sorted_news:
-            # 기존 리스트에 유사한 뉴스가 있는지 확인
-            is_duplicate = False
-            for unique in unique_news:
-                if NewsDeduplicator.are_similar_news(news, unique, similarity_threshold):
-                    is_duplicate = True
+            features = get_features(news)
+            title_sig = title_index.signature(features.norm_title)
+            desc_sig = desc_index.signature(features.norm_description)
+
+            candidates = title_index.query(title_sig) | desc_index.query(desc_sig)
+
+            # 먼저 추가된 뉴스부터 비교 (exact 엔진과 동일한 순서)
+            for idx in sorted(candidates):
+                representative, members = groups[idx]
+                score = NewsDeduplicator.similarity_score(news, representative)
+                if score >= similarity_threshold:
+                    members.append({'news': news, 'similarity': score})
                     break
+            else:
+                key = len(groups)
+                groups.append((news, []))
+                title_index.insert(key, title_sig)
+                desc_index.insert(key, desc_sig)
 
-            if not is_duplicate:
-                unique_news.append(news)
+        return groups
 
-        return unique_news
+    @staticmethod
+    def _cluster_news_vector(sorted_news: List[Dict], similarity_threshold: float) -> List[tuple]:
+        """
+        문자 n-gram 벡터 기반 묶음 분류
+
+        제목/설명 벡터의 코사인 유사도 행렬을 블록 단위로 계산하고, 보정된 하한
+        (vector_similarity.CALIBRATED_LOWER_BOUNDS) 이상인 대표 뉴스에 대해서만
+        정확한 유사도를 계산하므로 임계값 의미는 exact 엔진과 같습니다.
+        (하한은 참조 텍스트 쌍에서 측정한 값이므로 드물게 유사 쌍이 후보에서 누락될 수 있음)
+
+        Args:
+            sorted_news: 발행일 기준으로 정렬된 뉴스 리스트
+            similarity_threshold: 유사도 임계값
+
+        Returns:
+            (대표 뉴스, 멤버 리스트) 튜플 리스트
+        """
+        vectorizer = NgramVectorizer()
+        features = [get_features(news) for news in sorted_news]
+        title_vectors = vectorizer.transform([f.norm_title for f in features])
+        desc_vectors = vectorizer.transform([f.norm_description for f in features])
+        bound = lower_bound(similarity_threshold)
+
+        groups = []
+        # 대표 뉴스의 행 번호 (groups와 같은 순서)
+        rep_rows = np.empty(len(sorted_news), dtype=np.intp)
+        for start, block in similarity_blocks(title_vectors, desc_vectors):
+            for offset, row in enumerate(block):
+                news = sorted_news[start + offset]
+                candidates = np.flatnonzero(row[rep_rows[:len(groups)]] >= bound)
+
+                # 먼저 추가된 대표 뉴스부터 비교 (exact 엔진과 동일한 순서)
+                for idx in candidates:
+                    representative, members = groups[idx]
+                    score = NewsDeduplicator.similarity_score(news, representative)
+                    if score >= similarity_threshold:
+                        members.append({'news': news, 'similarity': score})
+                        break
+                else:
+                    rep_rows[len(groups)] = start + offset
+                    groups.append((news, []))
+
+        return groups
 
     @staticmethod
-    def get_duplicate_count(news_list: List[Dict], similarity_threshold: float = 0.7) -> int:
+    def make_cluster(representative: Dict, members: List[Dict]) -> Dict:
+        """
+        묶음 딕셔너리 생성
+
+        Args:
+            representative: 대표 뉴스
+            members: [{'news', 'similarity'}] 멤버 리스트
+
+        Returns:
+            {'representative', 'members', 'outlets'} 딕셔너리
+        """
+        members = sorted(members, key=lambda m: m['similarity'], reverse=True)
+
+        outlets = []
+        for news in [representative] + [member['news'] for member in members]:
+            outlet = get_news_outlet(news)
+            if outlet and outlet not in outlets:
+                outlets.append(outlet)
+
+        return {
+            'representative': representative,
+            'members': members,
+            'outlets': outlets
+        }
+
+    @staticmethod
+    def get_duplicate_count(
+        news_list: List[Dict],
+        similarity_threshold: float = 0.7,
+        engine: str = "exact"
+    ) -> int:
         """
         중복된 뉴스 개수 계산
 
         Args:
             news_list: 뉴스 리스트
             similarity_threshold: 유사도 임계값
+            engine: 중복 제거 엔진 (exact, minhash, vector)
 
         Returns:
             중복 개수
         """
-        unique_list = NewsDeduplicator.remove_duplicates(news_list, similarity_threshold)
+        unique_list = NewsDeduplicator.remove_duplicates(news_list, similarity_threshold, engine)
         return len(news_list) - len(unique_list)
+
+
+class _DedupEntry:
+    """IncrementalDeduplicator가 보관하는 뉴스 항목과 미리 계산된 비교 특징"""
+
+    __slots__ = (
+        'id', 'news', 'sort_key', 'title_matcher', 'desc_matcher',
+        'title_sig', 'desc_sig', 'suppressed', 'similarity'
+    )
+
+    def __init__(self, entry_id: int, news: Dict):
+        self.id = entry_id
+        self.news = news
+        features = get_features(news)
+        # 최신순 정렬용 키 (bisect는 오름차순이므로 음수 사용)
+        # 발행일이 같으면 먼저 들어온 항목이 앞 (remove_duplicates의 안정 정렬과 같은 전순서)
+        self.sort_key = (-features.timestamp, entry_id)
+        # SequenceMatcher의 seq2 분석 결과를 한 번만 계산해 재사용
+        self.title_matcher = SequenceMatcher(None, '', features.norm_title)
+        self.desc_matcher = SequenceMatcher(None, '', features.norm_description)
+        self.title_sig = None
+        self.desc_sig = None
+        # 이 항목 때문에 중복 처리된 항목 (이 항목이 교체되면 다시 평가)
+        self.suppressed: List['_DedupEntry'] = []
+        # 중복 처리되었을 때 가린 항목과의 유사도
+        self.similarity = 0.0
+
+
+class IncrementalDeduplicator:
+    """
+    페이지 단위로 수집되는 뉴스를 위한 상태 유지형 중복 제거기
+
+    지금까지 남긴 뉴스와 비교용 특징을 보관하고, 새 배치가 들어오면
+    새 항목만 기존 항목과 비교합니다. 배치를 발행일 순서와 무관하게 추가해도
+    NewsDeduplicator.remove_duplicates와 같은 "최신 뉴스 우선" 결과를 유지합니다.
+    (한 인스턴스를 여러 스레드에서 동시에 사용하지 마세요)
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.7,
+        engine: str = "exact",
+        keep_existing: bool = False
+    ):
+        """
+        Args:
+            similarity_threshold: 유사도 임계값
+            engine: 후보 탐색 엔진 (exact: 전체 비교, minhash: LSH 후보 비교, vector: 벡터 후보 비교)
+            keep_existing: True면 이미 남긴 뉴스를 더 최신의 유사 뉴스로 교체하지 않음
+                           (화면에 이미 표시된 목록을 고정해야 할 때 사용)
+        """
+        if engine not in NewsDeduplicator.ENGINES:
+            raise ValueError(f"지원하지 않는 중복 제거 엔진입니다: {engine}")
+
+        self.similarity_threshold = similarity_threshold
+        self.engine = engine
+        self.keep_existing = keep_existing
+
+        self._entries: List[_DedupEntry] = []  # 최신순
+        self._sort_keys: List[Tuple[int, int]] = []  # _entries와 같은 순서의 정렬 키
+        self._next_id = 0
+
+        if engine == "minhash":
+            self._title_index = MinHashLSH()
+            self._desc_index = MinHashLSH()
+        elif engine == "vector":
+            # 항목 id를 행 번호로 하는 벡터 저장소 (제거된 항목의 행도 남겨 둠)
+            self._vectorizer = NgramVectorizer()
+            self._bound = lower_bound(similarity_threshold)
+            self._title_vectors = np.zeros((0, self._vectorizer.dimensions), dtype=np.float32)
+            self._desc_vectors = np.zeros((0, self._vectorizer.dimensions), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def unique_news(self) -> List[Dict]:
+        """중복 제거된 뉴스 리스트 (최신순)"""
+        return [entry.news for entry in self._entries]
+
+    @property
+    def clusters(self) -> List[Dict]:
+        """
+        대표 뉴스별 묶음 리스트 (최신순, NewsDeduplicator.cluster_news와 같은 형식)
+
+        멤버는 대표 뉴스 때문에 중복 처리된 뉴스입니다.
+        """
+        return [
+            NewsDeduplicator.make_cluster(
+                entry.news,
+                [{'news': item.news, 'similarity': item.similarity} for item in entry.suppressed]
+            )
+            for entry in self._entries
+        ]
+
+    def truncate(self, count: int) -> None:
+        """
+        앞쪽(최신) count개 항목만 남기고 나머지 항목과 그 멤버를 버림
+
+        화면에 표시하지 않은 항목이 다음 페이지의 뉴스를 가리지 않도록 할 때 사용합니다.
+
+        Args:
+            count: 남길 항목 수
+        """
+        for entry in self._entries[count:]:
+            self._remove(entry)
+
+    def add_batch(self, news_list: List[Dict]) -> List[Dict]:
+        """
+        뉴스 배치 추가
+
+        Args:
+            news_list: 새로 수집한 뉴스 리스트
+
+        Returns:
+            이번 배치에서 새로 남겨진 뉴스 리스트 (최신순)
+        """
+        # 배치 내부는 remove_duplicates와 동일하게 최신순으로 처리
+        entries = []
+        for news in news_list:
+            entries.append(_DedupEntry(self._next_id, news))
+            self._next_id += 1
+        entries.sort(key=lambda e: e.sort_key)
+
+        if self.engine == "vector" and news_list:
+            # 배치 전체를 한 번에 벡터화 (행 번호 = 항목 id)
+            by_id = sorted(entries, key=lambda e: e.id)
+            self._title_vectors = np.concatenate([
+                self._title_vectors,
+                self._vectorizer.transform([e.title_matcher.b for e in by_id])
+            ])
+            self._desc_vectors = np.concatenate([
+                self._desc_vectors,
+                self._vectorizer.transform([e.desc_matcher.b for e in by_id])
+            ])
+
+        added = []
+        for entry in entries:
+            if self._add(entry):
+                added.append(entry)
+
+        # 배치 내부는 최신순으로 처리하므로 이번에 추가된 항목끼리 교체되는 경우는 없음
+        return [entry.news for entry in added]
+
+    def _is_similar(self, news: _DedupEntry, kept: _DedupEntry) -> float:
+        """
+        두 항목의 유사도 (NewsDeduplicator.are_similar_news와 동일한 판단)
+
+        news를 seq1, kept를 seq2로 비교하며, 상한값(real_quick_ratio, quick_ratio)이
+        임계값이나 이미 구한 유사도보다 낮으면 ratio 계산을 생략합니다.
+
+        Returns:
+            제목/설명 유사도 중 큰 값 (similarity_score와 같은 값, 유사하지 않으면 0.0)
+        """
+        best = 0.0
+        for attr in ('title_matcher', 'desc_matcher'):
+            floor = max(self.similarity_threshold, best)
+            matcher = getattr(kept, attr)
+            matcher.set_seq1(getattr(news, attr).b)
+            if (matcher.real_quick_ratio() >= floor
+                    and matcher.quick_ratio() >= floor):
+                ratio = matcher.ratio()
+                if ratio >= floor:
+                    best = ratio
+        return best
+
+    def _candidates(self, entry: _DedupEntry) -> List[_DedupEntry]:
+        """비교 대상 후보 항목"""
+        if self.engine == "vector":
+            scores = self._title_vectors @ self._title_vectors[entry.id]
+            np.maximum(scores, self._desc_vectors @ self._desc_vectors[entry.id], out=scores)
+            ids = set(np.flatnonzero(scores >= self._bound).tolist())
+            # 보관 중인 순서(최신순)대로 비교해야 exact 엔진과 결과가 같음
+            return [kept for kept in self._entries if kept.id in ids and kept is not entry]
+
+        if self.engine != "minhash":
+            return self._entries
+
+        entry.title_sig = self._title_index.signature(entry.title_matcher.b)
+        entry.desc_sig = self._desc_index.signature(entry.desc_matcher.b)
+        ids = self._title_index.query(entry.title_sig) | self._desc_index.query(entry.desc_sig)
+        # 보관 중인 순서(최신순)대로 비교해야 exact 엔진과 결과가 같음
+        return [kept for kept in self._entries if kept.id in ids]
+
+    def _add(self, entry: _DedupEntry) -> bool:
+        """
+        항목 하나를 추가
+
+        Returns:
+            새로 남겨졌는지 여부
+        """
+        candidates = self._candidates(entry)
+
+        # 정렬 순서상 앞선(더 최신이거나 발행일이 같고 먼저 들어온) 유사 뉴스가 있으면 중복
+        replaced_scores = []
+        for kept in candidates:
+            if kept.sort_key < entry.sort_key or self.keep_existing:
+                score = self._is_similar(entry, kept)
+                if score:
+                    entry.similarity = score
+                    kept.suppressed.append(entry)
+                    return False
+            else:
+                score = self._is_similar(kept, entry)
+                if score:
+                    # 더 오래된 유사 뉴스는 새 항목으로 교체 (최신 뉴스 우선)
+                    replaced_scores.append((kept, score))
+
+        # 새 항목이 남는 것이 확정된 뒤에 교체된 항목의 유사도 기록
+        replaced = [kept for kept, _ in replaced_scores]
+        for kept, score in replaced_scores:
+            kept.similarity = score
+            self._remove(kept)
+
+        pos = bisect_right(self._sort_keys, entry.sort_key)
+        self._entries.insert(pos, entry)
+        self._sort_keys.insert(pos, entry.sort_key)
+
+        if self.engine == "minhash":
+            self._title_index.insert(entry.id, entry.title_sig)
+            self._desc_index.insert(entry.id, entry.desc_sig)
+
+        # 교체된 항목이 가리고 있던 뉴스는 새 기준으로 다시 평가
+        revived = sorted(
+            (item for kept in replaced for item in [kept] + kept.suppressed),
+            key=lambda e: e.sort_key
+        )
+        for kept in replaced:
+            kept.suppressed = []
+        for item in revived:
+            if item not in replaced:
+                self._add(item)
+            else:
+                # 교체된 항목 자체는 새 항목에 의해 가려진 것으로 기록
+                entry.suppressed.append(item)
+
+        return True
+
+    def _remove(self, entry: _DedupEntry) -> None:
+        """보관 중인 항목 제거"""
+        for pos, kept in enumerate(self._entries):
+            if kept is entry:
+                del self._entries[pos]
+                del self._sort_keys[pos]
+                break
+
+        if self.engine == "minhash":
+            self._title_index.remove(entry.id, entry.title_sig)
+            self._desc_index.remove(entry.id, entry.desc_sig)
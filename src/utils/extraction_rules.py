@@ -0,0 +1,173 @@
+"""사이트별 기사 본문 추출 규칙 레지스트리 (lxml XPath 기반)"""
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+import lxml.html
+from lxml import etree
+
+
+# 본문에서 제거할 태그
+REMOVE_TAGS_XPATH = etree.XPath(
+    './/script | .//style | .//aside | .//nav | .//footer | .//iframe | .//form | .//button'
+)
+# 광고, 관련기사 등으로 판단할 class 키워드
+NOISE_CLASS_KEYWORDS = ('ad', 'banner', 'related', 'recommend')
+NOISE_CANDIDATES_XPATH = etree.XPath('.//div[@class] | .//section[@class]')
+
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+
+def _class_xpath(tag: str, class_name: str) -> str:
+    """class 속성에 특정 클래스가 포함된 요소를 찾는 XPath"""
+    return f"//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+class ExtractionRule:
+    """도메인별 본문 추출 규칙 (미리 컴파일된 XPath를 순서대로 시도)"""
+
+    def __init__(self, name: str, domains: Tuple[str, ...], xpaths: List[str]):
+        """
+        Args:
+            name: 규칙 이름 (매칭 통계에 사용)
+            domains: 적용할 도메인 (하위 도메인 포함)
+            xpaths: 본문 요소를 찾는 XPath 목록 (앞에서부터 시도)
+        """
+        self.name = name
+        self.domains = domains
+        self.selectors = [(xpath, etree.XPath(xpath)) for xpath in xpaths]
+
+    def matches(self, host: str) -> bool:
+        """호스트에 적용되는 규칙인지 확인"""
+        return any(host == domain or host.endswith('.' + domain) for domain in self.domains)
+
+    def find(self, tree) -> Tuple[Optional[object], Optional[str]]:
+        """
+        본문 요소 탐색
+
+        Returns:
+            (본문 요소, 매칭된 XPath) 튜플 (못 찾으면 (None, None))
+        """
+        for xpath, selector in self.selectors:
+            found = selector(tree)
+            if found:
+                return found[0], xpath
+        return None, None
+
+
+class ExtractionRuleRegistry:
+    """본문 추출 규칙 레지스트리 및 매칭 통계"""
+
+    def __init__(self):
+        self._rules: List[ExtractionRule] = []
+        self._stats = Counter()
+        self._lock = threading.Lock()
+
+    def register(self, rule: ExtractionRule) -> None:
+        """
+        규칙 등록 (나중에 등록한 규칙이 우선)
+
+        Args:
+            rule: 추출 규칙
+        """
+        with self._lock:
+            self._rules.insert(0, rule)
+
+    def rule_for(self, url: str) -> Optional[ExtractionRule]:
+        """
+        URL에 적용할 규칙 조회
+
+        Args:
+            url: 기사 URL
+
+        Returns:
+            추출 규칙 (등록되지 않은 도메인이면 None)
+        """
+        host = urlsplit(url).netloc.lower().split(':')[0]
+        for rule in self._rules:
+            if rule.matches(host):
+                return rule
+        return None
+
+    def record(self, name: str) -> None:
+        """매칭 결과 기록 (규칙 이름:XPath, heuristic, body, none 등)"""
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        규칙별 매칭 횟수
+
+        Returns:
+            {매칭 이름: 횟수} 딕셔너리
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+def parse_html(html: str):
+    """
+    lxml로 HTML 파싱
+
+    Args:
+        html: HTML 문자열
+
+    Returns:
+        lxml 문서 트리 (루트 요소)
+    """
+    # 문자열에 인코딩 선언이 있어도 파싱되도록 UTF-8 바이트로 전달
+    return lxml.html.document_fromstring(html.encode('utf-8'), parser=_HTML_PARSER)
+
+
+def clean_element(element) -> None:
+    """
+    본문 요소에서 스크립트, 광고, 관련기사 등 불필요한 하위 요소 제거
+
+    Args:
+        element: lxml 요소 (제자리에서 수정됨)
+    """
+    # drop_tree()는 뒤따르는 텍스트를 앞 텍스트에 이어 붙이므로,
+    # 줄 구분을 유지하도록 요소 내용만 비우고 tail은 남김
+    for tag in REMOVE_TAGS_XPATH(element):
+        tag.clear(keep_tail=True)
+
+    for tag in NOISE_CANDIDATES_XPATH(element):
+        class_name = tag.get('class', '').lower()
+        if any(kw in class_name for kw in NOISE_CLASS_KEYWORDS):
+            tag.clear(keep_tail=True)
+
+
+def element_text(element, min_line_length: int = 10) -> str:
+    """
+    요소의 텍스트를 줄 단위로 추출 (짧은 줄 제거)
+
+    Args:
+        element: lxml 요소
+        min_line_length: 남길 줄의 최소 길이 (초과해야 남김)
+
+    Returns:
+        정제된 텍스트
+    """
+    lines = []
+    for text in element.itertext():
+        for line in text.split('\n'):
+            line = line.strip()
+            if line and len(line) > min_line_length:
+                lines.append(line)
+    return '\n'.join(lines)
+
+
+# 기본 레지스트리 및 내장 규칙
+EXTRACTION_RULES = ExtractionRuleRegistry()
+
+EXTRACTION_RULES.register(ExtractionRule(
+    'naver',
+    ('news.naver.com',),
+    [
+        "//article[@id='dic_area']",  # 최신 네이버 뉴스
+        "//div[@id='articleBodyContents']",
+        _class_xpath('div', 'article_body'),
+        _class_xpath('div', 'article_viewer'),
+        "//div[@id='articeBody']",  # 엔터 뉴스
+    ]
+))
@@ -1,34 +1,164 @@
 """데이터 포맷팅 유틸리티"""
+import email.utils
+import html
 import re
-from typing import Dict, List
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Mapping
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from src.utils.news_item import NewsItem, NewsFeatures
+
+# 같은 기사를 가리키는 URL에서 제거할 추적용 쿼리 파라미터
+TRACKING_PARAMS = {'fbclid', 'gclid', 'cmpid'}
+TRACKING_PARAM_PREFIXES = ('utm_',)
+
+HTML_TAG_PATTERN = re.compile('<.*?>')
+
+# 화면 표시용 시간대 (네이버 뉴스 발행일 기준)
+DISPLAY_TIMEZONE = timezone(timedelta(hours=9))
 
 
 def remove_html_tags(text: str) -> str:
     """HTML 태그 제거"""
-    clean = re.compile('<.*?>')
-    return re.sub(clean, '', text)
+    return HTML_TAG_PATTERN.sub('', text)
+
+
+def clean_text(text: str) -> str:
+    """HTML 태그 제거 및 엔티티(&quot;, &amp; 등) 변환"""
+    return html.unescape(HTML_TAG_PATTERN.sub('', text))
+
+
+def parse_pub_date(pub_date_str: str) -> int:
+    """
+    발행일 문자열을 타임스탬프로 변환
+
+    Args:
+        pub_date_str: 발행일 문자열 (예: "Mon, 16 Oct 2023 10:30:00 +0900")
+
+    Returns:
+        Unix timestamp (초, 파싱 실패 시 현재 시각)
+    """
+    try:
+        # RFC 2822 형식 파싱
+        return int(email.utils.parsedate_to_datetime(pub_date_str).timestamp())
+    except Exception:
+        return int(datetime.now().timestamp())
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    URL 정규화 (캐시 키 등 동일 기사 판별용)
+
+    스킴/호스트 소문자화, 프래그먼트 및 추적용 파라미터 제거, 쿼리 파라미터 정렬
+
+    Args:
+        url: 원본 URL
+
+    Returns:
+        정규화된 URL
+    """
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS
+        and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    )
+    path = parts.path or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ''))
+
+
+def get_news_outlet(news: Mapping) -> str:
+    """
+    뉴스를 보도한 언론사 도메인 추출 (원본 링크 우선, 없으면 네이버 뉴스 링크)
+
+    Args:
+        news: 뉴스 항목
+
+    Returns:
+        'www.'을 뺀 호스트 이름 (링크가 없으면 빈 문자열)
+    """
+    return get_features(news).outlet
+
+
+def compute_features(news: Mapping) -> NewsFeatures:
+    """
+    정제된 뉴스 항목의 비교/정렬용 특징 계산
+
+    Args:
+        news: 제목/설명이 정제된 뉴스 항목
+
+    Returns:
+        NewsFeatures
+    """
+    title = news.get('title', '')
+    url = news.get('originallink') or news.get('link', '')
+    host = urlsplit(url).netloc.lower()
+
+    return NewsFeatures(
+        norm_title=title.lower(),
+        norm_description=news.get('description', '').lower(),
+        timestamp=parse_pub_date(news.get('pubDate', '')),
+        canonical_url=canonicalize_url(url) if url else '',
+        outlet=host[4:] if host.startswith('www.') else host,
+        title_tokens=tuple(title.split())
+    )
+
+
+def get_features(news: Mapping) -> NewsFeatures:
+    """
+    뉴스 항목의 특징 반환 (NewsItem은 수집 시 계산한 값을 재사용, 딕셔너리는 매번 계산)
 
+    Args:
+        news: 뉴스 항목
+
+    Returns:
+        NewsFeatures
+    """
+    if isinstance(news, NewsItem):
+        if news.features is None:
+            news.features = compute_features(news)
+        return news.features
+    return compute_features(news)
+
+
+def format_pub_date(news: Mapping) -> str:
+    """
+    화면 표시용 발행일 (예: "2023-10-16 10:30")
 
-def format_news_item(item: Dict) -> Dict:
+    Args:
+        news: 뉴스 항목
+
+    Returns:
+        한국 시간 기준 발행일 문자열
     """
-    뉴스 항목 포맷팅
+    return datetime.fromtimestamp(get_features(news).timestamp, DISPLAY_TIMEZONE).strftime('%Y-%m-%d %H:%M')
+
+
+def format_news_item(item: Dict) -> NewsItem:
+    """
+    뉴스 항목 포맷팅 (수집 단계 정규화)
+
+    한 번의 처리로 태그/엔티티를 정리한 제목과 설명, 비교용 소문자 문자열,
+    발행 시각, 정규화된 URL, 제목 단어를 계산해 둡니다.
 
     Args:
         item: 원본 뉴스 항목
 
     Returns:
-        포맷팅된 뉴스 항목
+        포맷팅된 뉴스 항목 (딕셔너리처럼 접근 가능한 NewsItem)
     """
-    return {
-        'title': remove_html_tags(item.get('title', '')),
-        'description': remove_html_tags(item.get('description', '')),
-        'link': item.get('link', ''),
-        'originallink': item.get('originallink', ''),
-        'pubDate': item.get('pubDate', '')
-    }
+    news = NewsItem(
+        title=clean_text(item.get('title', '')),
+        description=clean_text(item.get('description', '')),
+        link=item.get('link', ''),
+        originallink=item.get('originallink', ''),
+        pubDate=item.get('pubDate', '')
+    )
+    news.features = compute_features(news)
+    return news
 
 
-def format_news_list(items: List[Dict]) -> List[Dict]:
+def format_news_list(items: List[Dict]) -> List[NewsItem]:
     """
     뉴스 항목 리스트 포맷팅
 
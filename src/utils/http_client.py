@@ -0,0 +1,87 @@
+"""공유 HTTP 전송 계층 (keep-alive 연결 풀 + 재시도)"""
+import threading
+from typing import Dict
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from src.utils.config import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
+
+
+# 클라이언트별 재시도 정책
+# - naver: 연결 실패만 재시도 (요청이 서버에 닿지 않아 할당량을 쓰지 않음,
+#   429/5xx 응답은 NaverNewsAPI가 재시도마다 공유 속도 제한기를 거쳐 직접 처리)
+# - crawler: 연결 실패만 한 번 재시도 (응답 오류는 NewsCrawler가 직접 재시도)
+RETRY_POLICIES = {
+    'naver': dict(
+        total=2,
+        connect=2,
+        read=0,
+        status=0,
+        backoff_factor=0.5
+    ),
+    'crawler': dict(
+        total=1,
+        connect=1,
+        read=0,
+        status=0,
+        backoff_factor=0.3
+    ),
+    'default': dict(total=0),
+}
+
+_adapters: Dict[str, HTTPAdapter] = {}
+_adapters_lock = threading.Lock()
+_local = threading.local()
+
+
+def _get_adapter(name: str) -> HTTPAdapter:
+    """
+    클라이언트 이름별 공유 어댑터 반환 (프로세스 전체에서 하나)
+
+    어댑터가 호스트별 연결 풀(urllib3 PoolManager)을 보유하며, 풀은 스레드 안전합니다.
+    """
+    with _adapters_lock:
+        adapter = _adapters.get(name)
+        if adapter is None:
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+                max_retries=Retry(**RETRY_POLICIES.get(name, RETRY_POLICIES['default']))
+            )
+            _adapters[name] = adapter
+        return adapter
+
+
+def get_session(name: str = 'default') -> requests.Session:
+    """
+    현재 스레드용 HTTP 세션 반환
+
+    연결 풀은 같은 이름의 모든 세션이 공유하고, 쿠키 등 세션 상태는
+    스레드(=Streamlit 세션/작업 스레드)별로 분리됩니다.
+
+    Args:
+        name: 클라이언트 이름 (재시도 정책 및 연결 풀 구분, 예: naver, crawler)
+
+    Returns:
+        연결 풀이 마운트된 requests.Session
+    """
+    sessions = getattr(_local, 'sessions', None)
+    if sessions is None:
+        sessions = _local.sessions = {}
+
+    session = sessions.get(name)
+    if session is None:
+        adapter = _get_adapter(name)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        sessions[name] = session
+
+    return session
+
+
+def close_all() -> None:
+    """공유 연결 풀의 유휴 연결 정리 (풀은 다음 요청 시 다시 생성됨)"""
+    with _adapters_lock:
+        for adapter in _adapters.values():
+            adapter.close()
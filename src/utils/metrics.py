@@ -0,0 +1,257 @@
+"""단계별 소요 시간 및 카운터 계측 모듈"""
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Tuple
+from src.utils.config import (
+    METRICS_LOG_ENABLED, METRICS_EXPORT_PATH, METRICS_EXPORT_INTERVAL, LOG_LEVEL
+)
+
+# Prometheus 메트릭 이름 접두사 (로거 이름 접두사로도 사용)
+METRIC_PREFIX = 'my_news'
+
+# 진단 로그는 모두 표준 에러로 출력 (표준 출력은 CLI 결과 전용)
+_diagnostics = logging.getLogger(METRIC_PREFIX)
+if not _diagnostics.handlers:
+    _handler = logging.StreamHandler(sys.stderr)
+    _handler.setFormatter(logging.Formatter('%(message)s'))
+    _diagnostics.addHandler(_handler)
+    _diagnostics.setLevel(LOG_LEVEL)
+    _diagnostics.propagate = False
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    모듈별 진단 로거 반환 (진행 상황, 재시도, 오류 메시지용)
+
+    Args:
+        name: 모듈 이름 (crawler, openai 등)
+
+    Returns:
+        표준 에러로 출력하는 my_news.<name> 로거 (LOG_LEVEL로 수준 조정)
+    """
+    return logging.getLogger(f'{METRIC_PREFIX}.{name}')
+
+
+logger = get_logger('export')
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    """라벨 딕셔너리를 정렬된 튜플 키로 변환"""
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey) -> str:
+    """Prometheus 라벨 표기 ({name="value",...})"""
+    if not key:
+        return ''
+    escaped = (
+        (name, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in key
+    )
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+
+class Metrics:
+    """
+    프로세스 전체에서 공유하는 경량 계측 레지스트리
+
+    - span(): 단계별 소요 시간 (횟수, 합계, 최대값)
+    - incr(): 재시도, 캐시 적중, 실패 사유, 토큰 사용량 등의 카운터
+
+    METRICS_LOG_ENABLED이면 span이 끝날 때마다 JSON 한 줄 로그를 남기고,
+    METRICS_EXPORT_PATH가 지정되면 주기적으로 파일에 내보냅니다
+    (.prom 확장자는 Prometheus 텍스트 형식, 그 외는 JSON).
+    """
+
+    def __init__(self):
+        self._spans: Dict[Tuple[str, LabelKey], list] = {}  # (단계, 라벨) -> [횟수, 합계, 최대]
+        self._counters: Dict[Tuple[str, LabelKey], float] = {}
+        self._lock = threading.Lock()
+        self._exporter = None
+
+        self.logger = logging.getLogger(f'{METRIC_PREFIX}.metrics')
+        if METRICS_LOG_ENABLED and not self.logger.handlers:
+            handler = logging.StreamHandler(sys.stderr)
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            self.logger.addHandler(handler)
+            self.logger.setLevel(logging.INFO)
+            self.logger.propagate = False
+        elif not METRICS_LOG_ENABLED:
+            # 진단 로그 수준(LOG_LEVEL)과 관계없이 구조화 로그는 끔
+            self.logger.setLevel(logging.WARNING)
+
+    @contextmanager
+    def span(self, stage: str, **labels) -> Iterator[Dict]:
+        """
+        단계 소요 시간 측정
+
+        Args:
+            stage: 단계 이름 (naver_fetch, crawl_download, llm_call 등)
+            **labels: 구분용 라벨 (값 종류가 적은 것만 사용)
+
+        Yields:
+            로그에 함께 남길 추가 정보를 넣을 수 있는 딕셔너리
+        """
+        extra: Dict = {}
+        started = time.perf_counter()
+        error = None
+        try:
+            yield extra
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            key = (stage, _label_key(labels))
+            with self._lock:
+                stat = self._spans.setdefault(key, [0, 0.0, 0.0])
+                stat[0] += 1
+                stat[1] += elapsed
+                stat[2] = max(stat[2], elapsed)
+            self._ensure_exporter()
+
+            if self.logger.isEnabledFor(logging.INFO):
+                record = {'event': 'span', 'stage': stage, 'duration_ms': round(elapsed * 1000, 2)}
+                record.update(labels)
+                record.update(extra)
+                if error:
+                    record['error'] = error
+                self.log(record)
+
+    def incr(self, name: str, value: float = 1, **labels) -> None:
+        """
+        카운터 증가
+
+        Args:
+            name: 카운터 이름 (Prometheus 내보내기 시 _total 접미사가 붙음)
+            value: 증가량
+            **labels: 구분용 라벨
+        """
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+        self._ensure_exporter()
+
+    def log(self, record: Dict) -> None:
+        """구조화 로그 한 줄 기록 (METRICS_LOG_ENABLED일 때만 출력)"""
+        if self.logger.isEnabledFor(logging.INFO):
+            record = dict(record, ts=round(time.time(), 3))
+            self.logger.info(json.dumps(record, ensure_ascii=False, default=str))
+
+    def snapshot(self) -> Dict:
+        """
+        현재 계측값
+
+        Returns:
+            {'spans': [{'stage', 'labels', 'count', 'total_sec', 'avg_ms', 'max_ms'}],
+             'counters': [{'name', 'labels', 'value'}]} 딕셔너리
+        """
+        with self._lock:
+            spans = [
+                {
+                    'stage': stage,
+                    'labels': dict(key),
+                    'count': count,
+                    'total_sec': round(total, 4),
+                    'avg_ms': round(total / count * 1000, 2) if count else 0.0,
+                    'max_ms': round(maximum * 1000, 2)
+                }
+                for (stage, key), (count, total, maximum) in sorted(self._spans.items())
+            ]
+            counters = [
+                {'name': name, 'labels': dict(key), 'value': value}
+                for (name, key), value in sorted(self._counters.items())
+            ]
+        return {'spans': spans, 'counters': counters}
+
+    def to_json(self) -> str:
+        """JSON 형식으로 내보내기"""
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Prometheus 텍스트 형식으로 내보내기
+
+        Returns:
+            단계 소요 시간(summary 형식의 _count/_sum, 최대값 gauge)과 카운터(_total)
+        """
+        lines = []
+        with self._lock:
+            spans = sorted(self._spans.items())
+            counters = sorted(self._counters.items())
+
+        if spans:
+            name = f'{METRIC_PREFIX}_stage_seconds'
+            lines.append(f'# HELP {name} 단계별 소요 시간')
+            lines.append(f'# TYPE {name} summary')
+            for (stage, key), (count, total, _) in spans:
+                labels = _format_labels((('stage', stage),) + key)
+                lines.append(f'{name}_count{labels} {count}')
+                lines.append(f'{name}_sum{labels} {total:.6f}')
+            lines.append(f'# TYPE {name}_max gauge')
+            for (stage, key), (_, _, maximum) in spans:
+                lines.append(f'{name}_max{_format_labels((("stage", stage),) + key)} {maximum:.6f}')
+
+        typed = set()
+        for (counter, key), value in counters:
+            name = f'{METRIC_PREFIX}_{counter}_total'
+            if name not in typed:
+                typed.add(name)
+                lines.append(f'# TYPE {name} counter')
+            lines.append(f'{name}{_format_labels(key)} {value:g}')
+
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: str) -> None:
+        """
+        계측값을 파일로 저장 (.prom이면 Prometheus 텍스트, 그 외는 JSON)
+
+        임시 파일에 쓴 뒤 교체하므로 읽는 쪽에서 반쯤 쓰인 파일을 보지 않습니다.
+
+        Args:
+            path: 저장할 파일 경로
+        """
+        content = self.to_prometheus() if path.endswith('.prom') else self.to_json()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+    def reset(self) -> None:
+        """모든 계측값 초기화"""
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+
+    def _ensure_exporter(self) -> None:
+        """METRICS_EXPORT_PATH가 지정되어 있으면 주기적 파일 내보내기 스레드 시작"""
+        if not METRICS_EXPORT_PATH or self._exporter is not None:
+            return
+        with self._lock:
+            if self._exporter is not None:
+                return
+            self._exporter = threading.Thread(target=self._export_loop, name='metrics-exporter', daemon=True)
+            self._exporter.start()
+
+    def _export_loop(self) -> None:
+        """METRICS_EXPORT_INTERVAL마다 파일로 내보내기"""
+        while True:
+            time.sleep(METRICS_EXPORT_INTERVAL)
+            try:
+                self.write(METRICS_EXPORT_PATH)
+            except OSError as e:
+                logger.warning(f"계측값 내보내기 실패: {str(e)}")
+
+
+# 기본 레지스트리
+METRICS = Metrics()
@@ -0,0 +1,109 @@
+"""뉴스 항목 모델"""
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+class NewsFeatures:
+    """
+    수집 시 한 번만 계산하는 뉴스 항목의 비교/정렬용 특징
+
+    중복 제거, 키워드 추출, 화면 표시에서 재사용합니다 (formatter.get_features 참고).
+    """
+
+    __slots__ = ('norm_title', 'norm_description', 'timestamp', 'canonical_url', 'outlet', 'title_tokens')
+
+    def __init__(
+        self,
+        norm_title: str,
+        norm_description: str,
+        timestamp: int,
+        canonical_url: str,
+        outlet: str,
+        title_tokens: Tuple[str, ...]
+    ):
+        """
+        Args:
+            norm_title: 비교용 제목 (소문자)
+            norm_description: 비교용 설명 (소문자)
+            timestamp: 발행 시각 (Unix timestamp, 초)
+            canonical_url: 정규화된 기사 URL (원본 링크 우선)
+            outlet: 언론사 도메인 ('www.' 제외)
+            title_tokens: 제목 단어 (공백 기준)
+        """
+        self.norm_title = norm_title
+        self.norm_description = norm_description
+        self.timestamp = timestamp
+        self.canonical_url = canonical_url
+        self.outlet = outlet
+        self.title_tokens = title_tokens
+
+
+class NewsItem(Mapping):
+    """
+    포맷팅된 뉴스 항목 (__slots__ 기반)
+
+    항목마다 딕셔너리를 두지 않아 세션에 누적되는 뉴스 목록의 메모리를 줄이고,
+    기존 호출 측을 위해 news['title'], news.get('link'), {**news} 같은 딕셔너리식 접근을 지원합니다.
+    키는 FIELDS와 값이 설정된 OPTIONAL_FIELDS로 고정되며, 그 외 키는 설정할 수 없습니다.
+    features(비교/정렬용 특징)는 키로 노출되지 않는 속성입니다.
+    """
+
+    # 항상 존재하는 필드 (네이버 검색 API 응답 필드)
+    FIELDS = ('title', 'description', 'link', 'originallink', 'pubDate')
+    # 값이 설정된 경우에만 키로 노출되는 필드
+    OPTIONAL_FIELDS = ('summary',)
+
+    __slots__ = FIELDS + OPTIONAL_FIELDS + ('features',)
+
+    def __init__(
+        self,
+        title: str = '',
+        description: str = '',
+        link: str = '',
+        originallink: str = '',
+        pubDate: str = '',
+        summary: Optional[str] = None,
+        features: Optional[NewsFeatures] = None
+    ):
+        self.title = title
+        self.description = description
+        self.link = link
+        self.originallink = originallink
+        self.pubDate = pubDate
+        self.summary = summary
+        self.features = features
+
+    def __getitem__(self, key: str) -> Any:
+        if key in NewsItem.FIELDS:
+            return getattr(self, key)
+        if key in NewsItem.OPTIONAL_FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in NewsItem.FIELDS and key not in NewsItem.OPTIONAL_FIELDS:
+            raise KeyError(f"NewsItem에 없는 필드: {key}")
+        setattr(self, key, value)
+        if key in NewsItem.FIELDS:
+            # 원본 필드가 바뀌면 특징을 다시 계산하도록 초기화
+            self.features = None
+
+    def __iter__(self) -> Iterator[str]:
+        yield from NewsItem.FIELDS
+        for key in NewsItem.OPTIONAL_FIELDS:
+            if getattr(self, key) is not None:
+                yield key
+
+    def __len__(self) -> int:
+        return len(NewsItem.FIELDS) + sum(
+            getattr(self, key) is not None for key in NewsItem.OPTIONAL_FIELDS
+        )
+
+    def __repr__(self) -> str:
+        return f"NewsItem({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """일반 딕셔너리로 변환 (JSON 직렬화 등)"""
+        return {key: self[key] for key in self}
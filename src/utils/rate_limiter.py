@@ -0,0 +1,364 @@
+"""API 호출 속도 제한 및 할당량 관리 모듈"""
+import os
+import random
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from src.utils.config import (
+    RATE_LIMIT_ENABLED, RATE_LIMIT_PATH, RATE_LIMIT_MAX_WAIT,
+    NAVER_RATE_PER_SEC, NAVER_DAILY_QUOTA, OPENAI_RPM, OPENAI_TPM
+)
+from src.utils.metrics import METRICS
+
+# 네이버 API 일일 할당량은 한국 시간 자정에 초기화
+QUOTA_TIMEZONE = timezone(timedelta(hours=9))
+
+# 429 응답에 Retry-After가 없을 때의 적응형 대기 시간 (초)
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+
+class RateLimitExceeded(Exception):
+    """허용된 대기 시간 안에 호출 슬롯을 얻지 못함"""
+
+
+class QuotaExceeded(RateLimitExceeded):
+    """일일 호출 할당량 소진"""
+
+
+class Bucket:
+    """토큰 버킷 설정"""
+
+    __slots__ = ('rate', 'capacity', 'daily_limit')
+
+    def __init__(self, rate: float, capacity: float, daily_limit: Optional[int] = None):
+        """
+        Args:
+            rate: 초당 채워지는 토큰 수
+            capacity: 최대 토큰 수 (순간 허용량)
+            daily_limit: 하루 최대 호출 수 (None이면 제한 없음)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.daily_limit = daily_limit
+
+
+# 기본 버킷
+# - naver: 초당 호출 수 + 일일 호출 할당량
+# - openai_requests / openai_tokens: 분당 요청 수(RPM) / 분당 토큰 수(TPM)
+DEFAULT_BUCKETS = {
+    'naver': Bucket(NAVER_RATE_PER_SEC, NAVER_RATE_PER_SEC, NAVER_DAILY_QUOTA or None),
+    'openai_requests': Bucket(OPENAI_RPM / 60, OPENAI_RPM),
+    'openai_tokens': Bucket(OPENAI_TPM / 60, OPENAI_TPM),
+}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After 헤더 값을 초 단위로 변환
+
+    Args:
+        value: 헤더 값 (초 또는 HTTP 날짜)
+
+    Returns:
+        대기 시간 (초, 없거나 해석할 수 없으면 None)
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    SQLite 기반 토큰 버킷 속도 제한기
+
+    버킷 상태(남은 토큰, 차단 시각, 백오프)와 일일 사용량을 파일에 저장하므로
+    같은 파일을 쓰는 모든 세션과 프로세스(Streamlit 워커, CLI 등)가 한도를 공유합니다.
+    429 응답을 받으면 penalize()로 Retry-After(없으면 지수 백오프)만큼 버킷 전체를 멈춥니다.
+    """
+
+    # 프로세스 전체에서 공유하는 인스턴스 (get_instance()로 지연 생성)
+    _instance: Optional['RateLimiter'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, path: str, buckets: Optional[Dict[str, Bucket]] = None, max_wait: float = 30):
+        """
+        Args:
+            path: SQLite 파일 경로
+            buckets: {버킷 이름: Bucket} 설정 (기본값: DEFAULT_BUCKETS)
+            max_wait: acquire()가 기다릴 최대 시간 (초)
+        """
+        self.path = path
+        self.buckets = buckets if buckets is not None else DEFAULT_BUCKETS
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 여러 프로세스가 읽고-계산하고-쓰는 과정을 원자적으로 하기 위해 트랜잭션을 직접 관리
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS buckets (
+                    name TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    blocked_until REAL NOT NULL DEFAULT 0,
+                    backoff REAL NOT NULL DEFAULT 0
+                )"""
+            )
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS quotas (
+                    name TEXT PRIMARY KEY,
+                    day TEXT NOT NULL,
+                    used INTEGER NOT NULL
+                )"""
+            )
+
+    @staticmethod
+    def get_instance() -> Optional['RateLimiter']:
+        """
+        공유 속도 제한기 반환
+
+        Returns:
+            RateLimiter 인스턴스 (RATE_LIMIT_ENABLED가 false면 None)
+        """
+        if not RATE_LIMIT_ENABLED:
+            return None
+
+        with RateLimiter._instance_lock:
+            if RateLimiter._instance is None:
+                RateLimiter._instance = RateLimiter(RATE_LIMIT_PATH, max_wait=RATE_LIMIT_MAX_WAIT)
+            return RateLimiter._instance
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(QUOTA_TIMEZONE).date().isoformat()
+
+    def _transaction(self, func):
+        """쓰기 잠금을 잡은 트랜잭션 안에서 func(now) 실행"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = func(time.time())
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return result
+
+    def _load(self, name: str, now: float) -> list:
+        """버킷 상태를 [토큰, 차단 시각, 백오프]로 읽고 경과 시간만큼 토큰 충전"""
+        bucket = self.buckets[name]
+        row = self._conn.execute(
+            "SELECT tokens, updated_at, blocked_until, backoff FROM buckets WHERE name = ?",
+            (name,)
+        ).fetchone()
+        if row is None:
+            return [bucket.capacity, 0.0, 0.0]
+
+        tokens, updated_at, blocked_until, backoff = row
+        tokens = min(bucket.capacity, tokens + max(0.0, now - updated_at) * bucket.rate)
+        return [tokens, blocked_until, backoff]
+
+    def _save(self, name: str, state: list, now: float) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO buckets (name, tokens, updated_at, blocked_until, backoff) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (name, state[0], now, state[1], state[2])
+        )
+
+    def _used_today(self, name: str) -> int:
+        row = self._conn.execute("SELECT day, used FROM quotas WHERE name = ?", (name,)).fetchone()
+        return row[1] if row and row[0] == self._today() else 0
+
+    def acquire(self, name: str, cost: float = 1, max_wait: Optional[float] = None) -> float:
+        """
+        호출 슬롯 획득 (토큰이 부족하거나 차단 중이면 대기)
+
+        Args:
+            name: 버킷 이름
+            cost: 사용할 토큰 수 (버킷 용량보다 크면 용량만큼만 사용)
+            max_wait: 최대 대기 시간 (초, 기본값: 생성 시 지정한 값)
+
+        Returns:
+            실제로 대기한 시간 (초)
+
+        Raises:
+            QuotaExceeded: 일일 할당량 소진
+            RateLimitExceeded: 최대 대기 시간 안에 슬롯을 얻지 못함
+        """
+        bucket = self.buckets[name]
+        cost = min(cost, bucket.capacity)
+        max_wait = self.max_wait if max_wait is None else max_wait
+
+        def attempt(now: float) -> float:
+            if bucket.daily_limit is not None and self._used_today(name) >= bucket.daily_limit:
+                raise QuotaExceeded(f"{name} 일일 호출 할당량({bucket.daily_limit}회) 소진")
+
+            state = self._load(name, now)
+            if state[1] > now:
+                wait = state[1] - now
+            elif state[0] >= cost:
+                state[0] -= cost
+                wait = 0.0
+                if bucket.daily_limit is not None:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO quotas (name, day, used) VALUES (?, ?, ?)",
+                        (name, self._today(), self._used_today(name) + 1)
+                    )
+            else:
+                wait = (cost - state[0]) / bucket.rate
+            self._save(name, state, now)
+            return wait
+
+        waited = 0.0
+        while True:
+            wait = self._transaction(attempt)
+            if wait <= 0:
+                break
+            if waited + wait > max_wait:
+                METRICS.incr('failures', stage='rate_limit', reason=name)
+                raise RateLimitExceeded(f"{name} 호출 대기 시간 초과 ({waited + wait:.1f}초 필요)")
+            # 여러 프로세스가 같은 시각에 깨어나 몰리지 않도록 약간의 지터 추가
+            delay = wait * random.uniform(1.0, 1.2)
+            time.sleep(delay)
+            waited += delay
+
+        if waited:
+            METRICS.incr('rate_limit_wait_seconds', waited, bucket=name)
+        return waited
+
+    def release(self, name: str, amount: float) -> None:
+        """
+        미리 확보했다가 쓰지 않은 토큰 반환 (예: 예상보다 적게 쓴 LLM 토큰)
+
+        Args:
+            name: 버킷 이름
+            amount: 반환할 토큰 수
+        """
+        if amount <= 0:
+            return
+        capacity = self.buckets[name].capacity
+
+        def give_back(now: float) -> None:
+            state = self._load(name, now)
+            state[0] = min(capacity, state[0] + amount)
+            self._save(name, state, now)
+
+        self._transaction(give_back)
+
+    def charge(self, name: str, amount: float) -> None:
+        """
+        대기 없이 토큰 차감 (예: 요청이 끝난 뒤 확인한 실제 LLM 토큰 사용량)
+
+        남은 토큰보다 많으면 음수가 되어, 이후 acquire가 모자란 만큼 충전될 때까지 기다립니다.
+
+        Args:
+            name: 버킷 이름
+            amount: 차감할 토큰 수
+        """
+        if amount <= 0:
+            return
+
+        def take(now: float) -> None:
+            state = self._load(name, now)
+            state[0] -= amount
+            self._save(name, state, now)
+
+        self._transaction(take)
+
+    def penalize(self, name: str, retry_after: Optional[float] = None) -> float:
+        """
+        429 응답을 받은 버킷을 일정 시간 차단
+
+        Retry-After가 있으면 그 시간만큼, 없으면 직전 백오프의 2배(최대 BACKOFF_MAX)만큼 차단하고
+        남은 토큰을 비워 차단이 풀린 뒤에도 천천히 재개되도록 합니다.
+
+        Args:
+            name: 버킷 이름
+            retry_after: 서버가 알려준 대기 시간 (초)
+
+        Returns:
+            차단 시간 (초)
+        """
+        METRICS.incr('rate_limited', bucket=name)
+
+        def block(now: float) -> float:
+            state = self._load(name, now)
+            state[2] = min(BACKOFF_MAX, max(BACKOFF_BASE, state[2] * 2))
+            delay = retry_after if retry_after is not None else state[2]
+            state[0] = 0.0
+            state[1] = max(state[1], now + delay)
+            self._save(name, state, now)
+            return delay
+
+        return self._transaction(block)
+
+    def reward(self, name: str) -> None:
+        """성공한 호출 후 적응형 백오프 초기화"""
+        with self._lock:
+            self._conn.execute("UPDATE buckets SET backoff = 0 WHERE name = ? AND backoff > 0", (name,))
+
+    def exhaust_quota(self, name: str) -> None:
+        """서버가 할당량 소진을 알려온 경우 오늘 남은 할당량을 0으로 기록"""
+        bucket = self.buckets[name]
+        if bucket.daily_limit is None:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO quotas (name, day, used) VALUES (?, ?, ?)",
+                (name, self._today(), bucket.daily_limit)
+            )
+
+    def remaining_quota(self, name: str) -> Optional[int]:
+        """
+        오늘 남은 호출 할당량
+
+        Args:
+            name: 버킷 이름
+
+        Returns:
+            남은 호출 수 (일일 할당량이 없는 버킷이면 None)
+        """
+        bucket = self.buckets[name]
+        if bucket.daily_limit is None:
+            return None
+        with self._lock:
+            return max(0, bucket.daily_limit - self._used_today(name))
+
+    def status(self) -> Dict[str, Dict]:
+        """
+        버킷별 상태
+
+        Returns:
+            {버킷 이름: {'tokens', 'capacity', 'blocked_for', 'remaining_quota'}} 딕셔너리
+        """
+        now = time.time()
+        result = {}
+        with self._lock:
+            for name, bucket in self.buckets.items():
+                tokens, blocked_until, _ = self._load(name, now)
+                result[name] = {
+                    'tokens': round(tokens, 1),
+                    'capacity': bucket.capacity,
+                    'blocked_for': round(max(0.0, blocked_until - now), 1),
+                    'remaining_quota': (
+                        max(0, bucket.daily_limit - self._used_today(name))
+                        if bucket.daily_limit is not None else None
+                    )
+                }
+        return result
@@ -0,0 +1,123 @@
+"""메모리 기반 API 응답 캐시 (TTL + stale-while-revalidate)"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+from src.utils.metrics import METRICS, get_logger
+
+logger = get_logger('cache')
+
+
+class ResponseCache:
+    """
+    프로세스 전체에서 공유하는 TTL 응답 캐시
+
+    TTL 이내 항목은 그대로 반환하고, TTL이 지났지만 stale_ttl 이내인 항목은
+    우선 반환하면서 백그라운드 스레드에서 새로 불러옵니다.
+    항목 수가 max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다.
+    """
+
+    def __init__(self, max_entries: int = 1000, stale_ttl: float = 300, name: str = 'response'):
+        """
+        Args:
+            max_entries: 보관할 최대 항목 수
+            stale_ttl: TTL 경과 후에도 오래된 값을 반환할 수 있는 시간 (초)
+            name: 계측 카운터에 붙일 캐시 이름
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.stale_ttl = stale_ttl
+        self._entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._counters = {
+            'hits': 0,
+            'stale_hits': 0,
+            'misses': 0,
+            'refreshes': 0,
+            'refresh_errors': 0
+        }
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], ttl: float) -> Any:
+        """
+        캐시된 값 반환 (없거나 너무 오래되었으면 loader로 불러와 저장)
+
+        Args:
+            key: 캐시 키
+            loader: 값을 불러오는 함수 (예외는 호출 측으로 전달됨)
+            ttl: 신선한 값으로 취급할 시간 (초)
+
+        Returns:
+            캐시된 값 또는 새로 불러온 값
+        """
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored_at = entry
+                age = now - stored_at
+
+                if age < ttl:
+                    self._entries.move_to_end(key)
+                    self._counters['hits'] += 1
+                    METRICS.incr('cache_lookups', cache=self.name, result='hit')
+                    return value
+
+                if age < ttl + self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    self._counters['stale_hits'] += 1
+                    METRICS.incr('cache_lookups', cache=self.name, result='stale')
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        threading.Thread(
+                            target=self._refresh,
+                            args=(key, loader),
+                            daemon=True
+                        ).start()
+                    return value
+
+            self._counters['misses'] += 1
+            METRICS.incr('cache_lookups', cache=self.name, result='miss')
+
+        value = loader()
+        self._store(key, value)
+        return value
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any]) -> None:
+        """백그라운드에서 값을 새로 불러와 저장 (실패 시 기존 값 유지)"""
+        try:
+            value = loader()
+            self._store(key, value)
+            with self._lock:
+                self._counters['refreshes'] += 1
+        except Exception as e:
+            logger.warning(f"캐시 갱신 실패: {str(e)}")
+            with self._lock:
+                self._counters['refresh_errors'] += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """값 저장 및 LRU 삭제"""
+        with self._lock:
+            self._entries[key] = (value, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """모든 항목 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        캐시 통계
+
+        Returns:
+            hits, stale_hits, misses, refreshes, refresh_errors, entries 카운터
+        """
+        with self._lock:
+            return dict(self._counters, entries=len(self._entries))
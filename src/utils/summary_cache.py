@@ -0,0 +1,146 @@
+"""AI 요약 결과 캐시 모듈"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+from src.utils.metrics import METRICS
+
+
+class SummaryCache:
+    """
+    SQLite 기반 AI 요약 결과 캐시
+
+    기사 본문 해시 + 모델 + 프롬프트 버전 + 파라미터로 만든 키에 요약 결과를 저장합니다.
+    TTL이 지난 항목은 무시하고, 항목 수가 max_entries를 넘으면
+    가장 오래 사용되지 않은 항목부터 삭제합니다.
+    """
+
+    def __init__(self, path: str, max_entries: int = 5000, ttl: Optional[int] = None):
+        """
+        Args:
+            path: SQLite 파일 경로
+            max_entries: 보관할 최대 항목 수
+            ttl: 항목 유효 시간 (초, None이면 만료 없음)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS summaries (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_summaries_accessed ON summaries (accessed_at)"
+            )
+
+    @staticmethod
+    def make_key(content: str, model: str, prompt_version: str, params: Dict[str, Any]) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            content: 요약할 본문
+            model: 모델 이름
+            prompt_version: 프롬프트 템플릿 버전 (템플릿 변경 시 이전 결과 무효화)
+            params: 요약 결과에 영향을 주는 파라미터 (temperature, max_tokens 등)
+
+        Returns:
+            SHA-256 16진수 문자열
+        """
+        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        meta = json.dumps(
+            {'model': model, 'prompt_version': prompt_version, 'params': params},
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(f"{content_hash}:{meta}".encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시 조회
+
+        Args:
+            key: make_key()로 만든 키
+
+        Returns:
+            저장된 요약 결과 (없거나 만료되면 None)
+        """
+        now = time.time()
+
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM summaries WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None or (self.ttl is not None and now - row[1] >= self.ttl):
+                self.misses += 1
+                METRICS.incr('cache_lookups', cache='summary', result='miss')
+                return None
+
+            self._conn.execute(
+                "UPDATE summaries SET accessed_at = ? WHERE key = ?",
+                (now, key)
+            )
+            self.hits += 1
+            METRICS.incr('cache_lookups', cache='summary', result='hit')
+
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        캐시 저장 (항목 수 초과 시 LRU 삭제)
+
+        Args:
+            key: make_key()로 만든 키
+            value: JSON 직렬화 가능한 요약 결과
+        """
+        now = time.time()
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO summaries (key, value, created_at, accessed_at)
+                   VALUES (?, ?, ?, ?)""",
+                (key, json.dumps(value, ensure_ascii=False), now, now)
+            )
+            self._conn.execute(
+                """DELETE FROM summaries WHERE key IN (
+                       SELECT key FROM summaries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                   )""",
+                (self.max_entries,)
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+
+        Returns:
+            {'hits', 'misses', 'hit_rate', 'entries'} 딕셔너리
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'entries': entries
+            }
@@ -0,0 +1,156 @@
+"""LLM 입력 토큰 예산 관리 유틸리티"""
+import re
+from typing import List
+
+
+# 한글 음절/자모 (대략 1글자당 1토큰)
+HANGUL_PATTERN = re.compile(r'[ᄀ-ᇿ㄰-㆏가-힣]')
+
+# 요약에 도움이 되지 않는 기사 하단 문구 (저작권, 기자 정보 등)
+BOILERPLATE_PATTERNS = [
+    re.compile(pattern) for pattern in (
+        r'무단\s*(전재|복제)',
+        r'재배포\s*금지',
+        r'(?i)copyright|ⓒ|©|all rights reserved',
+        r'[\w.+-]+@[\w-]+\.[\w.]+',  # 이메일
+        r'^\S{2,4}\s*(기자|특파원|논설위원)\s*$',
+    )
+]
+
+# 문장 경계 (마침표, 물음표, 느낌표 뒤 공백)
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.?!])\s+')
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수 추정 (tokenizer 없이 보수적으로 계산)
+
+    한글은 1글자당 약 1토큰, 그 외 문자는 약 4글자당 1토큰으로 계산합니다.
+
+    Args:
+        text: 텍스트
+
+    Returns:
+        추정 토큰 수
+    """
+    hangul = len(HANGUL_PATTERN.findall(text))
+    return hangul + (len(text) - hangul + 3) // 4
+
+
+def remove_boilerplate(text: str) -> str:
+    """
+    저작권 문구, 기자 이메일 등 요약에 불필요한 줄 제거
+
+    Args:
+        text: 기사 본문
+
+    Returns:
+        정리된 본문
+    """
+    lines = [
+        line for line in text.split('\n')
+        if not any(pattern.search(line) for pattern in BOILERPLATE_PATTERNS)
+    ]
+    return '\n'.join(lines)
+
+
+def trim_to_budget(text: str, max_tokens: int) -> str:
+    """
+    토큰 예산에 맞게 본문 축약
+
+    불필요한 줄을 먼저 제거하고, 그래도 넘치면 뉴스의 역피라미드 구조에 따라
+    앞쪽 줄(문장)부터 예산 안에서 남깁니다.
+
+    Args:
+        text: 기사 본문
+        max_tokens: 최대 토큰 수
+
+    Returns:
+        예산 이내로 축약된 본문
+    """
+    text = remove_boilerplate(text)
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    kept = []
+    used = 0
+    for line in text.split('\n'):
+        line_tokens = estimate_tokens(line) + 1
+        if used + line_tokens > max_tokens:
+            # 남은 예산만큼 문장 단위로 채우고, 넘치는 문장은 글자 단위로 잘라 남은 예산을 채움
+            for sentence in SENTENCE_BOUNDARY.split(line):
+                sentence_tokens = estimate_tokens(sentence) + 1
+                if used + sentence_tokens > max_tokens:
+                    cut = _cut_to_budget(sentence, max_tokens - used)
+                    if cut:
+                        kept.append(cut)
+                    break
+                kept.append(sentence)
+                used += sentence_tokens
+            break
+        kept.append(line)
+        used += line_tokens
+
+    return '\n'.join(kept)
+
+
+def _cut_to_budget(text: str, max_tokens: int) -> str:
+    """텍스트 앞부분을 토큰 예산 이내의 길이로 자름 (비한글은 4글자당 1토큰)"""
+    cut = text[:max(0, max_tokens) * 4]
+    # 한 글자를 지울 때마다 줄어드는 토큰은 최대 1개이므로 초과분만큼 지우며 맞춤
+    while cut and estimate_tokens(cut) > max_tokens:
+        cut = cut[:len(cut) - (estimate_tokens(cut) - max_tokens)]
+    return cut
+
+
+def _split_to_budget(text: str, max_tokens: int) -> List[str]:
+    """텍스트를 앞에서부터 토큰 예산 이내 길이의 조각으로 나눔"""
+    pieces = []
+    while text:
+        piece = _cut_to_budget(text, max_tokens)
+        if not piece:
+            break
+        pieces.append(piece)
+        text = text[len(piece):]
+    return pieces
+
+
+def split_into_chunks(text: str, chunk_tokens: int) -> List[str]:
+    """
+    본문을 토큰 예산 단위의 조각으로 분할 (줄 경계 기준, 긴 줄은 문장 경계, 긴 문장은 글자 단위)
+
+    Args:
+        text: 기사 본문
+        chunk_tokens: 조각당 최대 토큰 수
+
+    Returns:
+        본문 조각 리스트
+    """
+    units = []
+    for line in remove_boilerplate(text).split('\n'):
+        if estimate_tokens(line) <= chunk_tokens:
+            units.append(line)
+            continue
+        for sentence in SENTENCE_BOUNDARY.split(line):
+            if estimate_tokens(sentence) > chunk_tokens:
+                # 문장 하나가 조각 예산보다 크면 글자 단위로 나눔
+                units.extend(_split_to_budget(sentence, chunk_tokens))
+            else:
+                units.append(sentence)
+
+    chunks = []
+    current = []
+    used = 0
+    for unit in units:
+        unit_tokens = estimate_tokens(unit) + 1
+        if current and used + unit_tokens > chunk_tokens:
+            chunks.append('\n'.join(current))
+            current = []
+            used = 0
+        current.append(unit)
+        used += unit_tokens
+
+    if current:
+        chunks.append('\n'.join(current))
+
+    return chunks
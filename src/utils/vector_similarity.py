@@ -0,0 +1,152 @@
+"""문자 n-gram 벡터 기반 일괄 유사도 계산 모듈"""
+import zlib
+from typing import Dict, Iterator, List, Sequence, Tuple
+import numpy as np
+
+# 문자 n-gram 길이와 해시 벡터 차원
+NGRAM = 2
+DIMENSIONS = 1024
+
+# 한 번에 계산할 유사도 행렬의 행 수 (메모리 사용량 = BLOCK_SIZE x 뉴스 수 x 4바이트)
+BLOCK_SIZE = 512
+
+# SequenceMatcher 임계값별 코사인 유사도 하한
+# 참조 텍스트 쌍에서 SequenceMatcher 유사도가 임계값 이상인 쌍의 최소 코사인 유사도에
+# 10% 여유를 둔 값으로, 이보다 낮은 쌍은 SequenceMatcher 비교 없이 유사하지 않다고 판단합니다.
+# (python -m benchmarks.calibrate_similarity의 시드 7, 11 결과 중 작은 값, NGRAM/DIMENSIONS를 바꾸면 다시 측정)
+CALIBRATED_LOWER_BOUNDS: Dict[float, float] = {
+    0.5: 0.237,
+    0.6: 0.301,
+    0.7: 0.465,
+    0.8: 0.530,
+    0.9: 0.709,
+}
+
+
+def lower_bound(similarity_threshold: float) -> float:
+    """
+    SequenceMatcher 임계값에 대응하는 코사인 유사도 하한
+
+    보정하지 않은 임계값은 그보다 작은 보정 임계값 중 가장 가까운 값의 하한을 사용합니다 (안전한 쪽).
+
+    Args:
+        similarity_threshold: SequenceMatcher 유사도 임계값
+
+    Returns:
+        코사인 유사도 하한 (보정 범위보다 작은 임계값이면 0.0)
+    """
+    bounds = [bound for threshold, bound in CALIBRATED_LOWER_BOUNDS.items() if threshold <= similarity_threshold]
+    return max(bounds) if bounds else 0.0
+
+
+class NgramVectorizer:
+    """텍스트를 L2 정규화된 문자 n-gram 해시 벡터로 변환"""
+
+    def __init__(self, ngram: int = NGRAM, dimensions: int = DIMENSIONS):
+        """
+        Args:
+            ngram: 문자 n-gram 길이
+            dimensions: 해시 벡터 차원
+        """
+        self.ngram = ngram
+        self.dimensions = dimensions
+
+    def _indices(self, text: str) -> List[int]:
+        """공백을 정리한 텍스트의 n-gram 해시 인덱스"""
+        text = ' '.join(text.split())
+        n = self.ngram
+        if len(text) <= n:
+            return [zlib.crc32(text.encode('utf-8')) % self.dimensions] if text else []
+        return [
+            zlib.crc32(text[i:i + n].encode('utf-8')) % self.dimensions
+            for i in range(len(text) - n + 1)
+        ]
+
+    def transform(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        텍스트 리스트를 벡터 행렬로 변환
+
+        Args:
+            texts: 텍스트 리스트 (비교용으로 정규화된 문자열)
+
+        Returns:
+            (텍스트 수, dimensions) float32 행렬 (빈 텍스트는 0 벡터)
+        """
+        matrix = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        rows: List[int] = []
+        cols: List[int] = []
+        for row, text in enumerate(texts):
+            indices = self._indices(text)
+            rows.extend([row] * len(indices))
+            cols.extend(indices)
+
+        # n-gram 출현 횟수 누적 후 행별 L2 정규화
+        np.add.at(matrix, (rows, cols), 1.0)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+
+def similarity_blocks(
+    title_vectors: np.ndarray,
+    desc_vectors: np.ndarray,
+    block_size: int = BLOCK_SIZE
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    뉴스 간 유사도 행렬을 행 블록 단위로 계산 (제목/설명 코사인 유사도 중 큰 값)
+
+    Args:
+        title_vectors: 제목 벡터 행렬
+        desc_vectors: 설명 벡터 행렬
+        block_size: 블록당 행 수
+
+    Yields:
+        (시작 행 번호, (블록 행 수, 전체 뉴스 수) 유사도 행렬) 튜플
+    """
+    for start in range(0, len(title_vectors), block_size):
+        end = start + block_size
+        block = title_vectors[start:end] @ title_vectors.T
+        np.maximum(block, desc_vectors[start:end] @ desc_vectors.T, out=block)
+        yield start, block
+
+
+def calibrate_lower_bound(
+    pairs: Sequence[Tuple[str, str]],
+    sequence_scores: Sequence[float],
+    similarity_threshold: float,
+    margin: float = 0.1,
+    vectorizer: NgramVectorizer = None
+) -> Dict[str, float]:
+    """
+    참조 텍스트 쌍으로 코사인 유사도 하한 측정
+
+    Args:
+        pairs: (텍스트, 텍스트) 쌍 리스트 (비교용으로 정규화된 문자열)
+        sequence_scores: 쌍별 SequenceMatcher 유사도
+        similarity_threshold: SequenceMatcher 유사도 임계값
+        margin: 하한에 둘 여유 비율
+        vectorizer: 사용할 벡터 변환기 (기본값: NgramVectorizer())
+
+    Returns:
+        {'lower_bound', 'candidate_rate', 'best_threshold', 'best_agreement'} 딕셔너리
+        - lower_bound: 임계값 이상인 쌍을 모두 포함하는 코사인 하한 (여유 포함)
+        - candidate_rate: 하한 이상이라 SequenceMatcher로 확인해야 하는 쌍의 비율
+        - best_threshold / best_agreement: 코사인 임계값 하나로만 판단할 때 가장 잘 맞는 값과 일치율
+    """
+    vectorizer = vectorizer or NgramVectorizer()
+    left = vectorizer.transform([a for a, _ in pairs])
+    right = vectorizer.transform([b for _, b in pairs])
+    cosine = np.einsum('ij,ij->i', left, right)
+    labels = np.asarray(sequence_scores) >= similarity_threshold
+
+    bound = float(cosine[labels].min()) * (1 - margin) if labels.any() else 1.0
+    candidates = np.arange(0.0, 1.0, 0.005)
+    agreement = [float(((cosine >= c) == labels).mean()) for c in candidates]
+    best = int(np.argmax(agreement))
+
+    return {
+        'lower_bound': round(bound, 3),
+        'candidate_rate': round(float((cosine >= bound).mean()), 3),
+        'best_threshold': round(float(candidates[best]), 3),
+        'best_agreement': round(agreement[best], 3)
+    }
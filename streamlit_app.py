@@ -1,11 +1,18 @@
 """네이버 뉴스 검색 Streamlit 애플리케이션"""
+import time
 import streamlit as st
-from src.utils.config import validate_config, validate_openai_config
-from src.services.news_service import NewsService
-from src.services.summary_service import SummaryService
-from src.services.ai_summary_service import AISummaryService
+from src.utils.config import validate_config, validate_openai_config, NAVER_PREFETCH_PAGES
+from src.services.service_container import ServiceContainer
+from src.services.summary_job_service import SummaryJob
+from src.utils.deduplicator import NewsDeduplicator, IncrementalDeduplicator
+from src.utils.formatter import format_pub_date
+from src.utils.metrics import METRICS
+from src.utils.rate_limiter import RateLimiter
 
 
+# 백그라운드 AI 요약 상태 조회 주기 (초)
+SUMMARY_POLL_INTERVAL = 1.0
+
 # 페이지 설정
 st.set_page_config(
     page_title="네이버 뉴스 검색",
@@ -14,12 +21,186 @@ st.set_page_config(
 )
 
 
+def render_news_summary(news, ai_summary_data):
+    """
+    뉴스 요약 영역 표시 (AI 요약이 있으면 AI 요약, 없으면 기본 요약)
+
+    Args:
+        news: 뉴스 항목 (NewsItem)
+        ai_summary_data: AI 요약 결과 딕셔너리 (없으면 None)
+    """
+    # 타입 체크 및 검증
+    if isinstance(ai_summary_data, dict) and ai_summary_data.get('success') and 'summary' in ai_summary_data:
+        # AI 요약 표시
+        st.markdown("**🤖 AI 요약**")
+        st.info(ai_summary_data['summary'])
+
+        # 핵심 포인트
+        if ai_summary_data.get('key_points'):
+            st.markdown("**💡 핵심 포인트**")
+            for point in ai_summary_data['key_points']:
+                st.markdown(f"- {point}")
+
+        # 통계
+        st.caption(f"📊 원문 길이: {ai_summary_data.get('word_count', 0):,}자")
+    elif isinstance(ai_summary_data, dict) and not ai_summary_data.get('success'):
+        # AI 요약 실패 시
+        st.markdown("**📝 기본 요약**")
+        st.write(news.get('summary', news.get('description', '')))
+        st.caption(f"⚠️ AI 요약 실패: {ai_summary_data.get('error', '알 수 없는 오류')}")
+    else:
+        # 기본 요약 표시
+        st.markdown("**📝 요약**")
+        st.write(news.get('summary', news.get('description', '')))
+
+
+def poll_summary_jobs(job_service, clusters):
+    """
+    백그라운드 요약 작업 상태를 조회해 완료된 결과를 세션 상태에 반영
+
+    Args:
+        job_service: SummaryJobService 인스턴스
+        clusters: {네이버 뉴스 링크: 기사 묶음} 딕셔너리 (만료된 작업 재등록용)
+
+    Returns:
+        {뉴스 번호: 진행 중인 작업 상태 딕셔너리} 딕셔너리
+    """
+    jobs = st.session_state.get('summary_jobs', {})
+    batch = st.session_state.get('summary_batch')
+    news_list = st.session_state['news_list']
+    running = {}
+
+    statuses = job_service.poll(list(jobs.values()))
+    for global_idx, job_id in list(jobs.items()):
+        job = statuses.get(job_id)
+
+        if job is None:
+            # 결과를 읽기 전에 보관 시간이 지난 작업은 다시 등록 (요약 캐시로 대부분 즉시 완료)
+            news = news_list[global_idx - 1]
+            cluster = clusters.get(news['link']) or NewsDeduplicator.make_cluster(news, [])
+            jobs[global_idx] = job_service.submit_cluster(cluster)
+            running[global_idx] = {'status': SummaryJob.PENDING, 'partial': ''}
+            continue
+
+        if job['status'] not in (SummaryJob.DONE, SummaryJob.FAILED):
+            running[global_idx] = job
+            continue
+
+        result = job['result']
+        if result.get('success'):
+            # 화면에 쓰지 않는 원문/정제 본문은 세션에 보관하지 않음 (작업 결과는 공유 객체이므로 복사본에서 제외)
+            st.session_state[f'ai_result_{global_idx}'] = {
+                key: value for key, value in result.items()
+                if key not in ('original_content', 'content')
+            }
+            if batch:
+                batch['success'] += 1
+        else:
+            # 실패 정보 저장
+            st.session_state[f'ai_result_{global_idx}'] = {
+                'success': False,
+                'error': result.get('error', '알 수 없는 오류'),
+                'url': result.get('url')
+            }
+            if batch:
+                batch['fail'] += 1
+        del jobs[global_idx]
+
+    return running
+
+
+@st.cache_resource
+def get_services() -> ServiceContainer:
+    """프로세스 공용 서비스 컨테이너 (모든 세션이 공유)"""
+    return ServiceContainer()
+
+
+def render_debug_panel(services: ServiceContainer):
+    """
+    단계별 소요 시간과 카운터를 보여주는 디버그 패널 (사이드바)
+
+    화면을 그리기 시작한 시점까지의 계측값이며, 프로세스 전체(모든 세션) 합계입니다.
+
+    Args:
+        services: 서비스 컨테이너
+    """
+    status = services.status()
+    st.markdown("**서비스 상태**")
+    st.caption(
+        f"{'✅ 정상' if status['healthy'] else '⚠️ 검색 불가'} · "
+        f"가동 {status['uptime_sec']:,.0f}초 · "
+        f"네이버 키 {'✓' if status['credentials']['naver'] else '✗'} · "
+        f"OpenAI 키 {'✓' if status['credentials']['openai'] else '✗'} · "
+        f"추출 프로세스 {status['extract_workers']}개"
+    )
+    st.caption(f"생성된 서비스: {', '.join(status['services']) or '없음'}")
+    if status['summary_jobs']:
+        st.caption("요약 작업: " + ', '.join(f"{k} {v}" for k, v in status['summary_jobs'].items()))
+    if st.button("🔑 인증 정보 다시 읽기", use_container_width=True):
+        changed = services.refresh(force=True)
+        st.toast(f"바뀐 인증 정보: {', '.join(changed)}" if changed else "바뀐 인증 정보가 없습니다.")
+
+    snapshot = METRICS.snapshot()
+
+    st.markdown("**단계별 소요 시간**")
+    if snapshot['spans']:
+        st.table([
+            {
+                '단계': span['stage'] + ''.join(f" {k}={v}" for k, v in span['labels'].items()),
+                '횟수': span['count'],
+                '평균(ms)': span['avg_ms'],
+                '최대(ms)': span['max_ms']
+            }
+            for span in snapshot['spans']
+        ])
+    else:
+        st.caption("아직 기록된 단계가 없습니다.")
+
+    st.markdown("**카운터**")
+    if snapshot['counters']:
+        st.table([
+            {
+                '이름': counter['name'] + ''.join(f" {k}={v}" for k, v in counter['labels'].items()),
+                '값': int(counter['value'])
+            }
+            for counter in snapshot['counters']
+        ])
+    else:
+        st.caption("아직 기록된 카운터가 없습니다.")
+
+    limiter = RateLimiter.get_instance()
+    if limiter:
+        st.markdown("**API 호출 한도**")
+        st.table([
+            {
+                '버킷': name,
+                '남은 토큰': f"{state['tokens']:,.0f}/{state['capacity']:,.0f}",
+                '차단(초)': state['blocked_for'],
+                '오늘 남은 호출': '-' if state['remaining_quota'] is None else f"{state['remaining_quota']:,}"
+            }
+            for name, state in limiter.status().items()
+        ])
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button("JSON", METRICS.to_json(), "metrics.json", "application/json", use_container_width=True)
+    with col2:
+        st.download_button("Prometheus", METRICS.to_prometheus(), "metrics.prom", "text/plain", use_container_width=True)
+    if st.button("🔄 계측값 초기화", use_container_width=True):
+        METRICS.reset()
+        st.rerun()
+
+
 def main():
     """메인 애플리케이션"""
 
     st.title("📰 네이버 뉴스 검색 & 요약")
     st.markdown("---")
 
+    # 프로세스 공용 서비스 (.env가 바뀌었으면 인증 정보를 다시 읽음)
+    services = get_services()
+    services.refresh()
+
     # 환경 변수 검증
     try:
         validate_config()
@@ -66,6 +247,10 @@ def main():
             # 검색 버튼 (폼 제출 버튼)
             search_button = st.form_submit_button("🔍 검색", type="primary", use_container_width=True)
 
+        # 성능 계측 디버그 패널
+        if st.checkbox("🔧 디버그 패널", help="단계별 소요 시간, 캐시 적중, 재시도, 실패 사유, 토큰 사용량 표시"):
+            render_debug_panel(services)
+
     # 메인 컨텐츠 영역
     if search_button:
         if not query:
@@ -83,31 +268,42 @@ def main():
         st.session_state['sort'] = sort
         st.session_state['page'] = 0
         st.session_state['summarized_count'] = 0
+        st.session_state['summary_jobs'] = {}  # {뉴스 번호: 백그라운드 요약 작업 ID}
+        st.session_state.pop('summary_batch', None)
 
         with st.spinner(f"'{query}' 관련 뉴스를 검색 중 (중복 제거 포함)..."):
             try:
                 # 뉴스 검색 (중복 제거 포함)
-                news_service = NewsService()
+                news_service = services.news_service()
+                deduplicator = IncrementalDeduplicator(similarity_threshold=0.7)
                 news_list = news_service.search_and_format(
                     query,
                     count,
                     sort,
                     remove_duplicates=True,
-                    similarity_threshold=0.7
+                    similarity_threshold=0.7,
+                    deduplicator=deduplicator,
+                    prefetch_pages=NAVER_PREFETCH_PAGES
                 )
 
                 if not news_list:
                     st.info("검색 결과가 없습니다.")
                     return
 
+                # 다음 페이지에서 이어서 사용할 증분 중복 제거기
+                # (표시한 뉴스만 남기고, 이후에는 표시된 뉴스를 고정해 유사 뉴스를 멤버로 묶음)
+                deduplicator.truncate(len(news_list))
+                deduplicator.keep_existing = True
+
                 # 요약 정보 생성
-                summary_service = SummaryService()
+                summary_service = services.summary_service()
                 news_with_summary = summary_service.create_summary_list(news_list)
                 keywords = summary_service.get_keywords_from_titles(news_list)
 
                 # 세션 상태에 검색 결과 저장
                 st.session_state['news_list'] = news_with_summary  # 누적된 뉴스 리스트
                 st.session_state['keywords'] = keywords
+                st.session_state['deduplicator'] = deduplicator
                 st.session_state['requested_count'] = count
                 st.session_state['auto_summarize'] = True  # AI 요약 자동 실행 플래그
 
@@ -135,69 +331,43 @@ def main():
             st.markdown(keyword_html, unsafe_allow_html=True)
             st.markdown("---")
 
-        # 자동 AI 요약 실행 (새로 추가된 뉴스만)
+        # 표시된 뉴스별 기사 묶음 (네이버 뉴스 링크 기준)
+        deduplicator = st.session_state.get('deduplicator')
+        clusters = {
+            cluster['representative']['link']: cluster
+            for cluster in (deduplicator.clusters if deduplicator else [])
+        }
+
+        # 자동 AI 요약 작업 등록 (새로 추가된 뉴스만, 처리는 백그라운드에서 진행)
+        job_service = None
         if st.session_state.get('auto_summarize', False):
             st.session_state['auto_summarize'] = False
 
             try:
                 validate_openai_config()
-                ai_service = AISummaryService()
+                job_service = services.job_service()
 
-                # 이미 AI 요약이 완료된 뉴스 개수 확인
+                # 이미 AI 요약을 요청한 뉴스 개수 확인
                 summarized_count = st.session_state.get('summarized_count', 0)
-
-                # 새로 추가된 뉴스만 처리
-                new_news = news_with_summary[summarized_count:]
-
-                if new_news:
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
-                    success_count = 0
-                    fail_count = 0
-
-                    for idx, news in enumerate(new_news, 1):
-                        global_idx = summarized_count + idx
-                        status_text.text(f"AI 요약 진행 중... ({idx}/{len(new_news)})")
-                        progress_bar.progress(idx / len(new_news))
-
-                        # 원본 링크 우선, 없으면 네이버 뉴스 링크 사용
-                        article_url = news.get('originallink') or news.get('link')
-
-                        if article_url:
-                            try:
-                                result = ai_service.summarize_news_from_url(article_url)
-                                if result.get('success'):
-                                    st.session_state[f'ai_result_{global_idx}'] = result
-                                    success_count += 1
-                                else:
-                                    # 실패 정보 저장
-                                    st.session_state[f'ai_result_{global_idx}'] = {
-                                        'success': False,
-                                        'error': result.get('error', '알 수 없는 오류'),
-                                        'url': article_url
-                                    }
-                                    fail_count += 1
-                            except Exception as e:
-                                st.session_state[f'ai_result_{global_idx}'] = {
-                                    'success': False,
-                                    'error': str(e),
-                                    'url': article_url
-                                }
-                                fail_count += 1
-
-                    progress_bar.empty()
-                    status_text.empty()
-
-                    # 요약 완료된 개수 업데이트
-                    st.session_state['summarized_count'] = len(news_with_summary)
-
-                    # 결과 메시지
-                    if fail_count > 0:
-                        st.info(f"✅ AI 요약 완료: {success_count}개 성공, {fail_count}개 실패")
+                jobs = st.session_state.setdefault('summary_jobs', {})
+
+                # 새로 추가된 뉴스만 처리 (같은 기사를 보도한 묶음마다 한 번씩 요약)
+                submitted = 0
+                for idx, news in enumerate(news_with_summary[summarized_count:], summarized_count + 1):
+                    if news.get('originallink') or news.get('link'):
+                        cluster = clusters.get(news['link']) or NewsDeduplicator.make_cluster(news, [])
+                        jobs[idx] = job_service.submit_cluster(cluster)
+                        submitted += 1
+
+                # 요약 요청한 개수 업데이트
+                st.session_state['summarized_count'] = len(news_with_summary)
+
+                if submitted:
+                    batch = st.session_state.get('summary_batch')
+                    if batch and batch['success'] + batch['fail'] < batch['total']:
+                        batch['total'] += submitted
                     else:
-                        st.success(f"✅ {success_count}개의 뉴스 AI 요약 완료")
-
-                    st.rerun()
+                        st.session_state['summary_batch'] = {'total': submitted, 'success': 0, 'fail': 0}
 
             except ValueError:
                 st.warning("⚠️ OpenAI API 키가 설정되지 않아 기본 요약만 표시됩니다.")
@@ -205,40 +375,52 @@ def main():
             except Exception as e:
                 st.error(f"AI 요약 중 오류 발생: {str(e)}")
 
+        # 진행 중인 작업 상태 조회
+        running = {}
+        if st.session_state.get('summary_jobs'):
+            try:
+                job_service = job_service or services.job_service()
+                running = poll_summary_jobs(job_service, clusters)
+            except Exception as e:
+                st.error(f"AI 요약 중 오류 발생: {str(e)}")
+                st.session_state['summary_jobs'] = {}
+
+        # 진행률 및 결과 메시지
+        batch = st.session_state.get('summary_batch')
+        if batch:
+            done_count = batch['success'] + batch['fail']
+            if running:
+                st.progress(done_count / batch['total'])
+                st.text(f"AI 요약 진행 중... ({done_count}/{batch['total']})")
+            else:
+                if batch['fail'] > 0:
+                    st.info(f"✅ AI 요약 완료: {batch['success']}개 성공, {batch['fail']}개 실패")
+                else:
+                    st.success(f"✅ {batch['success']}개의 뉴스 AI 요약 완료")
+                del st.session_state['summary_batch']
+
         # 뉴스 목록 표시
         st.markdown("### 📋 뉴스 목록")
 
         for idx, news in enumerate(news_with_summary, 1):
             with st.expander(f"**{idx}. {news['title']}**", expanded=(idx == 1)):
                 # 발행일
-                st.caption(f"📅 {news['pubDate']}")
-
-                # 요약 표시 (AI 요약이 있으면 AI 요약, 없으면 기본 요약)
-                ai_summary_data = st.session_state.get(f'ai_result_{idx}')
-
-                # 타입 체크 및 검증
-                if isinstance(ai_summary_data, dict) and ai_summary_data.get('success') and 'summary' in ai_summary_data:
-                    # AI 요약 표시
-                    st.markdown("**🤖 AI 요약**")
-                    st.info(ai_summary_data['summary'])
-
-                    # 핵심 포인트
-                    if ai_summary_data.get('key_points'):
-                        st.markdown("**💡 핵심 포인트**")
-                        for point in ai_summary_data['key_points']:
-                            st.markdown(f"- {point}")
-
-                    # 통계
-                    st.caption(f"📊 원문 길이: {ai_summary_data.get('word_count', 0):,}자")
-                elif isinstance(ai_summary_data, dict) and not ai_summary_data.get('success'):
-                    # AI 요약 실패 시
-                    st.markdown("**📝 기본 요약**")
-                    st.write(news.get('summary', news.get('description', '')))
-                    st.caption(f"⚠️ AI 요약 실패: {ai_summary_data.get('error', '알 수 없는 오류')}")
+                st.caption(f"📅 {format_pub_date(news)}")
+
+                # 같은 기사를 보도한 언론사 수
+                outlets = clusters[news['link']]['outlets'] if news['link'] in clusters else []
+                if len(outlets) > 1:
+                    st.caption(f"📰 {len(outlets)}개 언론사가 보도: {', '.join(outlets)}")
+
+                if idx in running:
+                    if running[idx]['partial']:
+                        # 지금까지 생성된 AI 응답 표시
+                        st.markdown(f"**🤖 AI 요약**\n\n{running[idx]['partial']}▌")
+                    else:
+                        render_news_summary(news, None)
+                        st.caption("⏳ AI 요약 중...")
                 else:
-                    # 기본 요약 표시
-                    st.markdown("**📝 요약**")
-                    st.write(news.get('summary', news.get('description', '')))
+                    render_news_summary(news, st.session_state.get(f'ai_result_{idx}'))
 
                 # 원본 기사 링크만 표시
                 if news.get('originallink'):
@@ -257,50 +439,42 @@ def main():
 
                 with st.spinner(f"다음 {count}개의 뉴스를 검색 중..."):
                     try:
-                        news_service = NewsService()
+                        news_service = services.news_service()
                         # 다음 페이지 시작 위치 계산
                         start_pos = (current_page + 1) * count + 1
 
-                        # API 호출로 다음 페이지 뉴스 가져오기
-                        result = news_service.api.search_news(
+                        # 다음 페이지 뉴스를 가져와 기존 뉴스와 중복 제거
+                        new_news = news_service.search_more(
                             query,
-                            display=count * 2,  # 중복 제거를 고려해 더 많이 가져옴
+                            st.session_state['deduplicator'],
                             start=start_pos,
+                            display=count * 2,  # 중복 제거를 고려해 더 많이 가져옴
                             sort=sort
                         )
-                        items = result.get('items', [])
-
-                        if items:
-                            from src.utils.formatter import format_news_list
-                            formatted_items = format_news_list(items)
-
-                            # 중복 제거
-                            from src.utils.deduplicator import NewsDeduplicator
-                            deduplicator = NewsDeduplicator()
-
-                            # 기존 뉴스와 새 뉴스를 합쳐서 중복 제거
-                            combined_news = st.session_state['news_list'] + formatted_items
-                            unique_news = deduplicator.remove_duplicates(combined_news, 0.7)
-
-                            # 새로 추가된 뉴스만 추출
-                            new_news_count = len(unique_news) - len(st.session_state['news_list'])
-
-                            if new_news_count > 0:
-                                summary_service = SummaryService()
-                                news_with_summary = summary_service.create_summary_list(unique_news)
-
-                                # 누적해서 저장
-                                st.session_state['news_list'] = news_with_summary
-                                st.session_state['page'] += 1
-                                st.session_state['auto_summarize'] = True
-                                st.rerun()
-                            else:
-                                st.info("중복 제거 후 새로운 뉴스가 없습니다.")
-                        else:
+
+                        if new_news is None:
                             st.info("더 이상 검색 결과가 없습니다.")
+                        elif new_news:
+                            summary_service = services.summary_service()
+
+                            # 기존 목록 뒤에 누적 (기존 AI 요약 인덱스 유지)
+                            st.session_state['news_list'] = (
+                                st.session_state['news_list'] +
+                                summary_service.create_summary_list(new_news)
+                            )
+                            st.session_state['page'] += 1
+                            st.session_state['auto_summarize'] = True
+                            st.rerun()
+                        else:
+                            st.info("중복 제거 후 새로운 뉴스가 없습니다.")
                     except Exception as e:
                         st.error(f"오류가 발생했습니다: {str(e)}")
 
+        # 진행 중인 작업이 있으면 잠시 후 다시 그려 완료된 요약을 표시
+        if running:
+            time.sleep(SUMMARY_POLL_INTERVAL)
+            st.rerun()
+
     else:
         # 초기 화면
         st.info("👈 왼쪽 사이드바에서 검색 키워드를 입력하고 검색 버튼을 클릭하세요.")
@@ -0,0 +1,60 @@
+"""테스트 공용 픽스처"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Tuple, Union
+import pytest
+from src.utils.crawler import NewsCrawler
+
+# 경로별 응답: (상태 코드, 헤더, 본문) 또는 요청 헤더를 받아 응답을 만드는 함수
+Route = Union[Tuple[int, Dict[str, str], bytes], Callable[[Dict[str, str]], Tuple[int, Dict[str, str], bytes]]]
+
+
+class LocalServer:
+    """테스트용 로컬 HTTP 서버 (routes에 경로별 응답 등록)"""
+
+    def __init__(self):
+        self.routes: Dict[str, Route] = {}
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                headers = dict(self.headers.items())
+                server.requests.append((self.path, headers))
+                route = server.routes.get(self.path, (404, {}, b''))
+                status, response_headers, body = route(headers) if callable(route) else route
+                self.send_response(status)
+                for name, value in response_headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def url(self, path: str) -> str:
+        """경로의 전체 URL"""
+        return f'http://127.0.0.1:{self.httpd.server_port}{path}'
+
+
+@pytest.fixture
+def http_server():
+    """로컬 HTTP 서버"""
+    server = LocalServer()
+    server.thread.start()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+
+
+@pytest.fixture
+def crawler(monkeypatch):
+    """디스크 캐시와 추출 프로세스 풀 없이 현재 스레드에서 추출하는 크롤러 설정"""
+    monkeypatch.setattr('src.utils.crawler.ARTICLE_CACHE_ENABLED', False)
+    monkeypatch.setattr(NewsCrawler, 'EXTRACT_WORKERS', 0)
+    return NewsCrawler
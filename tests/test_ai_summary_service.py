@@ -0,0 +1,69 @@
+"""AI 요약 서비스 배치 모드 테스트"""
+import time
+import pytest
+from src.services import ai_summary_service
+from src.services.ai_summary_service import AISummaryService
+
+CONTENT = '짧은 기사 본문입니다. ' * 20
+
+
+class FakeOpenAIClient:
+    """요청 시각을 기록하는 가짜 OpenAI 클라이언트"""
+
+    model = 'fake-model'
+
+    def __init__(self):
+        self.batch_calls = []
+
+    def summarize_batch(self, texts):
+        self.batch_calls.append((time.monotonic(), len(texts)))
+        return [{'summary': '요약', 'key_points': ['포인트']} for _ in texts]
+
+    def summarize_with_key_points(self, text):
+        return {'summary': '요약', 'key_points': ['포인트']}
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(ai_summary_service, 'OpenAIClient', FakeOpenAIClient)
+    monkeypatch.setattr(AISummaryService, 'get_summary_cache', staticmethod(lambda: None))
+    return AISummaryService(batch_tokens=6000, batch_wait=0.2)
+
+
+def test_batch_flushes_before_slow_crawl_finishes(service, monkeypatch):
+    """빠른 크롤링으로 모인 배치는 느린 크롤링을 기다리지 않고 요청"""
+    finished_at = {}
+
+    def fake_crawl(urls):
+        url = urls[0]
+        time.sleep(1.5 if url == 'slow' else 0.05)
+        finished_at[url] = time.monotonic()
+        return {'url': url, 'content': CONTENT, 'success': True, 'word_count': len(CONTENT)}, None
+
+    monkeypatch.setattr(service, '_crawl_sources', fake_crawl)
+
+    results = service.summarize_many(['fast-1', 'fast-2', 'slow'], max_workers=3)
+
+    assert all(result['success'] for result in results)
+    first_call, first_size = service.ai_client.batch_calls[0]
+    assert first_size == 2
+    assert first_call < finished_at['slow']
+
+
+def test_full_batch_flushes_immediately(service, monkeypatch):
+    """최대 기사 수가 찬 배치는 대기 시간 없이 바로 요청"""
+    service.max_batch_size = 2
+    service.batch_wait = 10.0
+    started = time.monotonic()
+
+    def fake_crawl(urls):
+        time.sleep(1.0 if urls[0] == 'slow' else 0.01)
+        return {'url': urls[0], 'content': CONTENT, 'success': True, 'word_count': len(CONTENT)}, None
+
+    monkeypatch.setattr(service, '_crawl_sources', fake_crawl)
+
+    service.summarize_many(['fast-1', 'fast-2', 'slow'], max_workers=3)
+
+    first_call, first_size = service.ai_client.batch_calls[0]
+    assert first_size == 2
+    assert first_call - started < 0.5
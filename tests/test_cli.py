@@ -0,0 +1,49 @@
+"""일괄 처리 CLI 테스트"""
+import json
+from src import cli
+from src.api.naver_news_api import NaverNewsAPI
+from src.utils import config
+
+ARTICLE_HTML = (
+    '<html><head><meta charset="utf-8"></head><body>'
+    '<article class="article-body">' + '<p>로컬 테스트 서버에서 내려준 기사 본문 문장입니다.</p>' * 10 +
+    '</article></body></html>'
+).encode('utf-8')
+
+TITLES = ['반도체 수출 석 달 연속 증가', '프로야구 개막전 만원 관중', '수도권 폭설로 출근길 정체']
+
+
+def test_stdout_is_jsonl(http_server, crawler, monkeypatch, tmp_path, capsys):
+    """표준 출력의 모든 줄이 JSON 레코드 (크롤링 로그나 다른 코드의 print가 섞이지 않음)"""
+    for index in range(3):
+        http_server.routes[f'/article/{index}'] = (200, {'Content-Type': 'text/html'}, ARTICLE_HTML)
+
+    def fake_request(self, params):
+        print('stray print from a dependency')
+        items = [
+            {
+                'title': TITLES[index],
+                'originallink': http_server.url(f'/article/{index}'),
+                'link': http_server.url(f'/article/{index}'),
+                'description': TITLES[index] * 2,
+                'pubDate': f'Mon, 13 Oct 2025 0{index}:00:00 +0900'
+            }
+            for index in range(3)
+        ]
+        return {'items': items if params['start'] == 1 else []}
+
+    monkeypatch.setattr(config, 'NAVER_CLIENT_ID', 'test-id')
+    monkeypatch.setattr(config, 'NAVER_CLIENT_SECRET', 'test-secret')
+    monkeypatch.setattr(NaverNewsAPI, '_request', fake_request)
+    monkeypatch.setattr(NaverNewsAPI, 'remaining_quota', staticmethod(lambda: None))
+    NaverNewsAPI.response_cache.clear()
+
+    queries = tmp_path / 'queries.txt'
+    queries.write_text('테스트\n', encoding='utf-8')
+
+    assert cli.main([str(queries), '--count', '3', '--crawl', '--prefetch-pages', '1']) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    records = [json.loads(line) for line in lines]
+    assert len(records) == 3
+    assert all(record['crawl_success'] for record in records)
@@ -0,0 +1,56 @@
+"""기사 크롤링 테스트 (로컬 HTTP 서버 사용)"""
+import requests
+from src.utils.article_cache import ArticleCache
+
+SENTENCE = '로컬 테스트 서버에서 내려준 기사 본문 문장입니다.'
+
+
+def article_html(charset: str) -> bytes:
+    """<meta charset>만으로 인코딩을 선언한 기사 HTML"""
+    return (
+        '<html><head><title>local test article page</title>'
+        f'<meta name="viewport" content="width=device-width"><meta charset="{charset}"></head><body>'
+        '<article class="article-body">' + f'<p>{SENTENCE}</p>' * 10 +
+        '</article></body></html>'
+    ).encode(charset)
+
+
+def test_download_stops_at_byte_cap(http_server, crawler, monkeypatch):
+    http_server.routes['/large'] = (200, {'Content-Type': 'text/html'}, b'a' * 300 * 1024)
+    monkeypatch.setattr(crawler, 'MAX_DOWNLOAD_BYTES', 1000)
+
+    with requests.get(http_server.url('/large'), stream=True) as response:
+        content = crawler._read_content(response, http_server.url('/large'))
+
+    assert content == b'a' * 1000
+
+
+def test_meta_charset_only_page_is_decoded(http_server, crawler, monkeypatch):
+    """Content-Type에 charset이 없으면 <meta charset> 선언으로 디코딩"""
+    http_server.routes['/euc-kr'] = (200, {'Content-Type': 'text/html'}, article_html('euc-kr'))
+    # 인코딩 감지는 meta 선언 앞의 ASCII 부분만 보게 해서 meta 선언을 읽지 않으면 디코딩이 깨지도록 함
+    monkeypatch.setattr(crawler, 'CHARSET_DETECT_BYTES', 64)
+
+    content = crawler.fetch_article_content(http_server.url('/euc-kr'))
+
+    assert content is not None
+    assert SENTENCE in content
+    assert '�' not in content
+
+
+def test_stale_cache_is_revalidated_with_etag(http_server, crawler, monkeypatch, tmp_path):
+    """ETag가 일치해 304를 받으면 다시 다운로드하지 않고 캐시된 본문 반환"""
+    url = http_server.url('/cached')
+    cache = ArticleCache(str(tmp_path / 'articles.sqlite3'), ttl=0)
+    cache.put(url, 'cached article text', etag='"v1"')
+    monkeypatch.setattr(crawler, 'get_cache', staticmethod(lambda: cache))
+
+    def respond(headers):
+        if headers.get('If-None-Match') == '"v1"':
+            return 304, {'ETag': '"v1"'}, b''
+        return 200, {'Content-Type': 'text/html; charset=utf-8'}, article_html('utf-8')
+
+    http_server.routes['/cached'] = respond
+
+    assert crawler.fetch_article_content(url) == 'cached article text'
+    assert [path for path, _ in http_server.requests] == ['/cached']
@@ -0,0 +1,92 @@
+"""중복 제거 테스트"""
+import random
+import pytest
+from benchmarks.corpus import make_news_corpus
+from src.utils.deduplicator import NewsDeduplicator, IncrementalDeduplicator
+from src.utils.news_item import NewsItem
+
+DATES = [f'Mon, 13 Oct 2025 {hour:02d}:00:00 +0900' for hour in (9, 10, 11)]
+
+
+def _block(rng: random.Random) -> str:
+    return ''.join(rng.choice('가나다라마바사아자차카타파하') for _ in range(10))
+
+
+def _chain_news():
+    """
+    제목이 이웃한 항목끼리만 유사한 뉴스 4건 (R~S, S~X, X~Y, 블록 4개 중 3개 공유)
+
+    발행일은 R > S > X = Y 순서로, X와 Y는 발행일이 같습니다.
+    """
+    rng = random.Random(3)
+    blocks = [_block(rng) for _ in range(7)]
+    names = ['R', 'S', 'X', 'Y']
+    hours = {'R': 12, 'S': 11, 'X': 10, 'Y': 10}
+    return {
+        name: NewsItem(
+            title=' '.join(blocks[index:index + 4]),
+            description=f'{name} {_block(rng)} {_block(rng)} {_block(rng)}',
+            link=f'https://example.com/{name}',
+            pubDate=f'Mon, 13 Oct 2025 {hours[name]}:00:00 +0900'
+        )
+        for index, name in enumerate(names)
+    }
+
+
+@pytest.mark.parametrize('engine', NewsDeduplicator.ENGINES)
+def test_revived_item_wins_tie_by_arrival_order(engine):
+    """가려졌다가 다시 평가되는 항목도 발행일이 같으면 먼저 들어온 순서로 비교"""
+    news = _chain_news()
+    batches = [[news['S'], news['X']], [news['Y']], [news['R']]]
+
+    deduplicator = IncrementalDeduplicator(0.7, engine)
+    for batch in batches:
+        deduplicator.add_batch(batch)
+
+    expected = NewsDeduplicator.remove_duplicates([item for batch in batches for item in batch], 0.7)
+    assert [item['link'] for item in expected] == ['https://example.com/R', 'https://example.com/X']
+    assert deduplicator.unique_news == expected
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_incremental_matches_remove_duplicates_with_tied_dates(seed):
+    """발행일이 겹치는 뉴스를 임의 크기의 배치로 나눠 추가해도 remove_duplicates와 같은 결과"""
+    rng = random.Random(seed)
+    news_list = make_news_corpus(60, duplicate_rate=0.6, seed=seed)
+    for news in news_list:
+        news['pubDate'] = rng.choice(DATES)
+
+    deduplicator = IncrementalDeduplicator(0.7)
+    start = 0
+    while start < len(news_list):
+        size = rng.randint(1, 8)
+        deduplicator.add_batch(news_list[start:start + size])
+        start += size
+
+    assert deduplicator.unique_news == NewsDeduplicator.remove_duplicates(news_list, 0.7)
+
+
+@pytest.mark.parametrize('engine', NewsDeduplicator.ENGINES)
+def test_member_similarity_matches_similarity_score(engine):
+    """묶음 멤버의 유사도는 제목/설명 유사도 중 큰 값 (similarity_score와 같음)"""
+    rng = random.Random(5)
+    blocks = [_block(rng) for _ in range(6)]
+    description = ' '.join(blocks[:5])
+    newer = NewsItem(
+        title=' '.join(blocks[:4]), description=description,
+        link='https://example.com/newer', pubDate=DATES[1]
+    )
+    older = NewsItem(
+        title=' '.join(blocks[1:5]), description=description + '.',
+        link='https://example.com/older', pubDate=DATES[0]
+    )
+
+    deduplicator = IncrementalDeduplicator(0.7, engine)
+    deduplicator.add_batch([older])
+    deduplicator.add_batch([newer])
+
+    [cluster] = deduplicator.clusters
+    [member] = cluster['members']
+    assert member['news'] is older
+    assert member['similarity'] == NewsDeduplicator.similarity_score(older, newer)
+    assert member['similarity'] > 0.9
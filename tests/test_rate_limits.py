@@ -0,0 +1,68 @@
+"""API 호출 한도 정산 테스트"""
+from types import SimpleNamespace
+import pytest
+from src.api import naver_news_api
+from src.api.naver_news_api import NaverNewsAPI
+from src.api.openai_api import OpenAIClient
+from src.utils import config
+from src.utils.rate_limiter import Bucket, RateLimiter
+
+TPM = 10000
+
+
+@pytest.fixture
+def limiter(tmp_path, monkeypatch):
+    """임시 파일을 쓰는 공유 속도 제한기 (충전 속도 0으로 잔량 변화만 확인)"""
+    limiter = RateLimiter(str(tmp_path / 'limits.sqlite3'), buckets={
+        'naver': Bucket(1000, 1000, 100),
+        'openai_requests': Bucket(0, 100),
+        'openai_tokens': Bucket(0, TPM),
+    })
+    monkeypatch.setattr(RateLimiter, 'get_instance', staticmethod(lambda: limiter))
+    return limiter
+
+
+def _tokens(limiter: RateLimiter, name: str) -> float:
+    return limiter._conn.execute("SELECT tokens FROM buckets WHERE name = ?", (name,)).fetchone()[0]
+
+
+def _client(response) -> OpenAIClient:
+    client = OpenAIClient.__new__(OpenAIClient)
+    client.model = 'test'
+    client.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **kwargs: response)))
+    return client
+
+
+def test_complete_charges_actual_usage_above_reservation(limiter):
+    usage = SimpleNamespace(prompt_tokens=900, completion_tokens=300, total_tokens=1200)
+    client = _client(SimpleNamespace(usage=usage))
+
+    client._complete('test', model='test', messages=[{'role': 'user', 'content': 'hi'}], max_tokens=100)
+
+    assert _tokens(limiter, 'openai_tokens') == pytest.approx(TPM - 1200)
+
+
+def test_complete_returns_reservation_without_usage(limiter):
+    client = _client(SimpleNamespace(usage=None))
+
+    client._complete('test', model='test', messages=[{'role': 'user', 'content': 'hi'}], max_tokens=100)
+
+    assert _tokens(limiter, 'openai_tokens') == pytest.approx(TPM)
+
+
+def test_naver_server_errors_are_retried_through_limiter(http_server, limiter, monkeypatch):
+    responses = iter([
+        (503, {}, b''),
+        (200, {'Content-Type': 'application/json'}, b'{"items": []}'),
+    ])
+    http_server.routes['/news?query=q&display=10&start=1&sort=date'] = lambda headers: next(responses)
+    monkeypatch.setattr(NaverNewsAPI, 'BASE_URL', http_server.url('/news'))
+    monkeypatch.setattr(naver_news_api.time, 'sleep', lambda seconds: None)
+    monkeypatch.setattr(config, 'NAVER_CLIENT_ID', 'id')
+    monkeypatch.setattr(config, 'NAVER_CLIENT_SECRET', 'secret')
+
+    result = NaverNewsAPI().search_news('q', use_cache=False)
+
+    assert result == {'items': []}
+    assert len(http_server.requests) == 2
+    assert limiter.remaining_quota('naver') == 98
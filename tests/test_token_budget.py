@@ -0,0 +1,38 @@
+"""토큰 예산 유틸리티 테스트"""
+from src.utils.token_budget import estimate_tokens, trim_to_budget, split_into_chunks
+
+LONG_SENTENCE = '가나다라마바사아자차' * 1000
+
+
+def test_trim_fills_budget_with_overflowing_line():
+    """예산을 넘는 줄도 남은 예산만큼 잘라서 포함"""
+    text = '서울=연합뉴스 홍길동 기자 입력\n' + LONG_SENTENCE
+    trimmed = trim_to_budget(text, 3000)
+
+    assert trimmed.startswith('서울=연합뉴스')
+    assert 2990 <= estimate_tokens(trimmed) <= 3000
+
+
+def test_trim_cuts_first_sentence():
+    """첫 문장부터 예산을 넘으면 글자 단위로 자름"""
+    trimmed = trim_to_budget(LONG_SENTENCE, 500)
+
+    assert trimmed == LONG_SENTENCE[:500]
+
+
+def test_chunks_respect_budget_for_oversized_sentence():
+    """조각 예산보다 긴 문장은 예산 이내 조각으로 나눔"""
+    chunks = split_into_chunks(LONG_SENTENCE, 2500)
+
+    assert len(chunks) == 4
+    assert all(estimate_tokens(chunk) <= 2500 for chunk in chunks)
+    assert ''.join(chunks) == LONG_SENTENCE
+
+
+def test_chunks_keep_line_boundaries():
+    """짧은 줄은 나누지 않고 예산 안에서 묶음"""
+    text = '\n'.join(f'{index}번째 문단입니다.' for index in range(100))
+    chunks = split_into_chunks(text, 200)
+
+    assert all(estimate_tokens(chunk) <= 200 for chunk in chunks)
+    assert '\n'.join(chunks) == text